@@ -0,0 +1,326 @@
+"""
+Benchmarks of the Table Viewer data paths.
+
+Generates deterministic datasets at several scales and formats, times the operations the Table Viewer runs on them
+through the headless engine (see `plugins.table_viewer.engine`), and writes the timings to a JSON file that can be
+compared with the results of an earlier run:
+
+    python -m benchmarks.table_viewer --scales 1m 10m --shapes narrow wide
+    python -m benchmarks.table_viewer --compare benchmarks/results/20261019-120000.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import duckdb
+
+from plugins.table_viewer.cli import CONFIG_PATH, load_settings
+from plugins.table_viewer.engine import Dataset, Session
+from plugins.table_viewer.profile import PROFILE_CHUNK_ROWS
+from plugins.test_file.dnb_faker import DnBFaker
+
+SCALES = {"1m": 1_000_000, "10m": 10_000_000, "100m": 100_000_000}
+SHAPES = {"narrow": 9, "wide": 1000}
+FORMATS = (".parquet", ".csv", ".ndjson")
+POOL_SIZE = 10000
+SEED = 42
+PAGE_ROWS = 1000
+REGRESSION_THRESHOLD = 1.2
+RESULTS_DIR = Path(__file__).parent / "results"
+POOL_TABLE = "benchmark_pool"
+
+
+def value_pool(size: int = POOL_SIZE, seed: int = SEED) -> Dict[str, list]:
+    """
+    Generate the realistic values the benchmark datasets are built from.
+
+    Faker generates a few thousand values per second, far too slow to generate millions of rows, so a fixed pool of
+    companies is generated once and every row of a dataset picks one of them by the hash of its row number.
+
+    Args:
+        size (int): The number of companies in the pool.
+        seed (int): The seed of the generator, so every run generates the same pool.
+
+    Returns:
+        dict: The lists of values in the pool, keyed by column.
+    """
+    faker = DnBFaker()
+    faker.seed_instance(seed)
+    pool = {"duns": [], "company": [], "city": [], "country": [], "email": [], "founded": []}
+    for _ in range(size):
+        pool["duns"].append(faker.duns_number())
+        pool["company"].append(faker.company())
+        pool["city"].append(faker.city())
+        pool["country"].append(faker.country_code())
+        pool["email"].append(faker.email())
+        pool["founded"].append(faker.date_between("-50y", "today").isoformat())
+    return pool
+
+
+def register_pool(connection: duckdb.DuckDBPyConnection, pool: Dict[str, list]) -> None:
+    """
+    Store the value pool on a connection as a single row of lists, which the generation query indexes into.
+    """
+    connection.execute(
+        f"CREATE OR REPLACE TEMP TABLE {POOL_TABLE} AS SELECT ?::BIGINT[] AS duns, ?::VARCHAR[] AS company, "
+        f"?::VARCHAR[] AS city, ?::VARCHAR[] AS country, ?::VARCHAR[] AS email, ?::DATE[] AS founded",
+        [pool["duns"], pool["company"], pool["city"], pool["country"], pool["email"], pool["founded"]]
+    )
+
+
+def generation_query(rows: int, columns: int, pool_size: int) -> str:
+    """
+    Build the query generating a benchmark dataset.
+
+    The first columns are a company from the value pool, with a revenue and a flag; every tenth email is empty, so the
+    empty searches have rows to find. Wide datasets are padded with integer, decimal and text columns up to the number
+    of columns. Every value is derived from the hash of the row number, so the same query always gives the same rows.
+
+    Args:
+        rows (int): The number of rows.
+        columns (int): The number of columns, at least `SHAPES["narrow"]`.
+        pool_size (int): The number of companies in the value pool.
+
+    Returns:
+        str: The query.
+    """
+    index = f"(h % {pool_size} + 1)::BIGINT"
+    expressions = [
+        "range AS id",
+        f"{POOL_TABLE}.duns[{index}] AS duns",
+        f"{POOL_TABLE}.company[{index}] AS company",
+        f"{POOL_TABLE}.city[{index}] AS city",
+        f"{POOL_TABLE}.country[{index}] AS country",
+        f"CASE WHEN h % 10 = 0 THEN '' ELSE {POOL_TABLE}.email[{index}] END AS email",
+        f"{POOL_TABLE}.founded[{index}] AS founded",
+        "(hash(range, 1) % 100000000) / 100.0 AS revenue",
+        "hash(range, 2) % 2 = 0 AS out_of_business",
+    ]
+    for column in range(len(expressions), columns):
+        value = f"hash(range, {column})"
+        if column % 3 == 0:
+            expressions.append(f"({value} % 100000)::BIGINT AS c{column:04d}")
+        elif column % 3 == 1:
+            expressions.append(f"({value} % 1000000) / 100.0 AS c{column:04d}")
+        else:
+            expressions.append(f"{POOL_TABLE}.city[({value} % {pool_size} + 1)::BIGINT] AS c{column:04d}")
+    return (
+        f"SELECT {', '.join(expressions)} FROM (SELECT range, hash(range) AS h FROM range({rows})), {POOL_TABLE}"
+    )
+
+
+def generate_dataset(session: Session, path: str, rows: int, columns: int, pool_size: int) -> int:
+    """
+    Write a benchmark dataset, unless it exists already. The value pool must be registered on the session.
+
+    The file is written under a temporary name and renamed when it is complete, so an interrupted run never leaves a
+    partial dataset behind to be benchmarked by the next run.
+
+    Returns:
+        int: The number of rows written, or 0 if the dataset existed already.
+    """
+    if Path(path).exists():
+        return 0
+    partial = Path(path).with_name(f".partial-{Path(path).name}")
+    written = Dataset.from_query(session.connection, generation_query(rows, columns, pool_size)).export(str(partial))
+    os.replace(partial, path)
+    return written
+
+
+def search_specs(pool: Dict[str, list]) -> Dict[str, tuple]:
+    """
+    Get the column and the value searched for with each search style, taken from the value pool.
+    """
+    company = pool["company"][0]
+    return {
+        "Exact": ("duns", str(pool["duns"][0])),
+        "Contains": ("company", company[1:-1]),
+        "Starts With": ("company", company.split()[0]),
+        "Ends With": ("company", company[-3:]),
+        "Is Empty": ("email", ""),
+        "Is not Empty": ("email", ""),
+    }
+
+
+def measure(operation: Callable[[], object], repeat: int) -> Dict[str, object]:
+    """
+    Time an operation.
+
+    Returns:
+        dict: The wall time of every run in seconds, the best and the median run.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        runs.append(time.perf_counter() - start)
+    return {"seconds": runs, "best": min(runs), "median": statistics.median(runs)}
+
+
+def benchmark_dataset(session: Session, path: str, searches: Dict[str, tuple], repeat: int = 3,
+                      chunk_rows: int = PROFILE_CHUNK_ROWS, export_suffix: str = ".parquet",
+                      on_result: Callable[[dict], None] = None) -> List[dict]:
+    """
+    Time the operations of the Table Viewer on a dataset.
+
+    Every run works on a fresh dataset, so no run reuses a row count or a result cached by the previous run. The
+    DuckDB object cache of the session stays warm, as it does while the Table Viewer is open.
+
+    Args:
+        session (Session): The session to read the dataset through.
+        path (str): The path of the dataset.
+        searches (dict): The column and value searched for with each search style, see `search_specs`.
+        repeat (int): The number of runs of each operation.
+        chunk_rows (int): The number of rows profiled by the first pass of the profile.
+        export_suffix (str): The format the dataset is exported to, one of the keys in `engine.EXPORT_FORMATS`.
+        on_result (Callable): Called with every result as soon as it is measured.
+
+    Returns:
+        list: The results, one per operation.
+    """
+    dataset = session.open(path)
+    rows = dataset.row_count()
+    export_path = Path(path).with_name(f".export-{Path(path).stem}{export_suffix}")
+
+    def fresh() -> Dataset:
+        return Dataset(session.connection, dataset.relation, path)
+
+    operations = {
+        "open": lambda: session.open(path).columns,
+        "count": lambda: fresh().row_count(),
+        "first page": lambda: fresh().page(0, PAGE_ROWS),
+        "deep page": lambda: fresh().page(max(rows - PAGE_ROWS, 0), PAGE_ROWS),
+        **{
+            f"search {style}": lambda column=column, value=value, style=style:
+                fresh().search(column, value, style).row_count()
+            for style, (column, value) in searches.items()
+        },
+        "profile": lambda: fresh().profile(chunk_rows=chunk_rows),
+        f"export {export_suffix[1:]}": lambda: fresh().export(str(export_path)),
+    }
+
+    results = []
+    try:
+        for operation, run in operations.items():
+            result = {
+                "dataset": Path(path).name, "rows": rows, "columns": len(dataset.columns), "operation": operation,
+                **measure(run, repeat)
+            }
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    finally:
+        export_path.unlink(missing_ok=True)
+    return results
+
+
+def compare(previous: Sequence[dict], current: Sequence[dict],
+            threshold: float = REGRESSION_THRESHOLD) -> List[Dict[str, object]]:
+    """
+    Find the operations that got slower between two runs.
+
+    Args:
+        previous (Sequence[dict]): The results of the earlier run.
+        current (Sequence[dict]): The results of the later run.
+        threshold (float): How many times slower the best run of an operation has to be to count as a regression.
+
+    Returns:
+        list: The dataset, operation, best times and ratio of every regression, slowest ratio first. Operations that
+            are not in both runs are left out.
+    """
+    before = {(result["dataset"], result["operation"]): result["best"] for result in previous}
+    regressions = []
+    for result in current:
+        key = (result["dataset"], result["operation"])
+        if key in before and before[key] > 0 and result["best"] / before[key] > threshold:
+            regressions.append({
+                "dataset": key[0], "operation": key[1], "previous": before[key], "current": result["best"],
+                "ratio": result["best"] / before[key],
+            })
+    return sorted(regressions, key=lambda regression: regression["ratio"], reverse=True)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.table_viewer", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=["1m"], help="Row counts to benchmark")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=["narrow", "wide"],
+                        help="Narrow datasets, or wide datasets of 1000 columns")
+    parser.add_argument("--formats", nargs="+", choices=[suffix[1:] for suffix in FORMATS],
+                        default=[suffix[1:] for suffix in FORMATS], help="File formats to benchmark")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each operation")
+    parser.add_argument("--seed", type=int, default=SEED, help="Seed of the generated values")
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "table_viewer_benchmark"),
+                        help="Directory the generated datasets are kept in between runs")
+    parser.add_argument("--output", default=None, help="File to write the results to (default: a new file in "
+                                                       "benchmarks/results)")
+    parser.add_argument("--compare", default=None, help="Results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="Slowdown ratio reported as a regression")
+    parser.add_argument("--config", default=str(CONFIG_PATH), help="Table Viewer config file")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Generate the datasets, run the benchmarks and write the results.
+
+    Returns:
+        int: The exit status: 1 if an operation regressed compared to the `--compare` results, 0 otherwise.
+    """
+    args = build_parser().parse_args(argv)
+    settings = load_settings(args.config)
+    session = Session(settings)
+    Path(args.data_dir).mkdir(parents=True, exist_ok=True)
+
+    pool = value_pool(POOL_SIZE, args.seed)
+    register_pool(session.connection, pool)
+    searches = search_specs(pool)
+
+    results = []
+    for scale in args.scales:
+        for shape in args.shapes:
+            for file_format in args.formats:
+                path = os.path.join(args.data_dir, f"{shape}-{scale}-seed{args.seed}.{file_format}")
+                print(f"Generating {path}", file=sys.stderr)
+                generate_dataset(session, path, SCALES[scale], SHAPES[shape], POOL_SIZE)
+                results += benchmark_dataset(
+                    session, path, searches, args.repeat, settings.get("profile_chunk_rows", PROFILE_CHUNK_ROWS),
+                    on_result=lambda result: print(
+                        f"{result['dataset']:<32} {result['operation']:<22} {result['best']:10.4f}s", file=sys.stderr
+                    )
+                )
+
+    output = Path(args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "duckdb": duckdb.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "settings": settings,
+        "results": results,
+    }, indent=2, default=str))
+    print(f"Results written to {output}", file=sys.stderr)
+
+    if args.compare is None:
+        return 0
+    regressions = compare(json.loads(Path(args.compare).read_text())["results"], results, args.threshold)
+    for regression in regressions:
+        print(
+            f"Regression: {regression['dataset']} {regression['operation']} {regression['previous']:.4f}s -> "
+            f"{regression['current']:.4f}s ({regression['ratio']:.2f}x)", file=sys.stderr
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,13 @@
 import logging
+import sys
 logging.basicConfig(level=logging.WARNING)
 
-from src.engine import create_app
-
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Batch commands run headless, so the application and its windows are never created
+        from plugins.table_viewer.cli import main
+        sys.exit(main(sys.argv[1:]))
+
+    from src.engine import create_app
     app = create_app()
     app.MainLoop()
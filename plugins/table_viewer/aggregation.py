@@ -0,0 +1,77 @@
+from typing import Sequence, Tuple
+
+from .helpers import quote_identifier
+
+MEASURES = ("count", "sum", "avg", "distinct")
+MAX_GROUPS = 10000
+
+
+def measure_expression(measure: str, column: str = None) -> str:
+    """
+    Build the aggregate of a measure.
+
+    Args:
+        measure (str): The measure, one of `MEASURES`.
+        column (str): The column to aggregate, or None to count rows.
+
+    Returns:
+        str: The aggregate expression.
+    """
+    if measure == "count":
+        return f"COUNT({quote_identifier(column)})" if column else "COUNT(*)"
+    if measure == "sum":
+        return f"SUM({quote_identifier(column)})"
+    if measure == "avg":
+        return f"AVG({quote_identifier(column)})"
+    if measure == "distinct":
+        return f"COUNT(DISTINCT {quote_identifier(column)})"
+    raise ValueError(f"Unknown measure: {measure}")
+
+
+def measure_name(measure: str, column: str = None) -> str:
+    """
+    Name the result column of a measure.
+    """
+    return f"{measure}({column or '*'})"
+
+
+def aggregation_query(query: str, group_columns: Sequence[str], measures: Sequence[Tuple[str, str]],
+                      pivot_column: str = None) -> str:
+    """
+    Build the query summarizing a relation by a set of group columns.
+
+    The groups are calculated by DuckDB's parallel hash aggregate. The values of the group columns select the rows of
+    a group when drilling into it (see `duplicates.member_predicate`).
+
+    With a pivot column, every distinct value of the pivot column becomes a set of columns holding the measures of the
+    rows with that value, so the result has one row per group of the other group columns. Only the columns the pivot
+    needs are read, as the pivot groups by every column it is given besides the pivot column and the measures.
+
+    Args:
+        query (str): The query for the relation to summarize.
+        group_columns (Sequence[str]): The columns to group by.
+        measures (Sequence[tuple]): The measure and column of each aggregate, with None as column to count rows.
+        pivot_column (str): The column to pivot on, or None for a plain group by.
+
+    Returns:
+        str: The query, with the group columns first and then the measures, largest groups first when the first measure
+            is a count.
+    """
+    groups = ", ".join(quote_identifier(column) for column in group_columns)
+    aggregates = ", ".join(
+        f"{measure_expression(measure, column)} AS {quote_identifier(measure_name(measure, column))}"
+        for measure, column in measures
+    )
+
+    if pivot_column is not None:
+        needed = dict.fromkeys([pivot_column, *group_columns, *(column for _, column in measures if column)])
+        group_by = f" GROUP BY {groups}" if group_columns else ""
+        return (
+            f"PIVOT (SELECT {', '.join(quote_identifier(column) for column in needed)} FROM ({query})) "
+            f"ON {quote_identifier(pivot_column)} USING {aggregates}{group_by}"
+        )
+
+    select = f"{groups + ', ' if group_columns else ''}{aggregates}"
+    group_by = " GROUP BY ALL" if group_columns else ""
+    order = f" ORDER BY {len(group_columns) + 1} DESC" if measures and measures[0][0] == "count" else ""
+    return f"SELECT {select} FROM ({query}){group_by}{order}"
@@ -0,0 +1,238 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Hashable, List, Tuple
+
+import duckdb
+import wx
+import wx.grid
+
+from .aggregation import MAX_GROUPS, MEASURES, aggregation_query, measure_name
+from .components.button import PVButton
+from .components.mixins import SetFontMixin
+from .helpers import status_message
+from .ndjson import fingerprint
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+NO_COLUMN = "(rows)"
+NO_PIVOT = "(none)"
+
+
+class AggregationFrame(SetFontMixin, wx.Frame):
+    """
+    The aggregation view of the Table Viewer.
+
+    The user picks the columns to group by, the measures to calculate and optionally a column to pivot on. The summary
+    is calculated by DuckDB in the background and cached by the plugin per view, summary and file fingerprint, so
+    asking for the same summary again is instant. Double-clicking a group shows its rows in the grid.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __view (str): The view the summary is calculated for.
+        __groups (list): The group columns of the summary shown.
+        __keys (list): The values of the group columns of each row shown.
+        __measures (list): The measure and column of each aggregate to calculate.
+        group_list (wx.CheckListBox): The columns to group by.
+        measure_choice (wx.Choice): The measure to add.
+        column_choice (wx.Choice): The column of the measure to add.
+        measure_list (wx.ListBox): The measures to calculate.
+        pivot_choice (wx.Choice): The column to pivot on.
+        summary_label (wx.StaticText): The number of groups.
+        result_grid (wx.grid.Grid): The summary.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the Aggregation Frame.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title=f"Aggregate - {tv.view}", size=(900, 600))
+        self.__plugin = tv
+        self.__view = tv.view
+        self.__groups = []
+        self.__keys = []
+        self.__measures = [("count", None)]
+        self.set_font()
+
+        columns = list(tv.grid.df.columns)
+        panel = wx.Panel(self)
+        panel.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+
+        controls = wx.Panel(panel)
+        controls.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        controls.GetSizer().Add(wx.StaticText(controls, label="Group by"), 0, wx.ALL, 5)
+        self.group_list = wx.CheckListBox(controls, choices=columns)
+        controls.GetSizer().Add(self.group_list, 1, wx.EXPAND | wx.ALL, 5)
+
+        controls.GetSizer().Add(wx.StaticText(controls, label="Measures"), 0, wx.ALL, 5)
+        self.measure_choice = wx.Choice(controls, choices=list(MEASURES))
+        self.measure_choice.SetSelection(0)
+        controls.GetSizer().Add(self.measure_choice, 0, wx.EXPAND | wx.ALL, 5)
+        self.column_choice = wx.Choice(controls, choices=[NO_COLUMN] + columns)
+        self.column_choice.SetSelection(0)
+        controls.GetSizer().Add(self.column_choice, 0, wx.EXPAND | wx.ALL, 5)
+        PVButton(controls, "Add Measure", self.on_add_measure)
+        self.measure_list = wx.ListBox(controls, choices=[measure_name(*measure) for measure in self.__measures])
+        self.measure_list.Bind(wx.EVT_LISTBOX_DCLICK, self.on_remove_measure)
+        controls.GetSizer().Add(self.measure_list, 1, wx.EXPAND | wx.ALL, 5)
+
+        controls.GetSizer().Add(wx.StaticText(controls, label="Pivot on"), 0, wx.ALL, 5)
+        self.pivot_choice = wx.Choice(controls, choices=[NO_PIVOT] + columns)
+        self.pivot_choice.SetSelection(0)
+        controls.GetSizer().Add(self.pivot_choice, 0, wx.EXPAND | wx.ALL, 5)
+        PVButton(controls, "Aggregate", self.on_aggregate)
+        panel.GetSizer().Add(controls, 1, wx.EXPAND)
+
+        results = wx.Panel(panel)
+        results.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.summary_label = wx.StaticText(results, label="No summary calculated yet")
+        results.GetSizer().Add(self.summary_label, 0, wx.EXPAND | wx.ALL, 5)
+        self.result_grid = wx.grid.Grid(results)
+        self.result_grid.CreateGrid(0, 1)
+        self.result_grid.EnableEditing(False)
+        self.result_grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.on_group_open)
+        results.GetSizer().Add(self.result_grid, 1, wx.EXPAND)
+        panel.GetSizer().Add(results, 2, wx.EXPAND)
+
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        return self.__plugin.status_bar
+
+    def on_add_measure(self, event: wx.CommandEvent) -> bool:
+        measure = self.measure_choice.GetStringSelection()
+        column = self.column_choice.GetStringSelection()
+        column = None if column == NO_COLUMN else column
+        if column is None and measure != "count":
+            wx.MessageBox(f"The {measure} measure needs a column", "Aggregate", wx.OK | wx.ICON_INFORMATION)
+            return False
+        if (measure, column) in self.__measures:
+            return False
+
+        self.__measures.append((measure, column))
+        self.measure_list.Append(measure_name(measure, column))
+        return True
+
+    def on_remove_measure(self, event: wx.CommandEvent) -> bool:
+        index = self.measure_list.GetSelection()
+        if index == wx.NOT_FOUND:
+            return False
+        del self.__measures[index]
+        self.measure_list.Delete(index)
+        return True
+
+    def on_aggregate(self, event: wx.CommandEvent) -> bool:
+        """
+        Show the summary from the cache, or start calculating it in the background.
+        """
+        if not self.__measures:
+            wx.MessageBox("Add at least one measure", "Aggregate", wx.OK | wx.ICON_INFORMATION)
+            return False
+        if self.__plugin.view != self.__view:
+            wx.MessageBox("The grid no longer shows the data to aggregate", "Aggregate", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        groups = list(self.group_list.GetCheckedStrings())
+        pivot = self.pivot_choice.GetStringSelection()
+        pivot = None if pivot == NO_PIVOT else pivot
+        if pivot in groups:
+            groups.remove(pivot)
+
+        files = tuple(fingerprint(file) for file in self.__plugin.files if os.path.isfile(file))
+        key = (self.__view, tuple(groups), tuple(self.__measures), pivot, files)
+        cached = self.__plugin.aggregations.get(key)
+        if cached is not None:
+            self.show_result(groups, *cached)
+            return True
+
+        self.summary_label.SetLabel("Aggregating...")
+        aggregate_thread = threading.Thread(
+            target=self.aggregate_thread,
+            args=(
+                self.__plugin.cursor(), self.__plugin.grid.df.sql_query(), groups, list(self.__measures), pivot, key,
+                id(self.__plugin.tab)
+            ),
+            daemon=True
+        )
+        aggregate_thread.start()
+        return True
+
+    @status_message("Aggregating", 1)
+    def aggregate_thread(self, cursor: duckdb.DuckDBPyConnection, query: str, groups: List[str],
+                         measures: List[Tuple[str, str]], pivot: str, key: Hashable, owner: int) -> bool:
+        """
+        Calculate the summary.
+
+        Args:
+            cursor (duckdb.DuckDBPyConnection): The cursor to run the query on.
+            query (str): The query for the relation shown in the grid.
+            groups (list): The columns to group by.
+            measures (list): The measure and column of each aggregate.
+            pivot (str): The column to pivot on, or None.
+            key (Hashable): The cache key of the summary.
+            owner (int): The id of the tab the summary belongs to, so it is dropped when the tab is closed.
+        """
+        try:
+            summary = cursor.sql(aggregation_query(query, groups, measures, pivot))
+            # One row more than is shown tells whether there are more groups, without running the summary twice
+            rows = summary.limit(MAX_GROUPS + 1).fetchall()
+        except duckdb.Error as e:
+            wx.CallAfter(self.show_error, str(e))
+            return False
+
+        result = (summary.columns, rows[:MAX_GROUPS], len(rows) > MAX_GROUPS)
+        self.__plugin.aggregations.put(key, result, owner)
+        wx.CallAfter(self.show_result, groups, *result)
+        return True
+
+    def show_error(self, message: str) -> None:
+        """
+        Show why the summary could not be calculated, e.g. a sum over a text column.
+        """
+        if self:
+            self.summary_label.SetLabel(f"Unable to aggregate: {message}")
+
+    def show_result(self, groups: List[str], columns: List[str], rows: list, truncated: bool) -> None:
+        """
+        Show a summary.
+        """
+        if not self:
+            return
+
+        self.__groups = groups
+        self.__keys = [row[:len(groups)] for row in rows]
+        self.summary_label.SetLabel(
+            f"More than {MAX_GROUPS} groups (first {MAX_GROUPS} shown)" if truncated else f"{len(rows)} groups"
+        )
+
+        self.result_grid.ClearGrid()
+        if self.result_grid.GetNumberRows():
+            self.result_grid.DeleteRows(0, self.result_grid.GetNumberRows())
+        if self.result_grid.GetNumberCols():
+            self.result_grid.DeleteCols(0, self.result_grid.GetNumberCols())
+        self.result_grid.AppendCols(len(columns))
+        self.result_grid.AppendRows(len(rows))
+
+        for j, column in enumerate(columns):
+            self.result_grid.SetColLabelValue(j, column)
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                self.result_grid.SetCellValue(i, j, "" if value is None else str(value))
+        self.result_grid.AutoSize()
+        self.Layout()
+
+    def on_group_open(self, event: wx.grid.GridEvent) -> bool:
+        if self.__plugin.view != self.__view:
+            wx.MessageBox("The grid no longer shows the data the summary was calculated for", "Aggregate", wx.OK | wx.ICON_INFORMATION)
+            return False
+        if not self.__groups:
+            return False
+        return self.__plugin.show_group(self.__groups, self.__keys[event.GetRow()])
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        self.__plugin.aggregation = None
+        event.Skip()
@@ -0,0 +1,40 @@
+import hashlib
+from pathlib import Path
+
+
+def open_arrow(path: str):
+    """
+    Open an Arrow IPC (Feather v2) file by memory-mapping it.
+
+    The record batches are not copied or parsed: the returned table points straight into the mapped file, so opening
+    a file takes about as long as reading its footer, and only the pages that are looked at are paged in by the OS.
+    Compressed Feather files are the exception, their buffers have to be decompressed into memory.
+
+    Args:
+        path (str): The path of the Arrow IPC or Feather file.
+
+    Returns:
+        pyarrow.Table: The table backed by the memory-mapped file.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow.feather as feather
+    except ImportError as e:
+        raise ImportError("Opening Arrow IPC and Feather files requires pyarrow to be installed") from e
+
+    return feather.read_table(path, memory_map=True)
+
+
+def arrow_view_name(path: str) -> str:
+    """
+    Get the name under which an Arrow file is registered with DuckDB.
+
+    Args:
+        path (str): The path of the Arrow file.
+
+    Returns:
+        str: A name that is unique for the absolute path of the file.
+    """
+    return "arrow_" + hashlib.sha1(str(Path(path).absolute()).encode()).hexdigest()[:16]
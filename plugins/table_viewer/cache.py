@@ -0,0 +1,93 @@
+import threading
+from collections import Counter, OrderedDict
+from typing import Hashable, Optional
+
+
+class PageCache:
+    """
+    A least recently used cache for the pages shown in the Table Viewer grid.
+
+    A page is stored as the dictionary of column buffers the `PageTable` fetched for it, so columns that are fetched
+    later for a cached page are cached as well. Going back to a page that was already shown does not query the file
+    again, which matters most for sources that cannot seek, such as compressed CSV and JSON files, where reaching a
+    deep page means decompressing everything before it.
+
+    The cache is shared by all open tabs. Every page has an owner, and when the cache is full the least recently used
+    page of the owner holding the most pages is evicted. A tab that is paged through heavily therefore cannot push the
+    pages of the other tabs out of the cache.
+
+    Attributes:
+        max_pages (int): The maximum number of pages kept in the cache.
+        __pages (OrderedDict): The cached pages, from least to most recently used.
+        __owners (dict): The owner of each cached page.
+        __lock (threading.Lock): The lock guarding the cache.
+    """
+
+    def __init__(self, max_pages: int = 64) -> None:
+        self.max_pages = max_pages
+        self.__pages = OrderedDict()
+        self.__owners = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        """
+        Get a page from the cache and mark it as recently used.
+
+        Args:
+            key (Hashable): The key of the page.
+
+        Returns:
+            dict: The cached page, or None if the page is not cached.
+        """
+        with self.__lock:
+            page = self.__pages.get(key)
+            if page is not None:
+                self.__pages.move_to_end(key)
+            return page
+
+    def put(self, key: Hashable, page: dict, owner: Hashable = None) -> None:
+        """
+        Add a page to the cache, evicting pages of the owner holding the most pages if the cache is full.
+
+        Args:
+            key (Hashable): The key of the page.
+            page (dict): The page to cache.
+            owner (Hashable): The tab the page belongs to.
+        """
+        with self.__lock:
+            self.__pages[key] = page
+            self.__pages.move_to_end(key)
+            self.__owners[key] = owner
+            while len(self.__pages) > self.max_pages:
+                self.__evict()
+
+    def __evict(self) -> None:
+        counts = Counter(self.__owners.values())
+        largest = max(counts.values())
+        # The least recently used page among the owners with the most pages
+        key = next(key for key in self.__pages if counts[self.__owners[key]] == largest)
+        del self.__pages[key]
+        del self.__owners[key]
+
+    def evict_owner(self, owner: Hashable) -> None:
+        """
+        Remove all pages of an owner, e.g. when its tab is closed.
+
+        Args:
+            owner (Hashable): The owner of the pages.
+        """
+        with self.__lock:
+            for key in [key for key, page_owner in self.__owners.items() if page_owner == owner]:
+                del self.__pages[key]
+                del self.__owners[key]
+
+    def clear(self) -> None:
+        """
+        Remove all pages from the cache.
+        """
+        with self.__lock:
+            self.__pages.clear()
+            self.__owners.clear()
+
+    def __len__(self) -> int:
+        return len(self.__pages)
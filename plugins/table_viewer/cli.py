@@ -0,0 +1,300 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+
+import duckdb
+import yaml
+
+from .dataset import is_glob, list_files, split_suffix
+from .engine import EXPORT_FORMATS, Session
+from .file_search import SEARCHABLE_FORMATS, search_file
+from .profile import PROFILE_CHUNK_ROWS, PROFILE_COLUMNS
+from .query import SEARCH_STYLES, quote_literal
+from .validation import parse_rules, validate
+
+CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "table_viewer.yaml"
+# Database files hold many tables, so they cannot be processed as a single dataset
+FILE_FORMATS = SEARCHABLE_FORMATS + ("arrow",)
+# The units DuckDB reports its memory limit in
+MEMORY_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3, "TiB": 1024 ** 4, "PiB": 1024 ** 5}
+
+# The session of a worker process, created once by `start_worker` and shared by all files the worker processes
+_session = None
+
+
+def load_settings(path: str = CONFIG_PATH) -> dict:
+    """
+    Load the Table Viewer settings from a config file, without starting the application.
+
+    Args:
+        path (str): The path of the YAML config file.
+
+    Returns:
+        dict: The settings under the `table_viewer` key, or an empty dict if there are none.
+    """
+    with open(path, "r") as file:
+        return (yaml.safe_load(file) or {}).get("table_viewer") or {}
+
+
+def expand_paths(paths: Sequence[str], formats: Sequence[str] = FILE_FORMATS) -> List[Tuple[str, str]]:
+    """
+    Expand files, directories and glob patterns to the data files they contain.
+
+    Args:
+        paths (Sequence[str]): The paths of files or directories, or glob patterns.
+        formats (Sequence[str]): The file formats to keep, values in `dataset.FORMATS`.
+
+    Returns:
+        list: The path of every file, with its name relative to the directory it was found in, so files with the same
+            name in different partitions keep apart when they are converted. Files given more than once are listed once.
+    """
+    files = {}
+    for path in paths:
+        directory = Path(path).is_dir() and not is_glob(path)
+        for file in list_files(path) if directory or is_glob(path) else (path,):
+            files.setdefault(file, os.path.relpath(file, path) if directory else Path(file).name)
+    return [(file, name) for file, name in files.items() if split_suffix(file)[0] in formats]
+
+
+def output_path(name: str, output_dir: str, suffix: str) -> str:
+    """
+    Get the path a file is converted to.
+
+    Args:
+        name (str): The name of the file, relative to the directory it was found in.
+        output_dir (str): The directory to write to.
+        suffix (str): The suffix of the output format, one of the keys in `EXPORT_FORMATS`.
+
+    Returns:
+        str: The path, with the format and compression suffixes of the input replaced by the output suffix.
+    """
+    file_format, compression = split_suffix(name)
+    for _ in range((file_format is not None) + (compression is not None)):
+        name = str(Path(name).with_suffix(""))
+    return str(Path(output_dir) / (name + suffix))
+
+
+def worker_settings(settings: dict, workers: int) -> dict:
+    """
+    Split the threads and the memory of a single session between the worker processes.
+
+    Every worker has its own DuckDB database, which by default uses all cores and the whole configured memory limit, so
+    without splitting them N workers would run N times as many threads as there are cores and be allowed N times the
+    memory limit.
+
+    Args:
+        settings (dict): The Table Viewer settings.
+        workers (int): The number of worker processes.
+
+    Returns:
+        dict: The settings with the threads and the memory limit of each worker.
+    """
+    connection = duckdb.connect()
+    if settings.get("memory_limit"):
+        connection.execute(f"SET memory_limit = {quote_literal(str(settings['memory_limit']))}")
+    if settings.get("threads"):
+        connection.execute(f"SET threads = {int(settings['threads'])}")
+    amount, unit = connection.sql("SELECT current_setting('memory_limit')").fetchone()[0].split()
+    threads = connection.sql("SELECT current_setting('threads')").fetchone()[0]
+    connection.close()
+    return {
+        **settings,
+        "threads": max(1, threads // workers),
+        "memory_limit": f"{int(float(amount) * MEMORY_UNITS[unit] / workers)} bytes",
+    }
+
+
+def start_worker(settings: dict) -> None:
+    """
+    Create the session of a worker process.
+    """
+    global _session
+    _session = Session(settings)
+
+
+def profile_file(file: str, options: dict) -> dict:
+    """
+    Profile all columns of a file, with the statistics of every column keyed by the names in `PROFILE_COLUMNS`.
+    """
+    rows, complete = _session.open(file).profile(chunk_rows=options["chunk_rows"])
+    return {
+        "file": file,
+        "complete": complete,
+        "columns": [dict(zip(PROFILE_COLUMNS, row)) for row in rows],
+    }
+
+
+def convert_file(file: str, options: dict) -> dict:
+    """
+    Convert a file to the format of the output suffix, keeping its name relative to the directory it was found in.
+    """
+    output = output_path(options["name"], options["output_dir"], options["suffix"])
+    if Path(output).resolve() == Path(file).resolve():
+        raise ValueError(f"Refusing to overwrite the input file: {file}")
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    return {"file": file, "output": output, "rows": _session.open(file).export(output)}
+
+
+def search_one_file(file: str, options: dict) -> dict:
+    """
+    Count the rows of a file matching a search, see `file_search.search_file`.
+    """
+    return search_file(_session.connection, file, options["column"], options["value"], options["style"])
+
+
+def validate_file(file: str, options: dict) -> dict:
+    """
+    Count the violations of the validation rules in a file, see `validation.validate`.
+    """
+    dataset = _session.open(file)
+    return {"file": file, **validate(dataset.connection, dataset.relation, options["rules"])}
+
+
+COMMANDS = {
+    "profile": profile_file,
+    "convert": convert_file,
+    "search": search_one_file,
+    "validate": validate_file,
+}
+
+
+def run_task(command: str, file: str, options: dict) -> dict:
+    """
+    Run a command on a single file in a worker process.
+
+    Args:
+        command (str): The name of the command, one of the keys in `COMMANDS`.
+        file (str): The path of the file.
+        options (dict): The options of the command.
+
+    Returns:
+        dict: The result of the command, or the file and the error if it failed.
+    """
+    try:
+        return COMMANDS[command](file, options)
+    except (duckdb.Error, OSError, ValueError, ImportError) as e:
+        return {"file": file, "error": str(e)}
+
+
+def is_failure(result: dict) -> bool:
+    """
+    Check whether a result should fail the run: the file could not be processed, it broke a validation rule or a rule
+    could not be evaluated on it.
+    """
+    return "error" in result or any(result.get("violations", {}).values()) or bool(result.get("invalid"))
+
+
+def run(command: str, files: Sequence[Tuple[str, str]], options: dict, settings: dict, workers: int = None,
+        output: TextIO = sys.stdout, output_format: str = "jsonl") -> int:
+    """
+    Run a command over many files with a pool of worker processes.
+
+    Every worker process has its own session, so the files are processed in parallel without sharing a connection or
+    the global interpreter lock. The threads and the memory limit of the sessions are split between the workers (see
+    `worker_settings`). In the `jsonl` format every result is written as soon as its file is done, so a long
+    run can be followed and a run that is stopped still leaves the results so far; the `json` format writes a single
+    array once all files are done.
+
+    Args:
+        command (str): The name of the command, one of the keys in `COMMANDS`.
+        files (Sequence[tuple]): The paths of the files and their relative names, as returned by `expand_paths`.
+        options (dict): The options of the command.
+        settings (dict): The Table Viewer settings the sessions are configured from.
+        workers (int): The number of worker processes, or None for one per CPU. There are never more workers than
+            files.
+        output (TextIO): The stream to write the results to.
+        output_format (str): `jsonl` for one JSON object per line, or `json` for a JSON array.
+
+    Returns:
+        int: The number of files that failed.
+    """
+    results, failed = [], 0
+    workers = max(1, min(workers or os.cpu_count() or 1, len(files)))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=start_worker, initargs=(worker_settings(settings, workers),)
+    ) as executor:
+        futures = [executor.submit(run_task, command, file, {**options, "name": name}) for file, name in files]
+        for future in as_completed(futures):
+            result = future.result()
+            failed += is_failure(result)
+            if output_format == "jsonl":
+                output.write(json.dumps(result, default=str) + "\n")
+                output.flush()
+            else:
+                results.append(result)
+
+    if output_format == "json":
+        json.dump(sorted(results, key=lambda result: result["file"]), output, default=str, indent=2)
+        output.write("\n")
+    return failed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="main.py", description="Run the Table Viewer on many files without a display. Without a command, the "
+                                    "application is started."
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("paths", nargs="+", help="Files, directories or glob patterns to process")
+    common.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes, which share the cores and the memory limit (default: one "
+                             "per CPU)")
+    common.add_argument("--format", choices=("jsonl", "json"), default="jsonl", dest="output_format",
+                        help="One JSON object per line as files finish, or a single JSON array at the end")
+    common.add_argument("--output", default=None, help="File to write the results to (default: standard output)")
+    common.add_argument("--config", default=str(CONFIG_PATH), help="Table Viewer config file")
+
+    commands = parser.add_subparsers(dest="command", required=True)
+    profile = commands.add_parser("profile", parents=[common], help="Profile the columns of every file")
+    profile.add_argument("--chunk-rows", type=int, default=None, help="Rows profiled by the first pass")
+
+    convert = commands.add_parser("convert", parents=[common], help="Convert every file to another format")
+    convert.add_argument("--to", required=True, choices=[suffix[1:] for suffix in EXPORT_FORMATS],
+                         help="The output format")
+    convert.add_argument("--output-dir", required=True, help="Directory to write the converted files to")
+
+    search = commands.add_parser("search", parents=[common], help="Count the rows matching a search in every file")
+    search.add_argument("--column", required=True, help="The column to search in")
+    search.add_argument("--value", required=True, help="The value to search for")
+    search.add_argument("--style", choices=SEARCH_STYLES, default=SEARCH_STYLES[0], help="The search style")
+
+    commands.add_parser("validate", parents=[common], help="Check every file against the rules in the config")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run a Table Viewer command from the command line.
+
+    Args:
+        argv (Sequence[str]): The command line arguments, without the program name.
+
+    Returns:
+        int: The exit status: 0 if every file was processed (and passed validation), 1 otherwise.
+    """
+    args = build_parser().parse_args(argv)
+    settings = load_settings(args.config)
+
+    options: Dict[str, object] = {}
+    formats = FILE_FORMATS
+    if args.command == "profile":
+        options["chunk_rows"] = args.chunk_rows or settings.get("profile_chunk_rows", PROFILE_CHUNK_ROWS)
+    elif args.command == "convert":
+        options.update(suffix="." + args.to, output_dir=args.output_dir)
+    elif args.command == "search":
+        options.update(column=args.column, value=args.value, style=args.style)
+        formats = SEARCHABLE_FORMATS
+    elif args.command == "validate":
+        options["rules"] = parse_rules(settings.get("rules") or [])
+
+    files = expand_paths(args.paths, formats)
+    if args.output is None:
+        failed = run(args.command, files, options, settings, args.workers, sys.stdout, args.output_format)
+    else:
+        with open(args.output, "w") as output:
+            failed = run(args.command, files, options, settings, args.workers, output, args.output_format)
+    return 1 if failed else 0
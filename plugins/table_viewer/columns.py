@@ -1,15 +1,22 @@
+import csv
+import os
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Tuple
 
-import duckdb
 import wx
 import wx.grid
 
+from .cache import PageCache
+from .components.button import PVButton
 from .components.panel import BasePanel
+from .distribution_frame import DistributionFrame
+from .engine import Dataset
 from .helpers import status_message
+from .ndjson import fingerprint
+from .profile import PROFILE_CHUNK_ROWS, PROFILE_COLUMNS
 
 if TYPE_CHECKING:
-    from plugins.table_viewer import TableViewer
+    from .viewer import TableViewer
 
 
 class ColumnOverviewPanel(BasePanel):
@@ -22,9 +29,30 @@ class ColumnOverviewPanel(BasePanel):
     The overview is displayed in a read-only text control, and is updated whenever the Table Viewer plugin is
     updated with a new file.
 
+    Every column is profiled in a single aggregate scan over the data: its coverage and unique values, the range, mean,
+    standard deviation and quartiles of numeric columns, and the range of lengths of text columns. The profile can be
+    exported to a CSV file.
+
+    The profile is calculated progressively, so useful numbers appear within seconds even for huge files. The first
+    pass profiles a small chunk of rows at the start of the file, and every following pass twice as many, until the
+    whole file is profiled. The info grid is updated after each pass, with the number of first rows the results cover
+    and how much they still change. The user can stop once they have settled, which keeps the results of the last
+    finished pass; they describe only the rows profiled, which in a sorted file may differ from the rest.
+
+    The results are kept per view, so switching back to a tab shows its overview without calculating it again. The
+    calculation for a hidden tab is paused until the tab is shown again.
+
     Attributes:
         __sizer (wx.BoxSizer): The main sizer for the panel, which contains the text control.
         __base_info (wx.TextCtrl): The text control that displays the overview information.
+        __results (dict): The rows calculated so far, keyed by view.
+        __progress (dict): The description of the progress of the calculation, keyed by view.
+        __datasets (dict): The datasets of the running calculations, keyed by view.
+        __running (set): The views that are being calculated.
+        __stopped (set): The views the user stopped the calculation of.
+        __done (set): The views that are calculated completely, or stopped.
+        progress_label (wx.StaticText): The progress and confidence of the calculation shown.
+        distributions (PageCache): The cached column distributions shown in the drill-down view.
     """
 
     def __init__(self, tv: "TableViewer") -> None:
@@ -40,6 +68,13 @@ class ColumnOverviewPanel(BasePanel):
         self.__sizer = wx.BoxSizer(wx.VERTICAL)
         self.SetSizer(self.__sizer)
         self.SetMaxSize(tv.panel.GetSize())
+        self.__results = {}
+        self.__progress = {}
+        self.__datasets = {}
+        self.__running = set()
+        self.__stopped = set()
+        self.__done = set()
+        self.distributions = PageCache(64)
 
         self.setup_ui()
 
@@ -51,72 +86,195 @@ class ColumnOverviewPanel(BasePanel):
         Returns:
             bool: True if the UI was successfully set up, False otherwise.
         """
+        controls = wx.Panel(self)
+        controls.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+        PVButton(controls, "Stop", self.on_stop)
+        PVButton(controls, "Export Profile", self.on_export)
+        self.progress_label = wx.StaticText(controls, label="")
+        controls.GetSizer().Add(self.progress_label, 4, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 5)
+        self.__sizer.Add(controls, 0, wx.EXPAND)
+
         self.info_grid = wx.grid.Grid(self)
-        self.info_grid.CreateGrid(0, 3)
+        self.info_grid.CreateGrid(0, len(PROFILE_COLUMNS))
 
-        self.info_grid.SetColLabelValue(0, "Column Name")
-        self.info_grid.SetColLabelValue(1, "Coverage")
-        self.info_grid.SetColLabelValue(2, "Unique Values")
+        for i, label in enumerate(PROFILE_COLUMNS):
+            self.info_grid.SetColLabelValue(i, label)
+        self.info_grid.Bind(wx.grid.EVT_GRID_LABEL_LEFT_CLICK, self.on_label_click)
+        self.info_grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.on_label_click)
 
         self.__sizer.Add(self.info_grid, 1, wx.EXPAND)
 
         return True
 
     def update(self):
-        update_thread = threading.Thread(target=self.update_thread)
+        """
+        Start updating the column overview in the background.
+
+        The overview is calculated on its own cursor, so it does not block the grid, and the info grid is updated
+        after each pass of the progressive profile.
+        """
+        if self.plugin.grid.df is None:
+            self.__show_rows([])
+            self.progress_label.SetLabel("")
+            return False
+
+        view = self.plugin.view
+        self.__show_rows(self.__results.get(view, []))
+        self.progress_label.SetLabel(self.__progress.get(view, ""))
+        if view in self.__done:
+            self.on_update_done(view)
+            return False
+        if view in self.__running:
+            return False
+
+        self.__results[view] = []
+        self.__running.add(view)
+        self.__stopped.discard(view)
+        self.__datasets[view] = Dataset.from_query(self.plugin.cursor(), self.plugin.grid.df.sql_query())
+        update_thread = threading.Thread(target=self.update_thread, args=(self.__datasets[view], view), daemon=True)
         update_thread.start()
+        return True
 
     @status_message("Updating column overview", 1)
-    def update_thread(self) -> bool:
+    def update_thread(self, dataset: Dataset, view: str) -> bool:
         """
-        Update the overview information in the text control.
+        Calculate the overview information for all columns progressively (see `Dataset.profile`).
+
+        The profile of a hidden tab is paused between passes until the tab is shown again, and dropped when the tab is
+        closed.
+
+        Args:
+            dataset (Dataset): The data shown in the grid, on its own cursor.
+            view (str): The view the overview is calculated for.
         """
-        self.info_grid.ClearGrid()
+        def on_progress(rows: List[Tuple[str, ...]], progress: str) -> None:
+            wx.CallAfter(self.set_rows, view, rows, progress)
+            if not self.plugin.wait_until_visible(view):
+                dataset.cancel()
 
-        if self.info_grid.GetNumberRows() > 0:
-            self.info_grid.DeleteRows(0, self.info_grid.GetNumberRows())
+        # The grid counts the rows at the same time, so the count is read again for every pass
+        dataset.profile(
+            on_progress, self.plugin.settings.get("profile_chunk_rows", PROFILE_CHUNK_ROWS),
+            lambda: self.plugin.grid.view_row_count(view)
+        )
+        wx.CallAfter(self.on_update_done, view)
+        return True
 
-        if self.plugin.grid.df is None:
+    def set_rows(self, view: str, rows: List[Tuple[str, ...]], progress: str) -> bool:
+        """
+        Store the overview of a pass of the profile, and show it in the info grid if its view is shown.
+        """
+        self.__results[view] = rows
+        self.__progress[view] = progress
+        if view != self.plugin.view:
             return False
-        df = self.plugin.grid.df
 
-        total_rows = len(df)
-        if total_rows >= 10000000:
-            wx.MessageBox("The file is too large to display all unique values. 10 million rows will be used as a sample.", "Warning", wx.OK | wx.ICON_WARNING)
-            rows_to_check = 10000000
-        else:
-            rows_to_check = total_rows
-
-        for i, column in enumerate(df.columns):
-            while True:
-                try:
-                    column_values = [value[0] for value in df[column].limit(rows_to_check).fetchall() if value[0] is not None]
-                    break
-                except duckdb.InvalidInputException:
-                    continue
-
-            self.info_grid.AppendRows(1)
-            self.info_grid.SetCellValue(i, 0, column)
-            self.info_grid.SetCellValue(i, 1, f"{len(column_values) / rows_to_check:.2%}" if column_values is not None else "N/A")
-
-            if len(set(column_values)) == rows_to_check:
-                self.info_grid.SetCellValue(i, 2, "Unique")
-            elif len(column_values) == 0:
-                self.info_grid.SetCellValue(i, 2, "N/A")
-            else:
-                self.info_grid.SetCellValue(i, 2, f"{len(set(column_values)) / rows_to_check:.2%}")
+        self.__show_rows(rows)
+        self.progress_label.SetLabel(progress)
+        self.info_grid.AutoSize()
+        self.GetTopLevelParent().Layout()
+        return True
 
+    def __show_rows(self, rows: List[Tuple[str, ...]]) -> None:
+        self.info_grid.ClearGrid()
+        if self.info_grid.GetNumberRows() != len(rows):
+            if self.info_grid.GetNumberRows() > 0:
+                self.info_grid.DeleteRows(0, self.info_grid.GetNumberRows())
+            self.info_grid.AppendRows(len(rows))
+        for index, row in enumerate(rows):
+            for i, value in enumerate(row):
+                self.info_grid.SetCellValue(index, i, value)
+
+    def on_stop(self, event: wx.CommandEvent) -> bool:
+        """
+        Stop the calculation of the shown view, keeping the results of the last finished pass.
+        """
+        view = self.plugin.view
+        if view not in self.__running:
+            return False
+
+        self.__stopped.add(view)
+        self.__datasets[view].cancel()
+        return True
+
+    def on_update_done(self, view: str) -> bool:
+        self.__running.discard(view)
+        self.__datasets.pop(view, None)
+        self.__done.add(view)
+        if view in self.__stopped:
+            self.__progress[view] = f"{self.__progress.get(view, 'No rows profiled')}, stopped"
+        if view != self.plugin.view:
+            return False
+
+        self.progress_label.SetLabel(self.__progress.get(view, ""))
         self.info_grid.AutoSize()
         self.GetTopLevelParent().Layout()
+        return True
 
+    def on_export(self, event: wx.CommandEvent) -> bool:
+        """
+        Export the profile of the shown view to a CSV file.
+        """
+        view = self.plugin.view
+        if view not in self.__done:
+            wx.MessageBox("The column overview is not calculated yet", "Export Profile", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        with wx.FileDialog(self, "Export Profile", wildcard="CSV files (*.csv)|*.csv",
+                           style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT) as dialog:
+            if dialog.ShowModal() == wx.ID_CANCEL:
+                return False
+            path = dialog.GetPath()
+
+        self.export_profile(view, path)
+        self.status_bar.SetStatusText(f"Profile exported to {path}", 1)
         return True
 
+    def export_profile(self, view: str, path: str) -> None:
+        """
+        Write the profile of a view to a CSV file.
+
+        Args:
+            view (str): The view to export the profile of.
+            path (str): The path of the CSV file.
+        """
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(PROFILE_COLUMNS)
+            writer.writerows(self.__results.get(view, []))
+
     def on_label_click(self, event):
         label = event.GetRow()
-        print(label)
+        if label < 0:
+            event.Skip()
+            return
         column = self.info_grid.GetCellValue(label, 0)
         coverage = self.info_grid.GetCellValue(label, 1)
         unique = self.info_grid.GetCellValue(label, 2)
 
         self.status_bar.SetStatusText(f"Column: {column}, Coverage: {coverage}, Unique Values: {unique}", 1)
+        self.open_distribution(column)
         event.Skip()
+
+    def open_distribution(self, column: str) -> bool:
+        """
+        Open the drill-down view of a column.
+
+        The distribution is cached per view, column and fingerprint of the files, so it is calculated again when the
+        file changes on disk.
+
+        Args:
+            column (str): The column to show the distribution of.
+
+        Returns:
+            bool: True if the drill-down view was opened.
+        """
+        df = self.plugin.grid.df
+        if df is None or column not in df.columns:
+            return False
+
+        files = tuple(fingerprint(file) for file in self.plugin.files if os.path.isfile(file))
+        frame = DistributionFrame(self.plugin, column)
+        frame.load(column, df.types[df.columns.index(column)], (self.plugin.view, column, files))
+        frame.Show()
+        return True
@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import wx
+
+from .components.mixins import SetFontMixin
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+    from .tabs import DatasetTab
+
+
+class CompareDialog(SetFontMixin, wx.Dialog):
+    """
+    The dialog for comparing the active dataset with another open dataset.
+
+    The other dataset is treated as the old version and the active dataset as the new version. The key columns identify
+    a row in both versions; only the columns both versions have can be picked.
+
+    Attributes:
+        __tabs (list): The other open tabs.
+        __tab_choice (wx.Choice): The choice of the old version.
+        __key_list (wx.CheckListBox): The key columns.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the Compare Dialog.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title=f"Compare {tv.tab.name}", size=(400, 450))
+        self.set_font()
+        self.__plugin = tv
+        self.__tabs = [tab for tab in tv.tabs if tab is not tv.tab and tab.source is not None]
+
+        self.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.GetSizer().Add(wx.StaticText(self, label="Old version"), 0, wx.ALL, 5)
+        self.__tab_choice = wx.Choice(self, choices=[tab.path for tab in self.__tabs])
+        self.__tab_choice.SetSelection(0)
+        self.__tab_choice.Bind(wx.EVT_CHOICE, self.on_tab_choice)
+        self.GetSizer().Add(self.__tab_choice, 0, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
+
+        self.GetSizer().Add(wx.StaticText(self, label="Key columns"), 0, wx.ALL, 5)
+        self.__key_list = wx.CheckListBox(self)
+        self.GetSizer().Add(self.__key_list, 1, wx.EXPAND | wx.LEFT | wx.RIGHT, 5)
+        self.GetSizer().Add(self.CreateButtonSizer(wx.OK | wx.CANCEL), 0, wx.EXPAND | wx.ALL, 5)
+
+        self.on_tab_choice(None)
+
+    def on_tab_choice(self, event: Optional[wx.CommandEvent]) -> None:
+        """
+        List the columns the active dataset and the chosen old version have in common.
+        """
+        old = self.__tabs[self.__tab_choice.GetSelection()].source
+        self.__key_list.Set([column for column in self.__plugin.source.columns if column in old.columns])
+        if self.__key_list.GetCount():
+            self.__key_list.Check(0)
+
+    def get_comparison(self) -> Tuple["DatasetTab", List[str]]:
+        """
+        Get the chosen old version and key columns.
+
+        Returns:
+            tuple: The tab of the old version and the names of the key columns.
+        """
+        return self.__tabs[self.__tab_choice.GetSelection()], list(self.__key_list.GetCheckedStrings())
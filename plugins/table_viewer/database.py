@@ -0,0 +1,115 @@
+import hashlib
+import os
+from typing import List, Tuple
+
+import duckdb
+
+from .helpers import quote_identifier
+from .query import quote_literal
+
+DATABASE_TYPES = {
+    "duckdb": None,
+    "sqlite": "sqlite",
+}
+
+
+def database_alias(path: str) -> str:
+    """
+    Get the name a database file is attached under. The name only depends on the absolute path of the file, so
+    attaching the same file twice is detected.
+
+    Args:
+        path (str): The path of the database file.
+
+    Returns:
+        str: The name of the attached database.
+    """
+    return "db_" + hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+
+
+def attach_database(connection: duckdb.DuckDBPyConnection, path: str, database_type: str) -> str:
+    """
+    Attach a DuckDB or SQLite database file read-only.
+
+    The tables are not copied: queries on them run inside the attached database, so its indexes, zone maps and
+    statistics are used for filters, and nothing is exported first. SQLite files are read through the DuckDB `sqlite`
+    extension, which is installed the first time it is needed.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to attach the database to.
+        path (str): The path of the database file.
+        database_type (str): The type of the database, one of the keys of `DATABASE_TYPES`.
+
+    Returns:
+        str: The name the database is attached under.
+    """
+    alias = database_alias(path)
+    attached = connection.sql(
+        f"SELECT COUNT(*) FROM duckdb_databases() WHERE database_name = {quote_literal(alias)}"
+    ).fetchone()[0]
+    if attached:
+        return alias
+
+    extension = DATABASE_TYPES[database_type]
+    options = "READ_ONLY"
+    if extension:
+        connection.install_extension(extension)
+        connection.load_extension(extension)
+        options = f"TYPE {extension}, READ_ONLY"
+    connection.execute(f"ATTACH {quote_literal(path)} AS {quote_identifier(alias)} ({options})")
+    return alias
+
+
+def detach_database(connection: duckdb.DuckDBPyConnection, alias: str) -> None:
+    """
+    Detach a database that was attached with `attach_database`.
+    """
+    connection.execute(f"DETACH DATABASE IF EXISTS {quote_identifier(alias)}")
+
+
+def list_tables(connection: duckdb.DuckDBPyConnection, alias: str) -> List[Tuple[str, str, str]]:
+    """
+    List the tables and views in an attached database.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection the database is attached to.
+        alias (str): The name the database is attached under.
+
+    Returns:
+        list: The schema, name and type (`BASE TABLE` or `VIEW`) of each table.
+    """
+    return connection.sql(
+        f"SELECT table_schema, table_name, table_type FROM information_schema.tables "
+        f"WHERE table_catalog = {quote_literal(alias)} ORDER BY table_schema, table_name"
+    ).fetchall()
+
+
+def table_query(alias: str, schema: str, table: str) -> str:
+    """
+    Build the query that reads a table or view of an attached database.
+
+    Args:
+        alias (str): The name the database is attached under.
+        schema (str): The schema of the table.
+        table (str): The name of the table.
+
+    Returns:
+        str: The query selecting all rows of the table.
+    """
+    return f"SELECT * FROM {quote_identifier(alias)}.{quote_identifier(schema)}.{quote_identifier(table)}"
+
+
+def search_path(aliases: List[str]) -> str:
+    """
+    Build the search path that lets views in attached databases find the tables they select from.
+
+    Views store the names of their tables without the database, so they are resolved against the search path of the
+    connection that queries them.
+
+    Args:
+        aliases (list): The names of the attached databases.
+
+    Returns:
+        str: The value for `SET search_path`.
+    """
+    return ",".join(["memory.main", *(f"{alias}.main" for alias in aliases)])
@@ -0,0 +1,201 @@
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from .arrow import arrow_view_name
+from .helpers import quote_identifier
+from .ndjson import is_ndjson, ndjson_query
+from .query import quote_literal
+
+FORMATS = {
+    ".parquet": "parquet",
+    ".csv": "csv",
+    ".tsv": "csv",
+    ".json": "json",
+    ".jsonl": "json",
+    ".ndjson": "json",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".duckdb": "duckdb",
+    ".ddb": "duckdb",
+    ".sqlite": "sqlite",
+    ".sqlite3": "sqlite",
+}
+COMPRESSIONS = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+}
+READERS = {
+    "parquet": "read_parquet",
+    "csv": "read_csv",
+    "json": "read_json_auto",
+}
+GLOB_CHARACTERS = ("*", "?", "[")
+LISTING_WORKERS = 16
+
+
+def is_glob(path: str) -> bool:
+    """
+    Check whether a path is a glob pattern rather than a single file or directory.
+    """
+    return any(character in path for character in GLOB_CHARACTERS)
+
+
+def split_suffix(path: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Get the file format and the compression of a file from its suffixes, e.g. `events.jsonl.gz` is gzip compressed
+    JSON.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        tuple: The format (one of the values in `FORMATS`) and the compression (one of the values in `COMPRESSIONS`).
+            Either is None if it is not recognized.
+    """
+    suffixes = [suffix.lower() for suffix in Path(path).suffixes]
+    compression = COMPRESSIONS.get(suffixes[-1]) if suffixes else None
+    if compression:
+        suffixes = suffixes[:-1]
+    return (FORMATS.get(suffixes[-1]) if suffixes else None), compression
+
+
+def file_query(path: str) -> str:
+    """
+    Build the query that reads a single file.
+
+    Compressed text files are read as a stream by the DuckDB reader for their format, so they never have to be
+    decompressed to disk first and only as much of the file is decompressed as a query needs. Arrow files are read from
+    the view they are registered under (see `arrow_view_name`). Newline-delimited JSON files are read with the
+    parallel newline-delimited reader and a cached schema (see `ndjson_query`).
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        str: The query selecting all rows of the file.
+    """
+    file_format, compression = split_suffix(path)
+    if file_format == "arrow":
+        return f"SELECT * FROM {quote_identifier(arrow_view_name(path))}"
+    if file_format == "json" and is_ndjson(path, compression):
+        return ndjson_query(path, compression)
+    if compression is None or file_format is None:
+        return f"SELECT * FROM {quote_literal(path)}"
+    return f"SELECT * FROM {READERS[file_format]}({quote_literal(path)}, compression = '{compression}')"
+
+
+def detect_format(path: str, files: Sequence[str] = None) -> str:
+    """
+    Get the file format of a file, or of the files in a directory or glob.
+
+    Args:
+        path (str): The path of a file or directory, or a glob pattern.
+        files (Sequence[str]): The files of the dataset, when they are listed already.
+
+    Returns:
+        str: The format, one of the values in `FORMATS`, or None if no supported file was found.
+    """
+    for file in dataset_files(path) if files is None else files:
+        file_format, _ = split_suffix(file)
+        if file_format:
+            return file_format
+    return None
+
+
+def list_files(path: str) -> Tuple[str, ...]:
+    """
+    List the data files in a directory or matching a glob pattern.
+
+    Directories are listed in parallel, one worker per top level entry, as partitioned datasets can contain thousands
+    of files spread over many directories. The listing is not cached, as files are added to a dataset while it is
+    open, e.g. new partitions; callers that need the files several times list them once and pass them on.
+
+    Args:
+        path (str): The path of a directory, or a glob pattern.
+
+    Returns:
+        tuple: The sorted paths of all files with a supported format.
+    """
+    if is_glob(path):
+        files = glob.glob(path, recursive=True)
+    else:
+        entries = list(os.scandir(path))
+        files = [entry.path for entry in entries if entry.is_file()]
+        with ThreadPoolExecutor(max_workers=LISTING_WORKERS) as executor:
+            for subdirectory_files in executor.map(_walk, [entry.path for entry in entries if entry.is_dir()]):
+                files.extend(subdirectory_files)
+
+    return tuple(sorted(file for file in files if split_suffix(file)[0] is not None))
+
+
+def dataset_files(path: str) -> Tuple[str, ...]:
+    """
+    Get the files that make up a dataset.
+
+    Args:
+        path (str): The path of a file or directory, or a glob pattern.
+
+    Returns:
+        tuple: The files in the directory or matching the glob, or the file itself.
+    """
+    if Path(path).is_dir() or is_glob(path):
+        return list_files(path)
+    return (path,)
+
+
+def _walk(directory: str) -> list:
+    return [os.path.join(root, name) for root, _, names in os.walk(directory) for name in names]
+
+
+def is_hive_partitioned(path: str, files: Sequence[str] = None) -> bool:
+    """
+    Check whether a dataset is laid out as Hive partitions (e.g. `date=2024-01-01/region=eu/part-0.parquet`).
+
+    Args:
+        path (str): The path of a directory, or a glob pattern.
+        files (Sequence[str]): The files of the dataset, when they are listed already.
+
+    Returns:
+        bool: True if the files are stored in `key=value` directories.
+    """
+    root = path
+    if is_glob(path):
+        root = os.path.dirname(path[:min(path.find(c) for c in GLOB_CHARACTERS if c in path)])
+    if files is None:
+        files = list_files(path)
+    return any("=" in part for file in files for part in Path(os.path.relpath(file, root)).parent.parts)
+
+
+def dataset_query(path: str) -> str:
+    """
+    Build the query that reads a file, a directory or a glob pattern as one dataset.
+
+    Directories and globs are listed once, and read with the DuckDB reader for their format over the list of files,
+    which picks the decompression of each file from its suffix. Hive partition columns are exposed as regular columns,
+    so filters on them are used to skip whole partitions, and filters on other columns can skip Parquet row groups
+    using their statistics.
+
+    Args:
+        path (str): The path of a file or directory, or a glob pattern.
+
+    Returns:
+        str: The query selecting all rows of the dataset.
+    """
+    if not (Path(path).is_dir() or is_glob(path)):
+        return file_query(path)
+
+    all_files = list_files(path)
+    file_format = detect_format(path, all_files)
+    if file_format is None:
+        raise FileNotFoundError(f"No supported files found in {path}")
+    if file_format not in READERS:
+        raise ValueError(f"{file_format.title()} files can only be opened one at a time")
+
+    files = [file for file in all_files if split_suffix(file)[0] == file_format]
+    file_list = "[" + ", ".join(quote_literal(file) for file in files) + "]"
+    hive = str(is_hive_partitioned(path, all_files)).lower()
+    return f"SELECT * FROM {READERS[file_format]}({file_list}, hive_partitioning = {hive}, union_by_name = true)"
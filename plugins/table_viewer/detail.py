@@ -0,0 +1,85 @@
+from typing import Any
+
+import wx
+
+from .components.mixins import SetFontMixin
+
+
+class CellDetailDialog(SetFontMixin, wx.Dialog):
+    """
+    The detail view for a single cell in the Table Viewer grid.
+
+    The grid only shows a truncated prefix of text, nested and blob values. This dialog shows the full value of a cell.
+    Nested values (STRUCT, LIST and MAP) are shown as a tree that is expanded lazily, so only the levels the user opens
+    are turned into tree items. Other values are shown as text.
+
+    Attributes:
+        PLACEHOLDER (str): The label of the placeholder child added to nodes that have not been expanded yet.
+        MAX_BLOB_BYTES (int): The number of bytes of a blob that are shown as hex.
+    """
+    PLACEHOLDER = "…"
+    MAX_BLOB_BYTES = 4096
+
+    def __init__(self, parent: wx.Window, column: str, value: Any) -> None:
+        """
+        Initialize the Cell Detail Dialog.
+
+        Args:
+            parent (wx.Window): The parent window for the dialog.
+            column (str): The name of the column the value belongs to.
+            value (Any): The full value of the cell.
+        """
+        super().__init__(parent, title=f"Column: {column}", size=(600, 400), style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+        self.set_font()
+        self.SetSizer(wx.BoxSizer(wx.VERTICAL))
+
+        if isinstance(value, (dict, list, tuple)):
+            self.__setup_tree(column, value)
+        else:
+            self.__setup_text(value)
+
+    def __setup_text(self, value: Any) -> None:
+        if value is None:
+            text = ""
+        elif isinstance(value, (bytes, bytearray)):
+            text = f"{len(value)} bytes\n\n" + value[:self.MAX_BLOB_BYTES].hex(" ")
+        else:
+            text = str(value)
+
+        text_control = wx.TextCtrl(self, value=text, style=wx.TE_MULTILINE | wx.TE_READONLY)
+        self.GetSizer().Add(text_control, 1, wx.EXPAND | wx.ALL, 5)
+
+    def __setup_tree(self, column: str, value: Any) -> None:
+        self.tree = wx.TreeCtrl(self, style=wx.TR_DEFAULT_STYLE | wx.TR_HIDE_ROOT)
+        self.tree.Bind(wx.EVT_TREE_ITEM_EXPANDING, self.on_expanding)
+        root = self.tree.AddRoot(column)
+        top = self.__add_node(root, column, value)
+        if value:
+            self.tree.Expand(top)
+        self.GetSizer().Add(self.tree, 1, wx.EXPAND | wx.ALL, 5)
+
+    def __add_node(self, parent: wx.TreeItemId, key: Any, value: Any) -> wx.TreeItemId:
+        """
+        Add a value to the tree. Containers get a placeholder child, and their children are added on expansion.
+        """
+        if isinstance(value, dict):
+            item = self.tree.AppendItem(parent, f"{key}: {{{len(value)} fields}}")
+        elif isinstance(value, (list, tuple)):
+            item = self.tree.AppendItem(parent, f"{key}: [{len(value)} items]")
+        else:
+            return self.tree.AppendItem(parent, f"{key}: {'NULL' if value is None else value}")
+
+        self.tree.SetItemData(item, value)
+        if value:
+            self.tree.AppendItem(item, self.PLACEHOLDER)
+        return item
+
+    def on_expanding(self, event: wx.TreeEvent) -> None:
+        item = event.GetItem()
+        child, _ = self.tree.GetFirstChild(item)
+        if child.IsOk() and self.tree.GetItemText(child) == self.PLACEHOLDER:
+            self.tree.DeleteChildren(item)
+            value = self.tree.GetItemData(item)
+            for key, child_value in (value.items() if isinstance(value, dict) else enumerate(value)):
+                self.__add_node(item, key, child_value)
+        event.Skip()
@@ -0,0 +1,103 @@
+from typing import Dict, Sequence
+
+import duckdb
+
+from .helpers import quote_identifier
+
+DIFF_TABLE = "table_viewer_diff"
+CHANGE_COLUMN = "change"
+PRESENT_COLUMN = "__present"
+CHANGES = ("added", "removed", "changed")
+
+
+def changed_flag(column: str) -> str:
+    """
+    Get the name of the column flagging whether a column changed.
+    """
+    return f"{column} changed"
+
+
+def diff_query(old: duckdb.DuckDBPyRelation, new: duckdb.DuckDBPyRelation, keys: Sequence[str]) -> str:
+    """
+    Build the query that compares two versions of a dataset row by row.
+
+    The two versions are joined on the key columns with a full outer join, which DuckDB runs as a hash join, so each
+    version is scanned once. Rows only in the new version are added, rows only in the old version are removed, and
+    rows in both with a different value in any compared column are changed. Unchanged rows are left out.
+
+    Every column present in both versions is compared. Columns whose types differ between the versions are compared
+    as text. Keys are matched with `IS NOT DISTINCT FROM`, so rows whose key is NULL in both versions are matched too.
+
+    Args:
+        old (duckdb.DuckDBPyRelation): The old version of the dataset.
+        new (duckdb.DuckDBPyRelation): The new version of the dataset.
+        keys (Sequence[str]): The columns identifying a row.
+
+    Returns:
+        str: The query, with the change, the key columns, and for every compared column its value (the new value, or
+            the old value for removed rows) and a flag telling whether it changed.
+
+    Raises:
+        ValueError: If a column of the datasets has the name of a column the diff adds, such as `change`.
+    """
+    old_types = dict(zip(old.columns, old.types))
+    new_types = dict(zip(new.columns, new.types))
+    compared = [column for column in old.columns if column in new_types and column not in keys]
+
+    names = [CHANGE_COLUMN, *keys, *(name for column in compared for name in (column, changed_flag(column)))]
+    clashes = sorted({name for name in names if names.count(name) > 1} | (
+        {PRESENT_COLUMN} & (set(old.columns) | set(new.columns))
+    ))
+    if clashes:
+        raise ValueError(f"Rename the columns {', '.join(clashes)}, as the diff uses these names for its own columns")
+
+    def side(alias: str, column: str) -> str:
+        value = f"{alias}.{quote_identifier(column)}"
+        return value if old_types[column] == new_types[column] else f"CAST({value} AS VARCHAR)"
+
+    matched = " AND ".join(
+        f"old.{quote_identifier(key)} IS NOT DISTINCT FROM new.{quote_identifier(key)}" for key in keys
+    )
+    # A marker column tells a missing row apart from a row whose key is NULL
+    new_missing = f"new.{PRESENT_COLUMN} IS NULL"
+    old_missing = f"old.{PRESENT_COLUMN} IS NULL"
+    flags = [f"{side('old', column)} IS DISTINCT FROM {side('new', column)}" for column in compared]
+
+    selections = [
+        f"CASE WHEN {old_missing} THEN 'added' WHEN {new_missing} THEN 'removed' ELSE 'changed' END AS {CHANGE_COLUMN}",
+        *(f"COALESCE(new.{quote_identifier(key)}, old.{quote_identifier(key)}) AS {quote_identifier(key)}" for key in keys),
+    ]
+    for column, flag in zip(compared, flags):
+        selections.append(
+            f"CASE WHEN {new_missing} THEN {side('old', column)} ELSE {side('new', column)} END AS {quote_identifier(column)}"
+        )
+        selections.append(f"({old_missing} OR {new_missing} OR {flag}) AS {quote_identifier(changed_flag(column))}")
+
+    changed = " OR ".join(flags) if flags else "false"
+    return (
+        f"SELECT {', '.join(selections)} "
+        f"FROM (SELECT *, true AS {PRESENT_COLUMN} FROM ({old.sql_query()})) AS old "
+        f"FULL OUTER JOIN (SELECT *, true AS {PRESENT_COLUMN} FROM ({new.sql_query()})) AS new ON {matched} "
+        f"WHERE {old_missing} OR {new_missing} OR {changed}"
+    )
+
+
+def diff_counts(diff: duckdb.DuckDBPyRelation) -> Dict[str, int]:
+    """
+    Count the rows of a diff by change.
+
+    Args:
+        diff (duckdb.DuckDBPyRelation): The diff, as built by `diff_query`.
+
+    Returns:
+        dict: The number of added, removed and changed rows.
+    """
+    counts = dict(diff.aggregate(f"{CHANGE_COLUMN}, COUNT(*)", CHANGE_COLUMN).fetchall())
+    return {change: counts.get(change, 0) for change in CHANGES}
+
+
+def format_counts(counts: Dict[str, int]) -> str:
+    """
+    Format the counts of a diff for the status bar.
+    """
+    return ", ".join(f"{count} {change}" for change, count in counts.items())
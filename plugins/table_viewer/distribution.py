@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+import duckdb
+
+from .helpers import quote_identifier
+from .query import FLOAT_TYPES, INTEGER_TYPES
+
+HISTOGRAM_BINS = 20
+TOP_VALUES = 20
+NUMERIC_TYPES = INTEGER_TYPES + FLOAT_TYPES + ("decimal",)
+TEMPORAL_TYPES = ("date", "timestamp", "timestamp_s", "timestamp_ms", "timestamp_ns", "timestamp with time zone")
+
+
+def is_binned(column_type: duckdb.typing.DuckDBPyType) -> bool:
+    """
+    Check whether the distribution of a column is shown as a histogram rather than as its most frequent values.
+    """
+    return column_type.id in NUMERIC_TYPES or column_type.id in TEMPORAL_TYPES
+
+
+def histogram(connection: duckdb.DuckDBPyConnection, query: str, column: str, column_type: duckdb.typing.DuckDBPyType,
+              bins: int = HISTOGRAM_BINS) -> List[Tuple[str, int]]:
+    """
+    Calculate a histogram of a numeric or temporal column with equal width bins.
+
+    The bounds and the bin counts are calculated by DuckDB in a single query, so no values are fetched. Dates and
+    timestamps are binned on their epoch.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to run the query on.
+        query (str): The query for the relation the column belongs to.
+        column (str): The column.
+        column_type (DuckDBPyType): The DuckDB type of the column.
+        bins (int): The number of bins.
+
+    Returns:
+        list: The label and the number of values of each bin, including empty bins.
+    """
+    temporal = column_type.id in TEMPORAL_TYPES
+    value = f"epoch({quote_identifier(column)})" if temporal else f"CAST({quote_identifier(column)} AS DOUBLE)"
+    rows = connection.sql(
+        f"WITH source AS (SELECT {value} AS value FROM ({query}) WHERE {quote_identifier(column)} IS NOT NULL), "
+        f"bounds AS (SELECT MIN(value) AS low, MAX(value) AS high FROM source) "
+        f"SELECT ANY_VALUE(low), ANY_VALUE(high), "
+        f"LEAST(CAST(FLOOR((value - low) / GREATEST((high - low) / {bins}, 1e-9)) AS BIGINT), {bins - 1}) AS bin, "
+        f"COUNT(*) FROM source, bounds GROUP BY bin ORDER BY bin"
+    ).fetchall()
+    if not rows:
+        return []
+
+    low, high = rows[0][0], rows[0][1]
+    counts = {row[2]: row[3] for row in rows}
+    width = (high - low) / bins
+    if width == 0:
+        return [(format_bound(low, temporal), counts[0])]
+
+    return [
+        (f"{format_bound(low + width * i, temporal)} - {format_bound(low + width * (i + 1), temporal)}", counts.get(i, 0))
+        for i in range(bins)
+    ]
+
+
+def format_bound(value: float, temporal: bool) -> str:
+    """
+    Format the bound of a histogram bin.
+    """
+    if temporal:
+        return datetime.fromtimestamp(value, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return f"{value:.6g}"
+
+
+def top_values(connection: duckdb.DuckDBPyConnection, query: str, column: str,
+               limit: int = TOP_VALUES) -> List[Tuple[str, int]]:
+    """
+    Find the most frequent values of a column.
+
+    The values are counted exactly with a hash aggregate, which holds one count per distinct value, and the most
+    frequent ones are kept with a top-N. On a column with many distinct values the aggregate can grow large, and
+    DuckDB spills it to disk when it does not fit in its memory limit.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to run the query on.
+        query (str): The query for the relation the column belongs to.
+        column (str): The column.
+        limit (int): The number of values to return.
+
+    Returns:
+        list: The most frequent values, as text, with their number of occurrences. NULL is counted as a value.
+    """
+    return connection.sql(
+        f"SELECT CAST({quote_identifier(column)} AS VARCHAR) AS value, COUNT(*) AS occurrences FROM ({query}) "
+        f"GROUP BY ALL ORDER BY occurrences DESC, value LIMIT {limit}"
+    ).fetchall()
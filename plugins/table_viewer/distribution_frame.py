@@ -0,0 +1,147 @@
+import threading
+from typing import TYPE_CHECKING, Hashable, List, Tuple
+
+import duckdb
+import wx
+import wx.grid
+
+from .components.mixins import SetFontMixin
+from .distribution import histogram, is_binned, top_values
+from .helpers import status_message
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+
+class BarChart(wx.Panel):
+    """
+    A horizontal bar chart of labelled counts, used for both histograms and value frequencies.
+
+    Attributes:
+        BAR_HEIGHT (int): The height of a bar.
+        LABEL_WIDTH (int): The width reserved for the labels.
+        bars (list): The label and count of each bar.
+    """
+    BAR_HEIGHT = 18
+    LABEL_WIDTH = 280
+
+    def __init__(self, parent: wx.Window) -> None:
+        super().__init__(parent)
+        self.bars = []
+        self.SetBackgroundStyle(wx.BG_STYLE_PAINT)
+        self.Bind(wx.EVT_PAINT, self.on_paint)
+        self.Bind(wx.EVT_SIZE, lambda event: self.Refresh())
+
+    def set_bars(self, bars: List[Tuple[str, int]]) -> None:
+        self.bars = bars
+        self.SetMinSize(wx.Size(-1, len(bars) * self.BAR_HEIGHT))
+        self.Refresh()
+
+    def on_paint(self, event: wx.PaintEvent) -> None:
+        dc = wx.AutoBufferedPaintDC(self)
+        dc.SetBackground(wx.Brush(self.GetBackgroundColour()))
+        dc.Clear()
+        if not self.bars:
+            return
+
+        dc.SetFont(self.GetFont())
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.SetBrush(wx.Brush(wx.SystemSettings.GetColour(wx.SYS_COLOUR_HIGHLIGHT)))
+        largest = max(count for _, count in self.bars) or 1
+        width = max(self.GetClientSize().GetWidth() - self.LABEL_WIDTH - 80, 1)
+        for i, (label, count) in enumerate(self.bars):
+            y = i * self.BAR_HEIGHT
+            dc.DrawText("NULL" if label is None else str(label)[:40], 2, y + 2)
+            dc.DrawRectangle(self.LABEL_WIDTH, y + 2, int(width * count / largest), self.BAR_HEIGHT - 4)
+            dc.DrawText(str(count), self.LABEL_WIDTH + int(width * count / largest) + 4, y + 2)
+
+
+class DistributionFrame(SetFontMixin, wx.Frame):
+    """
+    The drill-down view of a single column in the Table Viewer.
+
+    Numeric, date and timestamp columns are shown as a histogram, other columns as their most frequent values. The
+    distribution is calculated by one aggregate query in the background, and cached by the column overview per view,
+    column and file fingerprint, so opening the same column again is instant.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        chart (BarChart): The chart of the distribution.
+        summary_label (wx.StaticText): The kind of distribution shown.
+    """
+
+    def __init__(self, tv: "TableViewer", column: str) -> None:
+        """
+        Initialize the Distribution Frame.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+            column (str): The column to show the distribution of.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title=f"{column} - {tv.view}", size=(700, 500))
+        self.__plugin = tv
+        self.set_font()
+
+        panel = wx.ScrolledWindow(self)
+        panel.SetScrollRate(0, BarChart.BAR_HEIGHT)
+        panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.summary_label = wx.StaticText(panel, label="Calculating...")
+        panel.GetSizer().Add(self.summary_label, 0, wx.EXPAND | wx.ALL, 5)
+        self.chart = BarChart(panel)
+        panel.GetSizer().Add(self.chart, 1, wx.EXPAND | wx.ALL, 5)
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        return self.__plugin.status_bar
+
+    def load(self, column: str, column_type: duckdb.typing.DuckDBPyType, key: Hashable) -> None:
+        """
+        Show the distribution of a column, from the cache or calculated in the background.
+
+        Args:
+            column (str): The column.
+            column_type (DuckDBPyType): The DuckDB type of the column.
+            key (Hashable): The cache key of the distribution.
+        """
+        cached = self.__plugin.column_overview.distributions.get(key)
+        if cached is not None:
+            self.show(cached)
+            return
+
+        load_thread = threading.Thread(
+            target=self.load_thread,
+            args=(self.__plugin.cursor(), self.__plugin.grid.df.sql_query(), column, column_type, key),
+            daemon=True
+        )
+        load_thread.start()
+
+    @status_message("Calculating distribution", 1)
+    def load_thread(self, cursor: duckdb.DuckDBPyConnection, query: str, column: str,
+                    column_type: duckdb.typing.DuckDBPyType, key: Hashable) -> bool:
+        try:
+            if is_binned(column_type):
+                bars = histogram(cursor, query, column, column_type)
+                distribution = {"title": f"Histogram of {column}", "bars": bars}
+            else:
+                distribution = {"title": f"Most frequent values of {column}", "bars": top_values(cursor, query, column)}
+        except duckdb.Error as e:
+            self.__plugin.logger.getChild("distribution").error(f"Error calculating the distribution of {column}: {e}")
+            wx.CallAfter(self.show_error, str(e))
+            return False
+        self.__plugin.column_overview.distributions.put(key, distribution)
+        wx.CallAfter(self.show, distribution)
+        return True
+
+    def show_error(self, message: str) -> None:
+        """
+        Show why the distribution could not be calculated.
+        """
+        if self:
+            self.summary_label.SetLabel(f"Unable to calculate the distribution: {message}")
+
+    def show(self, distribution: dict) -> None:
+        if not self:
+            return
+        self.summary_label.SetLabel(distribution["title"] if distribution["bars"] else "The column has no values")
+        self.chart.set_bars(distribution["bars"])
+        self.Layout()
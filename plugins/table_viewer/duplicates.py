@@ -0,0 +1,62 @@
+from typing import Dict, Sequence
+
+import duckdb
+
+from .helpers import quote_identifier
+from .query import equals_predicate
+
+DUPLICATES_TABLE = "table_viewer_duplicates"
+GROUP_SIZE = "group_size"
+MAX_GROUPS = 1000
+
+
+def duplicate_groups(relation: duckdb.DuckDBPyRelation, columns: Sequence[str]) -> duckdb.DuckDBPyRelation:
+    """
+    Find the groups of rows that share the same values in a set of columns.
+
+    The rows are grouped on the values of the columns by DuckDB's hash aggregate, which compares the values and not
+    only their hashes, so keys whose hashes collide are never reported as duplicates. The hash table spills to the
+    temporary directory when it does not fit in the memory limit, so files larger than memory can be checked.
+
+    Args:
+        relation (duckdb.DuckDBPyRelation): The relation to check.
+        columns (Sequence[str]): The columns that make up the key.
+
+    Returns:
+        duckdb.DuckDBPyRelation: One row per group of duplicates, with the number of rows in the group and the values
+            of the key, largest groups first.
+    """
+    keys = ", ".join(quote_identifier(column) for column in columns)
+    return relation.aggregate(f"COUNT(*) AS {GROUP_SIZE}, {keys}", keys).filter(f"{GROUP_SIZE} > 1").order(
+        f"{GROUP_SIZE} DESC, {keys}"
+    )
+
+
+def duplicate_summary(groups: duckdb.DuckDBPyRelation) -> Dict[str, int]:
+    """
+    Summarize the groups of duplicates.
+
+    Args:
+        groups (duckdb.DuckDBPyRelation): The groups, as returned by `duplicate_groups`.
+
+    Returns:
+        dict: The number of groups, the number of rows in them, and the number of rows that are extra copies.
+    """
+    group_count, rows = groups.aggregate(f"COUNT(*), COALESCE(SUM({GROUP_SIZE}), 0)").fetchone()
+    return {"groups": group_count, "rows": int(rows), "extra": int(rows) - group_count}
+
+
+def member_predicate(relation: duckdb.DuckDBPyRelation, columns: Sequence[str], values: Sequence[object]) -> str:
+    """
+    Build the filter selecting the members of a group, the rows holding the values of its key.
+
+    Args:
+        relation (duckdb.DuckDBPyRelation): The relation the group was found in.
+        columns (Sequence[str]): The columns that make up the key.
+        values (Sequence[object]): The values of the key, as returned by DuckDB.
+
+    Returns:
+        str: The filter, matching NULL values of the key as well.
+    """
+    types = dict(zip(relation.columns, relation.types))
+    return " AND ".join(equals_predicate(column, types[column], value) for column, value in zip(columns, values))
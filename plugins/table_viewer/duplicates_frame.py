@@ -0,0 +1,159 @@
+import threading
+from typing import TYPE_CHECKING, List
+
+import duckdb
+import wx
+import wx.grid
+
+from .components.button import PVButton
+from .components.mixins import SetFontMixin
+from .duplicates import DUPLICATES_TABLE, GROUP_SIZE, MAX_GROUPS, duplicate_groups, duplicate_summary
+from .helpers import status_message
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+
+class DuplicatesFrame(SetFontMixin, wx.Frame):
+    """
+    The duplicates tool for the Table Viewer.
+
+    The user picks the columns that should be unique, or none to look for duplicate rows. The groups of rows sharing the
+    same values are found in the background and listed largest first, with their size. Double-clicking a group shows
+    its rows in the grid.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __view (str): The view the duplicates are looked for in.
+        __columns (list): The key columns of the groups shown.
+        __keys (list): The values of the key of each group shown.
+        column_list (wx.CheckListBox): The columns to check.
+        summary_label (wx.StaticText): The number of groups and duplicated rows.
+        groups_grid (wx.grid.Grid): The groups of duplicates.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the Duplicates Frame.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title=f"Duplicates - {tv.view}", size=(800, 500))
+        self.__plugin = tv
+        self.__view = tv.view
+        self.__columns = []
+        self.__keys = []
+        self.set_font()
+
+        panel = wx.Panel(self)
+        panel.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+
+        controls = wx.Panel(panel)
+        controls.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        controls.GetSizer().Add(wx.StaticText(controls, label="Key columns (none for whole rows)"), 0, wx.ALL, 5)
+        self.column_list = wx.CheckListBox(controls, choices=list(tv.grid.df.columns))
+        controls.GetSizer().Add(self.column_list, 1, wx.EXPAND | wx.ALL, 5)
+        PVButton(controls, "Find", self.on_find)
+        panel.GetSizer().Add(controls, 1, wx.EXPAND)
+
+        results = wx.Panel(panel)
+        results.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.summary_label = wx.StaticText(results, label="No check run yet")
+        results.GetSizer().Add(self.summary_label, 0, wx.EXPAND | wx.ALL, 5)
+        self.groups_grid = wx.grid.Grid(results)
+        self.groups_grid.CreateGrid(0, 1)
+        self.groups_grid.EnableEditing(False)
+        self.groups_grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.on_group_open)
+        results.GetSizer().Add(self.groups_grid, 1, wx.EXPAND)
+        panel.GetSizer().Add(results, 2, wx.EXPAND)
+
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        return self.__plugin.status_bar
+
+    def on_find(self, event: wx.CommandEvent) -> bool:
+        """
+        Start looking for duplicates over the checked columns in the background.
+        """
+        columns = list(self.column_list.GetCheckedStrings()) or list(self.__plugin.grid.df.columns)
+        self.summary_label.SetLabel("Looking for duplicates...")
+
+        find_thread = threading.Thread(
+            target=self.find_thread,
+            args=(self.__plugin.cursor(), self.__plugin.grid.df.sql_query(), columns),
+            daemon=True
+        )
+        find_thread.start()
+        return True
+
+    @status_message("Looking for duplicates", 1)
+    def find_thread(self, cursor: duckdb.DuckDBPyConnection, query: str, columns: List[str]) -> bool:
+        """
+        Find the groups of duplicates.
+
+        Args:
+            cursor (duckdb.DuckDBPyConnection): The cursor to run the query on.
+            query (str): The query for the relation shown in the grid.
+            columns (list): The key columns.
+        """
+        # The groups are kept in a table local to the cursor, so the summary and the largest groups are read without
+        # grouping again
+        try:
+            groups = duplicate_groups(cursor.sql(query), columns)
+            cursor.execute(f"CREATE OR REPLACE TEMP TABLE {DUPLICATES_TABLE} AS {groups.sql_query()}")
+            groups = cursor.table(DUPLICATES_TABLE)
+            summary = duplicate_summary(groups)
+            rows = groups.limit(MAX_GROUPS).fetchall()
+        except duckdb.Error as e:
+            wx.CallAfter(self.show_error, str(e))
+            return False
+        wx.CallAfter(self.show_groups, columns, summary, rows)
+        return True
+
+    def show_error(self, message: str) -> None:
+        """
+        Show why the duplicates could not be found.
+        """
+        if self:
+            self.summary_label.SetLabel(f"Unable to look for duplicates: {message}")
+
+    def show_groups(self, columns: List[str], summary: dict, rows: list) -> None:
+        """
+        Show the groups of duplicates that were found.
+        """
+        self.__columns = columns
+        self.__keys = [row[1:] for row in rows]
+        self.summary_label.SetLabel(
+            f"{summary['groups']} groups with {summary['rows']} rows, {summary['extra']} of them extra copies"
+            + (f" (largest {MAX_GROUPS} groups shown)" if summary["groups"] > MAX_GROUPS else "")
+        )
+
+        self.groups_grid.ClearGrid()
+        if self.groups_grid.GetNumberRows():
+            self.groups_grid.DeleteRows(0, self.groups_grid.GetNumberRows())
+        if self.groups_grid.GetNumberCols():
+            self.groups_grid.DeleteCols(0, self.groups_grid.GetNumberCols())
+        self.groups_grid.AppendCols(len(columns) + 1)
+        self.groups_grid.AppendRows(len(rows))
+
+        self.groups_grid.SetColLabelValue(0, GROUP_SIZE)
+        for j, column in enumerate(columns):
+            self.groups_grid.SetColLabelValue(j + 1, column)
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                self.groups_grid.SetCellValue(i, j, "" if value is None else str(value))
+        self.groups_grid.AutoSize()
+        self.Layout()
+
+    def on_group_open(self, event: wx.grid.GridEvent) -> bool:
+        if self.__plugin.view != self.__view:
+            wx.MessageBox("The grid no longer shows the data the duplicates were found in", "Duplicates", wx.OK | wx.ICON_INFORMATION)
+            return False
+        return self.__plugin.show_duplicates(self.__columns, self.__keys[event.GetRow()])
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        self.__plugin.duplicates = None
+        event.Skip()
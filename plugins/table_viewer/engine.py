@@ -0,0 +1,340 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import duckdb
+
+from .arrow import arrow_view_name, open_arrow
+from .dataset import dataset_files, dataset_query, detect_format, split_suffix
+from .parquet import row_group_pruning
+from .profile import (
+    PROFILE_CHUNK_ROWS, estimate_change, format_progress, profile_passes, profile_query, profile_ratios, profile_rows
+)
+from .query import quote_literal, search_predicate
+
+EXPORT_FORMATS = {
+    ".parquet": "(FORMAT parquet)",
+    ".csv": "(FORMAT csv, HEADER true)",
+    ".tsv": "(FORMAT csv, HEADER true, DELIMITER '\t')",
+    ".json": "(FORMAT json)",
+    ".jsonl": "(FORMAT json)",
+    ".ndjson": "(FORMAT json)",
+}
+
+
+class Session:
+    """
+    The headless data engine of the Table Viewer.
+
+    A session owns the DuckDB connection all datasets are read through, configured from the Table Viewer settings: the
+    memory limit, the number of threads, and the directory large joins and groupings spill to instead of failing.
+    Memory-mapped Arrow files are registered on the connection once and shared by every dataset that reads them.
+
+    The session does not depend on wx, so the same data path the Table Viewer uses can be scripted, tested and
+    benchmarked without a display. The plugin is a view over a session.
+
+    Attributes:
+        settings (dict): The Table Viewer settings.
+        connection (duckdb.DuckDBPyConnection): The connection all datasets are read through.
+        arrow_tables (dict): The memory-mapped Arrow tables, keyed by the name of the view they are registered under.
+    """
+
+    def __init__(self, settings: dict = None) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            settings (dict): The Table Viewer settings.
+        """
+        self.settings = {}
+        self.connection = duckdb.connect()
+        self.connection.execute("SET enable_object_cache = true")
+        self.arrow_tables = {}
+        self.configure(settings or {})
+
+    def configure(self, settings: dict) -> None:
+        """
+        Apply the Table Viewer settings to the connection.
+
+        Args:
+            settings (dict): The Table Viewer settings.
+        """
+        self.settings = settings
+        memory_limit = settings.get("memory_limit")
+        if memory_limit:
+            self.connection.execute(f"SET memory_limit = '{memory_limit}'")
+        threads = settings.get("threads")
+        if threads:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        # Large joins and groupings spill to this directory instead of failing when they exceed the memory limit
+        temp_directory = settings.get("temp_directory") or os.path.join(tempfile.gettempdir(), "table_viewer")
+        self.connection.execute(f"SET temp_directory = {quote_literal(temp_directory)}")
+
+    def register_arrow(self, path: str):
+        """
+        Register a memory-mapped Arrow file with DuckDB, unless it is registered already.
+
+        Args:
+            path (str): The path of the Arrow file.
+
+        Returns:
+            pyarrow.Table: The table backed by the memory-mapped file.
+        """
+        name = arrow_view_name(path)
+        if name not in self.arrow_tables:
+            self.arrow_tables[name] = open_arrow(path)
+            self.connection.register(name, self.arrow_tables[name])
+        return self.arrow_tables[name]
+
+    def unregister_arrow(self, path: str) -> bool:
+        """
+        Drop the registration of an Arrow file, releasing its memory map.
+
+        Returns:
+            bool: True if the file was registered.
+        """
+        name = arrow_view_name(path)
+        if self.arrow_tables.pop(name, None) is None:
+            return False
+        self.connection.unregister(name)
+        return True
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Get a new cursor on the connection, for queries that run in a background thread.
+
+        Views over Python objects, such as memory-mapped Arrow tables, only exist on the connection they were
+        registered on, so they are registered on the cursor as well.
+
+        Returns:
+            duckdb.DuckDBPyConnection: The cursor.
+        """
+        cursor = self.connection.cursor()
+        for name, table in self.arrow_tables.items():
+            cursor.register(name, table)
+        return cursor
+
+    def open(self, path: str) -> "Dataset":
+        """
+        Open a file, a directory or a glob pattern as a dataset.
+
+        Args:
+            path (str): The path of a file or directory, or a glob pattern.
+
+        Returns:
+            Dataset: The dataset.
+
+        Raises:
+            duckdb.Error: If the files cannot be read.
+            ImportError: If the file is an Arrow file and pyarrow is not installed.
+        """
+        arrow_table = self.register_arrow(path) if split_suffix(path)[0] == "arrow" else None
+        return Dataset(self.connection, self.connection.sql(dataset_query(path)), path, arrow_table)
+
+
+class Dataset:
+    """
+    A relation read through a session, with the operations of the Table Viewer on it.
+
+    Every operation runs on the connection the dataset was created with, so a dataset for a background thread is
+    created on a cursor of the session. Long operations report their progress through a callback and can be cancelled
+    from another thread with `cancel`, which also interrupts the query that is running.
+
+    Attributes:
+        connection (duckdb.DuckDBPyConnection): The connection the dataset is read through.
+        relation (duckdb.DuckDBPyRelation): The rows of the dataset.
+        path (str): The path the dataset was opened from, or None for a derived relation such as a sample.
+        arrow_table (pyarrow.Table): The memory-mapped Arrow table the dataset reads from, if any.
+        cancelled (threading.Event): Set when the running operation is cancelled.
+        __row_count (int): The cached number of rows.
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection, relation: duckdb.DuckDBPyRelation, path: str = None,
+                 arrow_table=None, row_count: int = None) -> None:
+        """
+        Initialize the dataset.
+
+        Args:
+            connection (duckdb.DuckDBPyConnection): The connection the dataset is read through.
+            relation (duckdb.DuckDBPyRelation): The rows of the dataset.
+            path (str): The path the dataset was opened from, if any.
+            arrow_table (pyarrow.Table): The memory-mapped Arrow table the relation reads from, if any.
+            row_count (int): The number of rows, when it is known already.
+        """
+        self.connection = connection
+        self.relation = relation
+        self.path = path
+        self.arrow_table = arrow_table
+        self.cancelled = threading.Event()
+        self.__row_count = row_count
+
+    @classmethod
+    def from_query(cls, connection: duckdb.DuckDBPyConnection, query: str, path: str = None,
+                   row_count: int = None) -> "Dataset":
+        """
+        Create a dataset from the query of a relation, e.g. to work on it from a cursor in another thread.
+        """
+        return cls(connection, connection.sql(query), path, row_count=row_count)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.relation.columns)
+
+    @property
+    def types(self) -> List[duckdb.typing.DuckDBPyType]:
+        return list(self.relation.types)
+
+    @property
+    def files(self) -> Tuple[str, ...]:
+        """
+        Get the files the dataset was opened from.
+        """
+        return dataset_files(self.path) if self.path else ()
+
+    def cancel(self) -> None:
+        """
+        Cancel the running operation, interrupting its query.
+        """
+        self.cancelled.set()
+        self.connection.interrupt()
+
+    def row_count(self) -> int:
+        """
+        Count the rows of the dataset. The count is cached.
+        """
+        if self.__row_count is None:
+            self.__row_count = self.connection.sql(f"SELECT COUNT(*) FROM ({self.relation.sql_query()})").fetchone()[0]
+        return self.__row_count
+
+    def page_relation(self, offset: int, limit: int) -> duckdb.DuckDBPyRelation:
+        """
+        Get the relation holding a page of rows.
+
+        Arrow files are sliced without copying instead of scanning up to the offset.
+
+        Args:
+            offset (int): The row offset of the page.
+            limit (int): The number of rows in the page.
+
+        Returns:
+            duckdb.DuckDBPyRelation: The rows of the page.
+        """
+        if self.arrow_table is not None:
+            return self.connection.from_arrow(self.arrow_table.slice(offset, limit))
+        return self.relation.limit(limit, offset=offset)
+
+    def page(self, offset: int, limit: int, columns: Sequence[str] = None) -> List[tuple]:
+        """
+        Read a page of rows.
+
+        Args:
+            offset (int): The row offset of the page.
+            limit (int): The number of rows in the page.
+            columns (Sequence[str]): The columns to read, or None for all columns.
+
+        Returns:
+            list: The rows of the page.
+        """
+        page = self.page_relation(offset, limit)
+        if columns is not None:
+            page = page.select(*columns)
+        return page.fetchall()
+
+    def search(self, column: str, search: str, style: str = "Exact", filters: Sequence[str] = ()) -> "Dataset":
+        """
+        Select the rows matching a search, combined with other filters.
+
+        The search and the filters are combined into a single filter, so DuckDB can push it down into the scan.
+
+        Args:
+            column (str): The column to search in.
+            search (str): The value to search for.
+            style (str): The search style, one of `query.SEARCH_STYLES`.
+            filters (Sequence[str]): Other filters the rows have to match.
+
+        Returns:
+            Dataset: The matching rows.
+        """
+        column_type = self.types[self.columns.index(column)]
+        predicates = [search_predicate(column, column_type, search, style), *filters]
+        return Dataset(self.connection, self.relation.filter(" AND ".join(f"({predicate})" for predicate in predicates)))
+
+    def pruning(self, column: str, search: str, style: str = "Exact") -> Optional[Dict[str, int]]:
+        """
+        Report how many Parquet row groups a search can skip using their statistics.
+
+        Returns:
+            dict: The report of `parquet.row_group_pruning`, or None if the dataset was not opened from Parquet files.
+        """
+        if not self.path or detect_format(self.path) != "parquet":
+            return None
+        column_type = self.types[self.columns.index(column)]
+        return row_group_pruning(self.connection, self.files, column, column_type, search, style)
+
+    def profile(self, on_progress: Callable[[List[Tuple[str, ...]], str], None] = None,
+                chunk_rows: int = PROFILE_CHUNK_ROWS,
+                total_rows: Callable[[], Optional[int]] = None) -> Tuple[List[Tuple[str, ...]], bool]:
+        """
+        Profile all columns progressively.
+
+        Each pass profiles all columns in a single scan over the first rows of the data, twice as many rows as the
+        previous pass, until a pass reaches the end of the data or the profile is cancelled. The number of rows is not
+        counted up front, so the first results do not wait for a full scan of the data. Until the last pass, the results
+        are the statistics of the first rows only, and the progress says so. When the rows are counted
+        elsewhere at the same time, e.g. by the grid, `total_rows` reads the count, and it is read again for every
+        pass, so the progress shows the total as soon as it is known.
+
+        Args:
+            on_progress (Callable): Called after each pass with the rows of the profile so far, in the order of
+                `profile.PROFILE_COLUMNS`, and a description of the progress and confidence.
+            chunk_rows (int): The number of rows profiled by the first pass.
+            total_rows (Callable): Returns the number of rows, or None while they are not counted yet. Defaults to the
+                count given when the dataset was created.
+
+        Returns:
+            tuple: The rows of the last finished pass, and whether all rows were profiled.
+        """
+        query = self.relation.sql_query()
+        rows, previous = [], None
+        for rows_to_check in profile_passes(chunk_rows):
+            if self.cancelled.is_set():
+                return rows, False
+            try:
+                result = self.connection.sql(profile_query(query, self.columns, self.types, rows_to_check)).fetchone()
+            except duckdb.InterruptException:
+                return rows, False
+
+            ratios = profile_ratios(result, self.columns)
+            complete = result[0] < rows_to_check
+            rows = profile_rows(result, self.columns)
+            if on_progress is not None:
+                if complete:
+                    total = result[0]
+                else:
+                    total = total_rows() if total_rows is not None else self.__row_count
+                on_progress(rows, format_progress(result[0], total, estimate_change(previous, ratios), complete))
+            if complete:
+                return rows, True
+            previous = ratios
+
+    def export(self, path: str) -> int:
+        """
+        Write the dataset to a file, in the format given by its suffix.
+
+        Args:
+            path (str): The path of the file, ending in one of the suffixes in `EXPORT_FORMATS`.
+
+        Returns:
+            int: The number of rows written.
+
+        Raises:
+            ValueError: If the suffix is not a supported export format.
+        """
+        options = EXPORT_FORMATS.get(Path(path).suffix.lower())
+        if options is None:
+            raise ValueError(f"Unsupported export format: {Path(path).suffix or path}")
+        return self.connection.execute(
+            f"COPY ({self.relation.sql_query()}) TO {quote_literal(path)} {options}"
+        ).fetchone()[0]
@@ -0,0 +1,89 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Sequence
+
+import duckdb
+
+from .dataset import file_query, split_suffix
+from .parquet import row_group_pruning
+from .query import search_predicate
+
+SEARCHABLE_FORMATS = ("parquet", "csv", "json")
+SEARCH_WORKERS = 4
+
+
+def search_file(connection: duckdb.DuckDBPyConnection, file: str, column: str, search: str,
+                style: str = "Exact") -> Dict[str, object]:
+    """
+    Count the rows of a single file that match a search.
+
+    Parquet files whose statistics rule out a match in every row group are skipped without reading any data, and
+    files without the searched column are skipped without scanning.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to run the queries on.
+        file (str): The path of the file.
+        column (str): The column to search in.
+        search (str): The value to search for.
+        style (str): The search style, one of `query.SEARCH_STYLES`.
+
+    Returns:
+        dict: The file, the outcome (`match`, `no match`, `pruned` or `no column`) and the number of matching rows.
+    """
+    relation = connection.sql(file_query(file))
+    if column not in relation.columns:
+        return {"file": file, "outcome": "no column", "hits": 0}
+
+    column_type = relation.types[relation.columns.index(column)]
+    if split_suffix(file)[0] == "parquet":
+        report = row_group_pruning(connection, [file], column, column_type, search, style)
+        if report["total"] and not report["scanned"]:
+            return {"file": file, "outcome": "pruned", "hits": 0}
+
+    hits = relation.filter(search_predicate(column, column_type, search, style)).aggregate("COUNT(*)").fetchone()[0]
+    return {"file": file, "outcome": "match" if hits else "no match", "hits": hits}
+
+
+def search_files(connection: duckdb.DuckDBPyConnection, files: Sequence[str], column: str, search: str, style: str,
+                 on_result: Callable[[Dict[str, object]], None], cancelled: threading.Event = None,
+                 workers: int = SEARCH_WORKERS) -> int:
+    """
+    Search many files at once with a bounded pool of workers.
+
+    Every worker runs its searches on its own cursor, and each result is handed to `on_result` as soon as its file is
+    done, so the results stream in while the other files are still being searched. Files in a format that cannot be
+    searched on its own (Arrow, DuckDB and SQLite files) are left out. A file that cannot be read is reported with the
+    outcome `error`.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to create the cursors from.
+        files (Sequence[str]): The paths of the files.
+        column (str): The column to search in.
+        search (str): The value to search for.
+        style (str): The search style, one of `query.SEARCH_STYLES`.
+        on_result (Callable): Called with the result of every file, on the calling thread.
+        cancelled (threading.Event): Set to stop the search; files that have not started yet are not searched.
+        workers (int): The number of files searched at the same time.
+
+    Returns:
+        int: The number of files searched.
+    """
+    cancelled = cancelled or threading.Event()
+    files = [file for file in files if split_suffix(file)[0] in SEARCHABLE_FORMATS]
+
+    def search_one(file: str) -> Dict[str, object]:
+        if cancelled.is_set():
+            return None
+        try:
+            return search_file(connection.cursor(), file, column, search, style)
+        except duckdb.Error as e:
+            return {"file": file, "outcome": "error", "hits": 0, "error": str(e)}
+
+    searched = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in as_completed([executor.submit(search_one, file) for file in files]):
+            result = future.result()
+            if result is not None:
+                searched += 1
+                on_result(result)
+    return searched
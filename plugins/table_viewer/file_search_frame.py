@@ -0,0 +1,195 @@
+import threading
+from typing import TYPE_CHECKING, Dict, List
+
+import wx
+
+from .components.button import PVButton
+from .components.mixins import SetFontMixin
+from .components.textcntrl import TVTextCntrl
+from .dataset import list_files
+from .file_search import SEARCH_WORKERS, search_files
+from .helpers import status_message
+from .query import SEARCH_STYLES
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+
+class FileSearchFrame(SetFontMixin, wx.Frame):
+    """
+    The directory search tool for the Table Viewer.
+
+    The user picks a directory, a column and a value, and every data file in the directory is searched for it, with
+    the same filter as the search in the grid. The files are searched by a bounded pool of workers in the background,
+    Parquet files whose statistics rule out a match are skipped without reading their data, and the matching files
+    are listed with their number of hits as soon as each file is done. Files that could not be searched are listed
+    with their error. Double-clicking a matching file opens it in a new tab with the search applied.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __cancelled (threading.Event): Set to stop the running search.
+        __hits (list): The results listed, for the matching files and the files that could not be searched.
+        __search (tuple): The column, value and style of the search listed.
+        directory_input (TVTextCntrl): The directory to search.
+        column_input (TVTextCntrl): The column to search in.
+        value_input (TVTextCntrl): The value to search for.
+        style_choice (wx.Choice): The search style.
+        summary_label (wx.StaticText): The progress of the search.
+        result_list (wx.ListCtrl): The matching files and their number of hits, or the error of a failed file.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the File Search Frame.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title="Search Files", size=(800, 600))
+        self.__plugin = tv
+        self.__cancelled = threading.Event()
+        self.__hits = []
+        self.__search = None
+        self.set_font()
+
+        panel = wx.Panel(self)
+        panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+
+        inputs = wx.Panel(panel)
+        inputs.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+        self.directory_input = TVTextCntrl(inputs)
+        self.directory_input.SetHint("Directory or glob pattern")
+        PVButton(inputs, "Browse", self.on_browse)
+        self.column_input = TVTextCntrl(inputs)
+        self.column_input.SetHint("Column")
+        self.value_input = TVTextCntrl(inputs)
+        self.value_input.SetHint("Value")
+        self.value_input.Bind(wx.EVT_TEXT_ENTER, self.on_search)
+        self.style_choice = wx.Choice(inputs, choices=list(SEARCH_STYLES))
+        self.style_choice.SetSelection(0)
+        inputs.GetSizer().Add(self.style_choice, 0, wx.EXPAND)
+        PVButton(inputs, "Search", self.on_search)
+        PVButton(inputs, "Stop", self.on_stop)
+        panel.GetSizer().Add(inputs, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.summary_label = wx.StaticText(panel, label="No search run yet")
+        panel.GetSizer().Add(self.summary_label, 0, wx.EXPAND | wx.ALL, 5)
+        self.result_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        self.result_list.InsertColumn(0, "File", width=600)
+        self.result_list.InsertColumn(1, "Hits", width=100)
+        self.result_list.Bind(wx.EVT_LIST_ITEM_ACTIVATED, self.on_hit_open)
+        panel.GetSizer().Add(self.result_list, 1, wx.EXPAND)
+
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        return self.__plugin.status_bar
+
+    def on_browse(self, event: wx.CommandEvent) -> bool:
+        with wx.DirDialog(self, "Search Folder", style=wx.DD_DEFAULT_STYLE | wx.DD_DIR_MUST_EXIST) as dialog:
+            if dialog.ShowModal() == wx.ID_CANCEL:
+                return False
+            self.directory_input.SetValue(dialog.GetPath())
+        return True
+
+    def on_search(self, event: wx.CommandEvent) -> bool:
+        """
+        Start searching the files in the background.
+        """
+        directory = self.directory_input.GetValue().strip()
+        column = self.column_input.GetValue().strip()
+        if not directory or not column:
+            wx.MessageBox("Enter a directory and a column to search", "Search Files", wx.OK | wx.ICON_INFORMATION)
+            return False
+        try:
+            files = list_files(directory)
+        except OSError as e:
+            wx.MessageBox(f"Error listing files: {e}", "Search Files", wx.OK | wx.ICON_ERROR)
+            return False
+
+        self.__cancelled.set()
+        self.__cancelled = threading.Event()
+        self.__hits = []
+        self.__search = (column, self.value_input.GetValue(), self.style_choice.GetStringSelection())
+        self.result_list.DeleteAllItems()
+        self.summary_label.SetLabel(f"Searching {len(files)} files...")
+
+        search_thread = threading.Thread(
+            target=self.search_thread, args=(files, *self.__search, self.__cancelled), daemon=True
+        )
+        search_thread.start()
+        return True
+
+    @status_message("Searching files", 1)
+    def search_thread(self, files: List[str], column: str, search: str, style: str,
+                      cancelled: threading.Event) -> bool:
+        """
+        Search the files, streaming the results to the result list.
+
+        Args:
+            files (list): The files to search.
+            column (str): The column to search in.
+            search (str): The value to search for.
+            style (str): The search style.
+            cancelled (threading.Event): Set to stop the search.
+        """
+        counts = {"searched": 0, "matched": 0, "pruned": 0, "failed": 0}
+
+        def on_result(result: Dict[str, object]) -> None:
+            counts["searched"] += 1
+            counts["matched"] += result["outcome"] == "match"
+            counts["pruned"] += result["outcome"] == "pruned"
+            counts["failed"] += result["outcome"] == "error"
+            wx.CallAfter(self.add_result, cancelled, result, dict(counts), len(files))
+
+        search_files(
+            self.__plugin.connection, files, column, search, style, on_result, cancelled,
+            self.__plugin.settings.get("search_workers", SEARCH_WORKERS)
+        )
+        return True
+
+    def add_result(self, cancelled: threading.Event, result: Dict[str, object], counts: Dict[str, int],
+                   total: int) -> None:
+        """
+        Update the progress, and list the file if it matches or could not be searched.
+        """
+        if not self or cancelled is not self.__cancelled:
+            return
+
+        self.summary_label.SetLabel(
+            f"{counts['searched']} of {total} files searched, {counts['matched']} matching, "
+            f"{counts['pruned']} skipped by Parquet statistics"
+            + (f", {counts['failed']} failed" if counts["failed"] else "")
+            + (", stopped" if cancelled.is_set() else "")
+        )
+        if result["outcome"] not in ("match", "error"):
+            return
+        self.__hits.append(result)
+        index = self.result_list.InsertItem(self.result_list.GetItemCount(), result["file"])
+        if result["outcome"] == "error":
+            self.result_list.SetItem(index, 1, f"Error: {result['error']}")
+        else:
+            self.result_list.SetItem(index, 1, str(result["hits"]))
+
+    def on_stop(self, event: wx.CommandEvent) -> bool:
+        self.__cancelled.set()
+        return True
+
+    def on_hit_open(self, event: wx.ListEvent) -> bool:
+        """
+        Open a matching file in the Table Viewer, with the search applied, or show why a file could not be searched.
+        """
+        result = self.__hits[event.GetIndex()]
+        if result["outcome"] == "error":
+            wx.MessageBox(result["error"], result["file"], wx.OK | wx.ICON_ERROR)
+            return False
+        if not self.__plugin.open_path(result["file"]):
+            return False
+        column, search, style = self.__search
+        return self.__plugin.search(column, search, style)
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        self.__cancelled.set()
+        self.__plugin.file_search = None
+        event.Skip()
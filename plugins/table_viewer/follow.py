@@ -0,0 +1,242 @@
+import logging
+import os
+import tempfile
+import threading
+from typing import Callable, List, Tuple
+
+import duckdb
+
+from .dataset import READERS, split_suffix
+from .helpers import quote_identifier
+from .ndjson import is_ndjson
+from .query import quote_literal
+
+FOLLOW_TABLE = "table_viewer_follow"
+# The part and the position within it of every row of a page that spans the file and the follow table
+PAGE_PART = "__follow_part"
+PAGE_ROW = "__follow_row"
+FOLLOW_FORMATS = (("csv", None), ("json", None))
+SCAN_BLOCK_SIZE = 16 * 1024 ** 2
+# Polls that fail in a row before following stops, so a line that is still being flushed can be retried
+MAX_POLL_ERRORS = 3
+
+
+def can_follow(path: str) -> bool:
+    """
+    Check whether a file can be followed. Only uncompressed CSV and newline-delimited JSON files can be appended to;
+    a JSON array cannot be parsed line by line.
+    """
+    if not os.path.isfile(path) or split_suffix(path) not in FOLLOW_FORMATS:
+        return False
+    return split_suffix(path)[0] != "json" or is_ndjson(path)
+
+
+def follow_page(connection: duckdb.DuckDBPyConnection, head_query: str, base_rows: int, offset: int,
+                limit: int) -> duckdb.DuckDBPyRelation:
+    """
+    Build the relation for a page of a followed file.
+
+    The rows that were in the file when following started are read from the file, the rows appended since then from
+    the follow table. A page at the end of the file therefore never has to scan the file up to its offset. A page
+    that spans both is sorted on the part each row comes from and its position within it, as a union of the two does
+    not keep their order.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection the follow table lives on.
+        head_query (str): The query reading the rows that were in the file when following started.
+        base_rows (int): The number of rows in the file when following started.
+        offset (int): The row offset of the page.
+        limit (int): The number of rows in the page.
+
+    Returns:
+        duckdb.DuckDBPyRelation: The relation holding the page.
+    """
+    tail = connection.table(FOLLOW_TABLE).order("rowid")
+    if offset >= base_rows:
+        return tail.limit(limit, offset=offset - base_rows)
+
+    head = connection.sql(head_query).limit(min(limit, base_rows - offset), offset=offset)
+    if offset + limit <= base_rows:
+        return head
+    return connection.sql(
+        f"SELECT * EXCLUDE ({PAGE_PART}, {PAGE_ROW}) FROM ("
+        f"SELECT 0 AS {PAGE_PART}, row_number() OVER () AS {PAGE_ROW}, * FROM ({head.sql_query()}) "
+        f"UNION ALL SELECT 1, rowid, * FROM {FOLLOW_TABLE} WHERE rowid < {offset + limit - base_rows}"
+        f") ORDER BY {PAGE_PART}, {PAGE_ROW}"
+    )
+
+
+class FileFollower(threading.Thread):
+    """
+    Follows a CSV or newline-delimited JSON file that is still being written.
+
+    The follower first counts the complete lines already in the file. After that it polls the size of the file, and
+    only the bytes appended since the last known offset, up to the last complete line, are parsed. The new rows are
+    parsed by DuckDB and inserted into the follow table, so the file is never read again from the start.
+
+    Attributes:
+        cursor (duckdb.DuckDBPyConnection): The cursor the follower runs its queries on.
+        path (str): The path of the followed file.
+        columns (list): The names and types of the columns of the file.
+        interval (float): The number of seconds between polls.
+        on_append (Callable): Called with the number of new rows after every poll that found new rows.
+        on_error (Callable): Called with the error if the file cannot be followed any more, after which the follower
+            stops: it cannot be read when following starts, it was truncated or replaced, or `MAX_POLL_ERRORS` polls
+            in a row failed, e.g. on a malformed line or a value that does not fit the type of its column.
+        offset (int): The byte offset up to which the file has been read.
+        base_rows (int): The number of rows in the file when following started.
+        appended (int): The number of rows appended since following started.
+        head_query (str): The query reading the rows that were in the file when following started. A half written last
+            line is skipped instead of failing the query.
+    """
+
+    def __init__(self, cursor: duckdb.DuckDBPyConnection, path: str, columns: List[Tuple[str, str]],
+                 on_append: Callable[[int], None], interval: float = 1.0,
+                 on_error: Callable[[str], None] = None) -> None:
+        super().__init__(daemon=True)
+        self.logger = logging.getLogger("table_viewer").getChild("follow")
+        self.cursor = cursor
+        self.path = path
+        self.columns = columns
+        self.on_append = on_append
+        self.on_error = on_error
+        self.interval = interval
+        self.file_format, _ = split_suffix(path)
+        self.offset = 0
+        self.base_rows = None
+        self.appended = 0
+        self.head_query = None
+        self.__reader_options = ""
+        self.__stop = threading.Event()
+
+    @property
+    def total_rows(self) -> int:
+        return (self.base_rows or 0) + self.appended
+
+    def stop(self) -> None:
+        """
+        Stop following the file.
+        """
+        self.__stop.set()
+
+    def run(self) -> None:
+        try:
+            self.start_following()
+        except (duckdb.Error, OSError) as e:
+            # The file cannot be followed at all, e.g. it was removed or the sniffer rejects it
+            return self.fail(str(e))
+        self.on_append(0)
+
+        errors = 0
+        while not self.__stop.wait(self.interval):
+            try:
+                self.poll()
+                errors = 0
+            except (duckdb.Error, OSError, ValueError) as e:
+                errors += 1
+                self.logger.error(f"Error following {self.path}: {e}")
+                # A truncated file cannot recover, other errors are retried a few times
+                if isinstance(e, ValueError) or errors >= MAX_POLL_ERRORS:
+                    return self.fail(str(e))
+
+    def fail(self, message: str) -> None:
+        """
+        Stop following after an error, and report it.
+        """
+        self.logger.error(f"Stopped following {self.path}: {message}")
+        self.__stop.set()
+        if self.on_error is not None:
+            self.on_error(message)
+
+    def start_following(self) -> None:
+        """
+        Count the rows already in the file, work out how to parse appended lines and create the follow table.
+        """
+        offset, base_rows = self.scan_existing()
+        self.__reader_options = self.reader_options(header=False)
+        self.head_query = (
+            f"SELECT * FROM {READERS[self.file_format]}({quote_literal(self.path)}, "
+            f"{self.reader_options(header=True)}, ignore_errors = true)"
+        )
+        definition = ", ".join(f"{quote_identifier(name)} {column_type}" for name, column_type in self.columns)
+        self.cursor.execute(f"CREATE OR REPLACE TABLE {FOLLOW_TABLE} ({definition})")
+        self.offset = offset
+        self.base_rows = base_rows
+
+    def scan_existing(self) -> Tuple[int, int]:
+        """
+        Count the complete lines that are already in the file.
+
+        Returns:
+            tuple: The byte offset just after the last complete line, and the number of rows before it.
+        """
+        lines = 0
+        offset = 0
+        with open(self.path, "rb") as file:
+            position = 0
+            while block := file.read(SCAN_BLOCK_SIZE):
+                lines += block.count(b"\n")
+                last = block.rfind(b"\n")
+                if last >= 0:
+                    offset = position + last + 1
+                position += len(block)
+
+        header = 1 if self.file_format == "csv" and lines else 0
+        return offset, lines - header
+
+    def reader_options(self, header: bool) -> str:
+        """
+        Get the options used to parse the file, so appended bytes are parsed the same way as the rest of the file.
+
+        Args:
+            header (bool): Whether the parsed bytes start with the CSV header line.
+
+        Returns:
+            str: The options for the DuckDB reader of the file format.
+        """
+        columns = "{" + ", ".join(f"{quote_literal(name)}: {quote_literal(column_type)}" for name, column_type in self.columns) + "}"
+        if self.file_format == "json":
+            return f"format = 'newline_delimited', columns = {columns}"
+
+        delimiter, quote, escape = self.cursor.sql(
+            f"SELECT Delimiter, Quote, Escape FROM sniff_csv({quote_literal(self.path)})"
+        ).fetchone()
+        return f"header = {str(header).lower()}, delim = {quote_literal(delimiter)}, quote = {quote_literal(quote)}, escape = {quote_literal(escape)}, columns = {columns}"
+
+    def poll(self) -> int:
+        """
+        Parse the complete lines appended to the file since the last poll.
+
+        Returns:
+            int: The number of new rows.
+
+        Raises:
+            ValueError: If the file is shorter than the part already read, i.e. it was truncated or replaced.
+        """
+        size = os.path.getsize(self.path)
+        if size < self.offset:
+            raise ValueError(f"The file shrank from {self.offset:,} to {size:,} bytes, it was truncated or replaced")
+        if size == self.offset:
+            return 0
+
+        with open(self.path, "rb") as file:
+            file.seek(self.offset)
+            chunk = file.read(size - self.offset)
+
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            return 0
+
+        with tempfile.NamedTemporaryFile(suffix=f".{self.file_format}", delete=False) as chunk_file:
+            chunk_file.write(chunk[:end])
+        try:
+            rows = self.cursor.execute(
+                f"INSERT INTO {FOLLOW_TABLE} SELECT * FROM {READERS[self.file_format]}({quote_literal(chunk_file.name)}, {self.__reader_options})"
+            ).fetchone()[0]
+        finally:
+            os.remove(chunk_file.name)
+
+        self.offset += end
+        self.appended += rows
+        self.on_append(rows)
+        return rows
@@ -1,11 +1,21 @@
+import threading
+from typing import List, Optional, Tuple
+
 import duckdb
 import wx
 import wx._core
 import wx.grid
 
-from . import BasePanel
+from .components.panel import BasePanel
+from .cache import PageCache
+from .detail import CellDetailDialog
+from .engine import Dataset
+from .follow import follow_page
 from .helpers import status_message
+from .metrics import add_rows
 from .pagination import Pagination
+from .sample import SamplePanel
+from .table import PageTable
 
 
 class GridPanel(BasePanel):
@@ -24,10 +34,25 @@ class GridPanel(BasePanel):
         self.__setup_ui()
 
     @property
-    def row_count(self) -> int:
-        if self.__plugin.path not in self.__row_count:
-            self.__row_count[self.__plugin.path] = duckdb.sql(f"SELECT COUNT(*) FROM '{self.__plugin.path}'").fetchone()[0]
-        return self.__row_count[self.__plugin.path]
+    def row_count(self) -> Optional[int]:
+        """
+        Get the total number of rows in the file.
+
+        Returns:
+            int: The number of rows, or None while the rows are still being counted in the background.
+        """
+        return self.view_row_count(self.__plugin.view)
+
+    def view_row_count(self, view: str) -> Optional[int]:
+        """
+        Get the total number of rows of a view, or None while they are still being counted. Safe to call from any
+        thread.
+        """
+        return self.__row_count.get(view)
+
+    @property
+    def page_rows(self) -> int:
+        return self.__table.GetNumberRows()
 
     @property
     def df(self):
@@ -59,6 +84,14 @@ class GridPanel(BasePanel):
     def status_bar(self) -> wx.StatusBar:
         return self.__plugin.status_bar
 
+    @property
+    def column_margin(self) -> int:
+        return self.__plugin.settings.get("column_margin", 5)
+
+    @property
+    def preview_length(self) -> int:
+        return self.__plugin.settings.get("cell_preview_length", 200)
+
     def __setup_ui(self):
         self.__setup_grid()
         self.__setup_pagination()
@@ -68,48 +101,202 @@ class GridPanel(BasePanel):
 
     def __setup_grid(self):
         self.__grid = wx.grid.Grid(self)
-        self.__grid.CreateGrid(0, 0)
+        self.page_cache = PageCache(self.__plugin.settings.get("page_cache_pages", 64))
+        self.__table = PageTable(self.preview_length, self.page_cache)
+        self.__grid.SetTable(self.__table, takeOwnership=False)
         self.GetSizer().Add(self.__grid, 1, wx.EXPAND)
         self.__grid.SetMaxSize(self.__plugin.panel.GetSize())
 
+        self.__grid.Bind(wx.EVT_SCROLLWIN, self.on_scroll)
+        self.__grid.Bind(wx.EVT_SIZE, self.on_scroll)
+        self.__grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.on_cell_open)
+
     def __setup_pagination(self):
+        controls = wx.BoxSizer(wx.HORIZONTAL)
         self.__pagination = Pagination(self)
-        self.GetSizer().Add(self.__pagination, 1, wx.EXPAND)
+        controls.Add(self.__pagination, 3, wx.EXPAND)
+        self.sample_panel = SamplePanel(self, self.__plugin)
+        controls.Add(self.sample_panel, 2, wx.EXPAND | wx.LEFT, 10)
+        self.GetSizer().Add(controls, 1, wx.EXPAND)
 
     @status_message("Get all data from file")
     def get_all_rows(self) -> duckdb.DuckDBPyRelation:
-        return duckdb.sql(f"SELECT * FROM '{self.__plugin.path}'")
+        return self.__plugin.session.open(self.__plugin.path).relation
+
+    def count_rows(self) -> bool:
+        """
+        Start counting the rows of the file in the background.
+
+        The count runs on its own cursor, so the grid can be paged while it is running. The overview and the pagination
+        are updated when the count is ready.
+
+        Returns:
+            bool: True if a count was started, False if the row count was already known.
+        """
+        if self.row_count is not None:
+            self.on_row_count(self.__plugin.view)
+            return False
+
+        count_thread = threading.Thread(
+            target=self.count_rows_thread,
+            args=(self.__plugin.cursor(), self.df.sql_query(), self.__plugin.view),
+            daemon=True
+        )
+        count_thread.start()
+        return True
+
+    @status_message("Counting rows", 1)
+    def count_rows_thread(self, cursor: duckdb.DuckDBPyConnection, query: str, view: str) -> bool:
+        try:
+            self.__row_count[view] = Dataset.from_query(cursor, query).row_count()
+        except duckdb.Error as e:
+            self.logger.error(f"Error counting the rows of {view}: {e}")
+            wx.CallAfter(self.on_row_count_error, view)
+            return False
+        add_rows(self.__row_count[view])
+        wx.CallAfter(self.on_row_count, view)
+        return True
+
+    def set_row_count(self, count: int) -> bool:
+        """
+        Set the row count of the current view when it is known without counting, e.g. while following a file.
+
+        Args:
+            count (int): The number of rows.
+        """
+        self.__row_count[self.__plugin.view] = count
+        return self.on_row_count(self.__plugin.view)
+
+    def on_row_count(self, view: str) -> bool:
+        """
+        Update the overview and the pagination bounds once the row count of a view is known.
+
+        Args:
+            view (str): The view that was counted.
+        """
+        if view != self.__plugin.view:
+            return False
+
+        self.__plugin.overview.update_total_rows(self.row_count)
+        self.__pagination.activate()
+        return True
+
+    def on_row_count_error(self, view: str) -> bool:
+        """
+        Show that the rows of a view could not be counted. The count is tried again when the view is shown again.
+
+        Args:
+            view (str): The view that failed to count.
+        """
+        if view != self.__plugin.view:
+            return False
+
+        self.__plugin.overview.update_total_rows(failed=True)
+        return True
 
     @status_message("Loading data into grid")
     def show_data(self, df: duckdb.DuckDBPyRelation=None, offset: int = None, limit: int = None) -> bool:
-        offset = offset or self.offset
+        offset = self.offset if offset is None else offset
         limit = limit or self.sample_size
         if df is None:
             df = self.df
 
-        df = df.limit(limit, offset=offset)
-
-        self.__grid.ClearGrid()
+        rows, cols = self.__table.GetNumberRows(), self.__table.GetNumberCols()
+        first, last = self.visible_columns()
+        page = None
+        if df is self.__plugin.source and self.__plugin.arrow_table is not None:
+            page = Dataset(self.__plugin.connection, df, arrow_table=self.__plugin.arrow_table).page_relation(offset, limit)
+        follower = self.__plugin.follower
+        if df is self.__plugin.source and follower is not None and follower.base_rows is not None:
+            # Appended rows are read from the follow table, so the end of a growing file is never rescanned
+            page = follow_page(self.__plugin.connection, follower.head_query, follower.base_rows, offset, limit)
 
-        if self.__grid.GetNumberCols() > 0:
-            self.__grid.DeleteCols(0, self.__grid.GetNumberCols())
-            self.__grid.DeleteRows(0, self.__grid.GetNumberRows())
-
-        self.__grid.AppendCols(len(df.columns))
-        self.__grid.AppendRows(len(df))
-
-        for i, col in enumerate(df.columns):
-            self.__grid.SetColLabelValue(i, col)
-
-        for i, row in enumerate(df.fetchall()):
-            self.__grid.SetRowLabelValue(i, str(i + 1 + self.offset))
-            for j, value in enumerate(row):
-                value = str(value) if value is not None else ""
-                self.__grid.SetCellValue(i, j, str(value))
+        loaded = self.__table.reset(
+            df, offset, limit, first - self.column_margin, last + self.column_margin, page, id(self.__plugin.tab)
+        )
+        self.__notify_table_resized(rows, cols)
+        add_rows(self.__table.GetNumberRows())
 
         self.__pagination.activate()
-        self.__grid.AutoSize()
+        self.__auto_size_columns(loaded)
         self.__grid.Refresh()
         self.__grid.Update()
         self.__plugin.panel.Layout()
         return True
+
+    def visible_columns(self) -> Tuple[int, int]:
+        """
+        Get the range of columns that are currently visible in the grid viewport.
+
+        Returns:
+            tuple: The index of the first and last visible column.
+        """
+        if self.__grid.GetNumberCols() == 0:
+            return 0, PageTable.COLUMN_BLOCK
+
+        x, _ = self.__grid.CalcUnscrolledPosition(0, 0)
+        width = self.__grid.GetGridWindow().GetClientSize().GetWidth()
+        return self.__grid.XToCol(x, clipToMinMax=True), self.__grid.XToCol(x + width, clipToMinMax=True)
+
+    def load_visible_columns(self) -> bool:
+        """
+        Fetch the columns in the viewport, plus a margin, that are not loaded yet for the current page.
+
+        Returns:
+            bool: True if any columns were fetched.
+        """
+        first, last = self.visible_columns()
+        loaded = self.__table.ensure_columns(first - self.column_margin, last + self.column_margin)
+        if not loaded:
+            return False
+
+        self.__auto_size_columns(loaded)
+        self.__grid.ForceRefresh()
+        return True
+
+    def on_scroll(self, event: wx.Event) -> None:
+        # The viewport is only updated once the scroll event has been handled
+        wx.CallAfter(self.load_visible_columns)
+        event.Skip()
+
+    @status_message("Loading cell value", record=False)
+    def on_cell_open(self, event: wx.grid.GridEvent) -> None:
+        """
+        Open the full value of the double-clicked cell in the detail view.
+        """
+        row, col = event.GetRow(), event.GetCol()
+        value = self.__table.get_full_value(row, col)
+
+        dialog = CellDetailDialog(self, self.__table.columns[col], value)
+        dialog.ShowModal()
+        dialog.Destroy()
+
+    def __auto_size_columns(self, columns: List[int]) -> None:
+        """
+        Auto size the given columns. Only loaded columns are sized, as sizing a column reads all of its values.
+        """
+        self.__grid.BeginBatch()
+        for col in columns:
+            self.__grid.AutoSizeColumn(col, setAsMin=False)
+        self.__grid.EndBatch()
+
+    def __notify_table_resized(self, rows: int, cols: int) -> None:
+        """
+        Tell the grid that the number of rows and columns in the table has changed.
+
+        Args:
+            rows (int): The number of rows before the table was reset.
+            cols (int): The number of columns before the table was reset.
+        """
+        self.__grid.BeginBatch()
+        for current, new, deleted, appended in (
+            (rows, self.__table.GetNumberRows(), wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED),
+            (cols, self.__table.GetNumberCols(), wx.grid.GRIDTABLE_NOTIFY_COLS_DELETED, wx.grid.GRIDTABLE_NOTIFY_COLS_APPENDED),
+        ):
+            if new < current:
+                self.__grid.ProcessTableMessage(wx.grid.GridTableMessage(self.__table, deleted, new, current - new))
+            elif new > current:
+                self.__grid.ProcessTableMessage(wx.grid.GridTableMessage(self.__table, appended, new - current))
+
+        self.__grid.ProcessTableMessage(wx.grid.GridTableMessage(self.__table, wx.grid.GRIDTABLE_REQUEST_VIEW_GET_VALUES))
+        self.__grid.EndBatch()
@@ -1,22 +1,76 @@
-def status_message(message, pos: int = 0):
+import functools
+
+from .metrics import METRICS, format_duration
+
+
+def set_status_text(status_bar: "wx.StatusBar", text: str, pos: int = 0) -> None:
+    """
+    Set a status bar field from any thread. Calls from worker threads are handed to the main thread.
+
+    wx is imported here rather than with the module, as the data modules that quote identifiers with this module must
+    stay importable without wxPython.
     """
-    Decorator to set the status bar message in the main window.
+    import wx
+    if wx.IsMainThread():
+        status_bar.SetStatusText(text, pos)
+    else:
+        wx.CallAfter(status_bar.SetStatusText, text, pos)
+
+
+def status_message(message, pos: int = 0, record: bool = True):
+    """
+    Decorator to show an operation in the status bar of the main window and record how long it takes.
 
     This decorator function sets the status bar message to the provided message before executing the decorated function,
-    and then sets the status bar message back to "Main thread ready" after the function has completed.
+    and then replaces it with the time the function took once it has completed. The wall time, the CPU time and the
+    rows reported with `metrics.add_rows` are recorded in `metrics.METRICS` under the message, also when the function
+    raises. The decorated function may run on a worker thread; the status bar is then updated on the main thread.
+
+    UI event handlers that run no data operation, or that wait on a dialog, pass `record=False`: the message is shown
+    while they run and the previous text is restored afterwards, so the result of the last operation stays visible and
+    the metrics only hold operations on the data.
 
     Args:
-        message (str): The message to be displayed in the status bar.
+        message (str): The message to be displayed in the status bar, and the name the call is recorded under.
+        pos (int): The field of the status bar to use.
+        record (bool): Whether to record the call and report its duration.
 
     Returns:
         The decorated function.
     """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            old_message = self.status_bar.GetStatusText(pos)
-            self.status_bar.SetStatusText(message, pos)
-            result = func(self, *args, **kwargs)
-            self.status_bar.SetStatusText(old_message, pos)
-            return result
+            if not record:
+                old_message = self.status_bar.GetStatusText(pos)
+                set_status_text(self.status_bar, message, pos)
+                try:
+                    return func(self, *args, **kwargs)
+                finally:
+                    set_status_text(self.status_bar, old_message, pos)
+
+            set_status_text(self.status_bar, message, pos)
+            measurement = METRICS.start(message)
+            failed = True
+            try:
+                result = func(self, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                duration = format_duration(METRICS.stop(measurement, failed))
+                set_status_text(self.status_bar, f"{message} {'failed after' if failed else 'took'} {duration}", pos)
         return wrapper
     return decorator
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a column or table name for use in a DuckDB query.
+
+    Args:
+        name (str): The identifier to quote.
+
+    Returns:
+        str: The identifier wrapped in double quotes, with embedded quotes escaped.
+    """
+    return '"' + name.replace('"', '""') + '"'
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Dict
+
+import wx
+import wx.grid
+
+from .components.mixins import SetFontMixin
+from .parquet import LAYOUT_COLUMNS, format_pruning, parquet_layout
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+
+class ParquetInspector(SetFontMixin, wx.Frame):
+    """
+    The Parquet Inspector for the Table Viewer.
+
+    This window shows the layout of the loaded Parquet file, read from the file footer only: one row per column chunk,
+    with its row group, encodings, compression, sizes and min/max statistics. It also shows how many row groups the last
+    search could skip using those statistics, which helps to tune how upstream jobs write the files.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        report_label (wx.StaticText): The label showing the row group report of the last search.
+        layout_grid (wx.grid.Grid): The grid showing the layout of the file.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the Parquet Inspector.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title=f"Parquet Inspector - {tv.path}", size=(1000, 500))
+        self.__plugin = tv
+        self.set_font()
+
+        panel = wx.Panel(self)
+        panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+
+        self.report_label = wx.StaticText(panel, label="Row groups: no search run yet")
+        panel.GetSizer().Add(self.report_label, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.layout_grid = wx.grid.Grid(panel)
+        self.layout_grid.CreateGrid(0, len(LAYOUT_COLUMNS))
+        self.layout_grid.EnableEditing(False)
+        for i, column in enumerate(LAYOUT_COLUMNS):
+            self.layout_grid.SetColLabelValue(i, column)
+        panel.GetSizer().Add(self.layout_grid, 1, wx.EXPAND)
+
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    def update_layout(self) -> bool:
+        """
+        Read the footers of the loaded files and show their layout.
+
+        Returns:
+            bool: True if the layout was updated.
+        """
+        rows = parquet_layout(self.__plugin.connection, self.__plugin.files).fetchall()
+
+        if self.layout_grid.GetNumberRows() > 0:
+            self.layout_grid.DeleteRows(0, self.layout_grid.GetNumberRows())
+        self.layout_grid.AppendRows(len(rows))
+
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                self.layout_grid.SetCellValue(i, j, "" if value is None else str(value))
+
+        self.layout_grid.AutoSize()
+        self.SetTitle(f"Parquet Inspector - {self.__plugin.path}")
+        return True
+
+    def update_report(self, report: Dict[str, int]) -> None:
+        """
+        Show the row group report of a search.
+
+        Args:
+            report (dict): The report, as returned by `row_group_pruning`.
+        """
+        self.report_label.SetLabel(format_pruning(report))
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        self.__plugin.inspector = None
+        event.Skip()
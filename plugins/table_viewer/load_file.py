@@ -2,6 +2,7 @@ import wx
 
 from .components.button import PVButton
 from .components.panel import BasePanel
+from .components.textcntrl import TVTextCntrl
 
 
 class LoadFilePanel(BasePanel):
@@ -12,3 +13,37 @@ class LoadFilePanel(BasePanel):
         self.SetSizer(self.__sizer)
 
         self.__load_button = PVButton(self, "Load File", self.__plugin.load_file)
+        self.__load_folder_button = PVButton(self, "Load Folder", self.__plugin.load_folder)
+        self.__inspect_button = PVButton(self, "Inspect", self.__plugin.inspect)
+        self.__tables_button = PVButton(self, "Tables", self.__plugin.choose_table)
+        self.__compare_button = PVButton(self, "Compare", self.__plugin.compare)
+        self.__duplicates_button = PVButton(self, "Duplicates", self.__plugin.find_duplicates)
+        self.__aggregate_button = PVButton(self, "Aggregate", self.__plugin.aggregate)
+        self.__search_files_button = PVButton(self, "Search Files", self.__plugin.search_directory)
+        self.__validate_button = PVButton(self, "Validate", self.__plugin.validate)
+        self.__metrics_button = PVButton(self, "Metrics", self.__plugin.show_metrics)
+        self.__follow_button = PVButton(self, "Follow", self.on_follow)
+        self.__auto_scroll = wx.CheckBox(self, label="Auto-scroll")
+        self.__auto_scroll.SetValue(self.__plugin.auto_scroll)
+        self.__auto_scroll.Bind(wx.EVT_CHECKBOX, self.on_auto_scroll)
+        self.__sizer.Add(self.__auto_scroll, 0, wx.TOP, 5)
+
+        # A path, folder or glob pattern (e.g. /data/sales/date=*/*.parquet) can also be typed in directly
+        self.__path_input = TVTextCntrl(self)
+        self.__path_input.SetHint("Path or glob pattern")
+        self.__path_input.Bind(wx.EVT_TEXT_ENTER, self.on_path_enter)
+
+    def on_path_enter(self, event: wx.CommandEvent) -> bool:
+        path = self.__path_input.GetValue().strip()
+        if not path:
+            return False
+        return self.__plugin.open_path(path)
+
+    def on_follow(self, event: wx.CommandEvent) -> bool:
+        return self.__plugin.follow(self.__plugin.follower is None)
+
+    def on_auto_scroll(self, event: wx.CommandEvent) -> None:
+        self.__plugin.auto_scroll = self.__auto_scroll.GetValue()
+
+    def set_following(self, following: bool) -> None:
+        self.__follow_button.SetLabel("Stop Following" if following else "Follow")
@@ -0,0 +1,217 @@
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+# Upper bounds of the histogram buckets in seconds, doubling from a millisecond to about 17 minutes. Slower calls fall
+# into a last, unbounded bucket.
+BUCKET_BOUNDS = tuple(0.001 * 2 ** i for i in range(21))
+
+
+def new_histogram() -> List[int]:
+    return [0] * (len(BUCKET_BOUNDS) + 1)
+
+
+def bucket_index(seconds: float) -> int:
+    """
+    Get the index of the histogram bucket a duration falls into.
+    """
+    for index, bound in enumerate(BUCKET_BOUNDS):
+        if seconds <= bound:
+            return index
+    return len(BUCKET_BOUNDS)
+
+
+def percentile(histogram: Sequence[int], fraction: float, maximum: float) -> Optional[float]:
+    """
+    Estimate a percentile from a histogram, interpolating linearly within the bucket it falls in.
+
+    Args:
+        histogram (Sequence[int]): The number of durations in each bucket of `BUCKET_BOUNDS`.
+        fraction (float): The percentile as a fraction, e.g. 0.95.
+        maximum (float): The longest duration recorded, which bounds the estimate.
+
+    Returns:
+        float: The estimated duration in seconds, or None if the histogram is empty.
+    """
+    total = sum(histogram)
+    if not total:
+        return None
+
+    rank = fraction * total
+    before = 0
+    for index, count in enumerate(histogram):
+        if count and before + count >= rank:
+            lower = BUCKET_BOUNDS[index - 1] if index else 0.0
+            upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else maximum
+            return min(lower + (upper - lower) * (rank - before) / count, maximum)
+        before += count
+    return maximum
+
+
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration for the status bar, e.g. `350 ms`, `2.41 s` or `3 min 05 s`.
+    """
+    if seconds < 1:
+        return f"{seconds * 1000:.0f} ms"
+    if seconds < 60:
+        return f"{seconds:.2f} s"
+    return f"{int(seconds // 60)} min {int(seconds % 60):02d} s"
+
+
+class MetricsRegistry:
+    """
+    The latencies of the operations of the Table Viewer, recorded in the running application.
+
+    Every operation wrapped by `helpers.status_message` records its wall time, its CPU time and the number of rows it
+    processed. The durations are kept in histograms with fixed buckets, so the registry stays the same size however
+    long the application runs, and the percentiles are estimated from the buckets.
+
+    The CPU time is the time of the thread the operation ran on. DuckDB runs queries on its own threads, so for an
+    operation waiting on a query the CPU time is much lower than the wall time; it shows the time spent in Python.
+
+    Operations report the rows they processed with `add_rows` while they run. The rows are added to the innermost
+    running operation of the calling thread, so nested operations do not count the same rows twice.
+
+    Attributes:
+        __lock (threading.Lock): Guards the recorded metrics, as operations finish on several threads.
+        __operations (dict): The metrics of every operation, keyed by its name.
+        __running (threading.local): The stack of running measurements of each thread.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__operations = {}
+        self.__running = threading.local()
+
+    def __stack(self) -> list:
+        if not hasattr(self.__running, "stack"):
+            self.__running.stack = []
+        return self.__running.stack
+
+    def start(self, operation: str) -> dict:
+        """
+        Start measuring an operation on the calling thread.
+
+        Args:
+            operation (str): The name of the operation.
+
+        Returns:
+            dict: The measurement, to be passed to `stop` when the operation is done.
+        """
+        measurement = {"operation": operation, "wall": time.perf_counter(), "cpu": time.thread_time(), "rows": 0}
+        self.__stack().append(measurement)
+        return measurement
+
+    def add_rows(self, rows: int) -> None:
+        """
+        Add to the number of rows processed by the innermost operation running on the calling thread.
+        """
+        stack = self.__stack()
+        if stack:
+            stack[-1]["rows"] += rows
+
+    def stop(self, measurement: dict, failed: bool = False) -> float:
+        """
+        Stop measuring an operation and record it.
+
+        Args:
+            measurement (dict): The measurement returned by `start`.
+            failed (bool): Whether the operation raised an exception.
+
+        Returns:
+            float: The wall time of the operation in seconds.
+        """
+        wall = time.perf_counter() - measurement["wall"]
+        cpu = time.thread_time() - measurement["cpu"]
+        stack = self.__stack()
+        if stack and stack[-1] is measurement:
+            stack.pop()
+        self.record(measurement["operation"], wall, cpu, measurement["rows"], failed)
+        return wall
+
+    def record(self, operation: str, wall: float, cpu: float, rows: int = 0, failed: bool = False) -> None:
+        """
+        Record a finished call of an operation.
+
+        Args:
+            operation (str): The name of the operation.
+            wall (float): The wall time in seconds.
+            cpu (float): The CPU time in seconds.
+            rows (int): The number of rows processed.
+            failed (bool): Whether the call failed.
+        """
+        with self.__lock:
+            metrics = self.__operations.setdefault(operation, {
+                "calls": 0, "errors": 0, "rows": 0, "last": 0.0, "wall_total": 0.0, "cpu_total": 0.0,
+                "wall_max": 0.0, "cpu_max": 0.0, "wall": new_histogram(), "cpu": new_histogram(),
+            })
+            metrics["calls"] += 1
+            metrics["errors"] += failed
+            metrics["rows"] += rows
+            metrics["last"] = wall
+            for kind, seconds in (("wall", wall), ("cpu", cpu)):
+                metrics[f"{kind}_total"] += seconds
+                metrics[f"{kind}_max"] = max(metrics[f"{kind}_max"], seconds)
+                metrics[kind][bucket_index(seconds)] += 1
+
+    def summary(self) -> List[Dict[str, object]]:
+        """
+        Summarize the recorded operations.
+
+        Returns:
+            list: For every operation, sorted by name: the number of calls and failed calls, the last, median, 95th
+                percentile and longest wall time, the median and 95th percentile CPU time, all in seconds, and the
+                number of rows processed per second of wall time.
+        """
+        with self.__lock:
+            operations = {
+                operation: {**metrics, "wall": list(metrics["wall"]), "cpu": list(metrics["cpu"])}
+                for operation, metrics in self.__operations.items()
+            }
+
+        summary = []
+        for operation, metrics in sorted(operations.items()):
+            summary.append({
+                "operation": operation,
+                "calls": metrics["calls"],
+                "errors": metrics["errors"],
+                "last": metrics["last"],
+                "p50": percentile(metrics["wall"], 0.5, metrics["wall_max"]),
+                "p95": percentile(metrics["wall"], 0.95, metrics["wall_max"]),
+                "max": metrics["wall_max"],
+                "cpu_p50": percentile(metrics["cpu"], 0.5, metrics["cpu_max"]),
+                "cpu_p95": percentile(metrics["cpu"], 0.95, metrics["cpu_max"]),
+                "rows": metrics["rows"],
+                "rows_per_second": metrics["rows"] / metrics["wall_total"] if metrics["wall_total"] else None,
+            })
+        return summary
+
+    def dump(self, path: str) -> None:
+        """
+        Write the summary and the histograms of every operation to a JSON file.
+        """
+        with self.__lock:
+            histograms = {
+                operation: {"wall": list(metrics["wall"]), "cpu": list(metrics["cpu"])}
+                for operation, metrics in self.__operations.items()
+            }
+        with open(path, "w") as file:
+            json.dump(
+                {"bucket_bounds": BUCKET_BOUNDS, "operations": self.summary(), "histograms": histograms}, file, indent=2
+            )
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__operations = {}
+
+
+METRICS = MetricsRegistry()
+
+
+def add_rows(rows: int) -> None:
+    """
+    Report rows processed by the operation running on the calling thread, see `MetricsRegistry.add_rows`.
+    """
+    METRICS.add_rows(rows)
@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING
+
+import wx
+
+from .components.button import PVButton
+from .components.mixins import SetFontMixin
+from .metrics import METRICS, format_duration
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+METRICS_COLUMNS = (
+    ("Operation", "operation", 240),
+    ("Calls", "calls", 60),
+    ("Errors", "errors", 60),
+    ("Last", "last", 80),
+    ("p50", "p50", 80),
+    ("p95", "p95", 80),
+    ("Max", "max", 80),
+    ("CPU p50", "cpu_p50", 80),
+    ("CPU p95", "cpu_p95", 80),
+    ("Rows/s", "rows_per_second", 100),
+)
+REFRESH_INTERVAL = 1000
+
+
+class MetricsFrame(SetFontMixin, wx.Frame):
+    """
+    The latency metrics of the Table Viewer.
+
+    Lists every operation recorded in `metrics.METRICS` with its number of calls, its last, median, 95th percentile and
+    longest wall time, its median and 95th percentile CPU time and the rows it processed per second. The list is
+    refreshed every second while the frame is open, and the metrics, with their histograms, can be exported as JSON.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __timer (wx.Timer): Refreshes the list.
+        metrics_list (wx.ListCtrl): The metrics of every operation.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the Metrics Frame.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title="Metrics", size=(1000, 500))
+        self.__plugin = tv
+        self.set_font()
+
+        panel = wx.Panel(self)
+        panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.metrics_list = wx.ListCtrl(panel, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+        for index, (label, _, width) in enumerate(METRICS_COLUMNS):
+            self.metrics_list.InsertColumn(index, label, width=width)
+        panel.GetSizer().Add(self.metrics_list, 1, wx.EXPAND)
+
+        buttons = wx.Panel(panel)
+        buttons.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+        PVButton(buttons, "Export", self.on_export)
+        PVButton(buttons, "Reset", self.on_reset)
+        panel.GetSizer().Add(buttons, 0, wx.EXPAND)
+
+        self.__timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.refresh, self.__timer)
+        self.__timer.Start(REFRESH_INTERVAL)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+        self.refresh()
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        return self.__plugin.status_bar
+
+    def refresh(self, event: wx.TimerEvent = None) -> None:
+        """
+        List the current metrics.
+        """
+        self.metrics_list.DeleteAllItems()
+        for operation in METRICS.summary():
+            index = self.metrics_list.InsertItem(self.metrics_list.GetItemCount(), operation["operation"])
+            for column, (_, key, _) in enumerate(METRICS_COLUMNS[1:], start=1):
+                self.metrics_list.SetItem(index, column, self.format_value(key, operation[key]))
+
+    @staticmethod
+    def format_value(key: str, value: object) -> str:
+        if value is None:
+            return ""
+        if key in ("calls", "errors"):
+            return str(value)
+        if key == "rows_per_second":
+            return f"{value:,.0f}" if value else ""
+        return format_duration(value)
+
+    def on_export(self, event: wx.CommandEvent) -> bool:
+        with wx.FileDialog(
+            self, "Export Metrics", wildcard="JSON files (*.json)|*.json", defaultFile="table_viewer_metrics.json",
+            style=wx.FD_SAVE | wx.FD_OVERWRITE_PROMPT
+        ) as dialog:
+            if dialog.ShowModal() == wx.ID_CANCEL:
+                return False
+            path = dialog.GetPath()
+
+        try:
+            METRICS.dump(path)
+        except OSError as e:
+            wx.MessageBox(f"Error exporting metrics: {e}", "Metrics", wx.OK | wx.ICON_ERROR)
+            return False
+        self.status_bar.SetStatusText(f"Metrics exported to {path}", 1)
+        return True
+
+    def on_reset(self, event: wx.CommandEvent) -> bool:
+        METRICS.reset()
+        self.refresh()
+        return True
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        self.__timer.Stop()
+        self.__plugin.metrics = None
+        event.Skip()
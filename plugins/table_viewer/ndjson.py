@@ -0,0 +1,106 @@
+import gzip
+import json
+import os
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import duckdb
+
+from .query import quote_literal
+
+NDJSON_SUFFIXES = (".jsonl", ".ndjson")
+PEEK_SIZE = 64 * 1024
+
+
+def fingerprint(path: str) -> Tuple[str, int, int]:
+    """
+    Get the fingerprint of a file, which changes whenever the file is replaced or written to.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        tuple: The absolute path, the size and the modification time of the file.
+    """
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def is_ndjson(path: str, compression: Optional[str] = None) -> bool:
+    """
+    Check whether a JSON file is newline-delimited, i.e. holds one JSON object per line.
+
+    Files with a `.jsonl` or `.ndjson` suffix are newline-delimited by definition. For `.json` files the first line is
+    read: if it holds a complete JSON object, the file is treated as newline-delimited. Zstd compressed `.json` files
+    cannot be peeked into with the standard library and are left to the DuckDB sniffer.
+
+    Args:
+        path (str): The path of the file.
+        compression (str): The compression of the file, one of the values in `dataset.COMPRESSIONS`, or None.
+
+    Returns:
+        bool: True if the file is newline-delimited JSON.
+    """
+    name = path.lower().removesuffix(".gz").removesuffix(".zst")
+    if name.endswith(NDJSON_SUFFIXES):
+        return True
+    if compression not in (None, "gzip"):
+        return False
+
+    opener = gzip.open if compression == "gzip" else open
+    try:
+        with opener(path, "rb") as file:
+            head = file.read(PEEK_SIZE)
+    except (OSError, EOFError):
+        return False
+
+    first_line = head.lstrip().split(b"\n", 1)[0]
+    if not first_line.startswith(b"{"):
+        return False
+    try:
+        return isinstance(json.loads(first_line), dict)
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=64)
+def ndjson_schema(file_fingerprint: Tuple[str, int, int], compression: Optional[str] = None) -> str:
+    """
+    Infer the schema of a newline-delimited JSON file.
+
+    The schema is cached per file fingerprint, so opening the same file again, and every query that reads it, skips
+    the inference. A file that is written to gets a new fingerprint and is inferred again.
+
+    Args:
+        file_fingerprint (tuple): The fingerprint of the file, see `fingerprint`.
+        compression (str): The compression of the file, or None.
+
+    Returns:
+        str: The schema as a DuckDB struct literal, for the `columns` option of `read_json`.
+    """
+    path = file_fingerprint[0]
+    options = f", compression = '{compression}'" if compression else ""
+    with duckdb.connect() as connection:
+        rows = connection.sql(
+            f"DESCRIBE SELECT * FROM read_json({quote_literal(path)}, format = 'newline_delimited'{options})"
+        ).fetchall()
+    return "{" + ", ".join(f"{quote_literal(name)}: {quote_literal(column_type)}" for name, column_type, *_ in rows) + "}"
+
+
+def ndjson_query(path: str, compression: Optional[str] = None) -> str:
+    """
+    Build the query that reads a newline-delimited JSON file.
+
+    The file is read with the newline-delimited reader and a fixed schema, so DuckDB does not have to sniff the format
+    and splits the file on line boundaries into chunks that are parsed in parallel by all its threads.
+
+    Args:
+        path (str): The path of the file.
+        compression (str): The compression of the file, or None.
+
+    Returns:
+        str: The query selecting all rows of the file.
+    """
+    options = f", compression = '{compression}'" if compression else ""
+    columns = ndjson_schema(fingerprint(path), compression)
+    return f"SELECT * FROM read_json({quote_literal(path)}, format = 'newline_delimited', columns = {columns}{options})"
@@ -1,10 +1,11 @@
 import wx
 
 from config.colors import *
-from . import PVButton
+from .components import PVButton
 from .components.combobox import TVCombobox
 from .components.panel import BasePanel
 from .components.textcntrl import TVTextCntrl
+from .query import SEARCH_STYLES
 
 
 class OverviewPanel(BasePanel):
@@ -85,7 +86,7 @@ class OverviewPanel(BasePanel):
         return True
 
     def __setup_search_style_combobox(self):
-        self.search_style_combobox = TVCombobox(self.search_panel, choices=["Exact", "Contains", "Starts With", "Ends With", "Is Empty", "Is not Empty"], size=wx.Size(80, -1))
+        self.search_style_combobox = TVCombobox(self.search_panel, choices=list(SEARCH_STYLES), size=wx.Size(80, -1))
         self.search_style_combobox.SetSelection(0)
 
         self.search_style_combobox.Bind(wx.EVT_COMBOBOX, self.OnComboSelect)
@@ -102,8 +103,11 @@ class OverviewPanel(BasePanel):
         self.update_column_choices(columns)
         return True
 
-    def update_total_rows(self, total_rows: int):
-        self.total_rows_value.SetLabel(str(total_rows))
+    def update_total_rows(self, total_rows: int = None, failed: bool = False):
+        if failed:
+            self.total_rows_value.SetLabel("Unable to count")
+        else:
+            self.total_rows_value.SetLabel("Counting..." if total_rows is None else str(total_rows))
         return True
 
     def update_total_columns(self, total_columns: int):
@@ -7,7 +7,7 @@ from .components.button import PVButton
 from .components.panel import BasePanel
 
 if TYPE_CHECKING:
-    from . import TableViewer
+    from .viewer import TableViewer
 
 
 class ButtonNames(Enum):
@@ -138,7 +138,12 @@ class Pagination(BasePanel):
         Args:
             event (wx.Event): The event that triggered this callback.
         """
-        if self.offset + self.sample_size >= self.Parent.row_count:
+        if self.Parent.row_count is None:
+            at_end = self.Parent.page_rows < self.sample_size
+        else:
+            at_end = self.offset + self.sample_size >= self.Parent.row_count
+
+        if at_end:
             self.logger.debug("Cannot go forward any further")
             return
         self.offset += self.sample_size
@@ -172,11 +177,16 @@ class Pagination(BasePanel):
         Go to the last page.
 
         This method is called when the "Last" button is clicked. It sets the offset in the Table Viewer plugin to the
-        total number of rows minus the sample size, and calls the `load_data` method to update the grid.
+        total number of rows minus the sample size, and calls the `load_data` method to update the grid. The button is
+        disabled until the rows have been counted.
 
         Args:
             event (wx.Event): The event that triggered this callback.
         """
+        if self.Parent.row_count is None:
+            self.logger.debug("Rows are still being counted")
+            return
+
         if self.Parent.row_count < self.sample_size:
             self.logger.debug("Cannot go to last page")
             getattr(self, "__last_button").disable()
@@ -196,12 +206,16 @@ class Pagination(BasePanel):
         """
         Activate all buttons.
 
-        This method enables all the pagination buttons, allowing the user to navigate through the data.
+        This method enables all the pagination buttons, allowing the user to navigate through the data. The "Last"
+        button stays disabled while the total number of rows is not known yet.
         """
         for name in self.BUTTONS:
             button = getattr(self, f"__{name.value.lower()}_button")
             button.enable()
 
+        if self.Parent.row_count is None:
+            getattr(self, "__last_button").disable()
+
     def deactivate(self) -> None:
         """
         Deactivate all buttons.
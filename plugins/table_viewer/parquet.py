@@ -0,0 +1,105 @@
+from typing import Dict, Sequence
+
+import duckdb
+
+from .query import quote_literal
+
+LAYOUT_COLUMNS = (
+    "file_name", "row_group_id", "row_group_num_rows", "path_in_schema", "type", "encodings", "compression",
+    "total_compressed_size", "total_uncompressed_size", "stats_min_value", "stats_max_value", "stats_null_count",
+)
+
+
+def metadata_source(files: Sequence[str]) -> str:
+    """
+    Build the table function that reads the footers of a set of Parquet files.
+
+    Args:
+        files (Sequence[str]): The paths of the Parquet files.
+
+    Returns:
+        str: The `parquet_metadata` table function call.
+    """
+    return "parquet_metadata([" + ", ".join(quote_literal(file) for file in files) + "])"
+
+
+def parquet_layout(connection: duckdb.DuckDBPyConnection, files: Sequence[str]) -> duckdb.DuckDBPyRelation:
+    """
+    Get the layout of a set of Parquet files, one row per column chunk.
+
+    Only the file footers are read: the row groups, the encodings and compression of each column chunk, their sizes
+    and their min/max statistics.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to run the query on.
+        files (Sequence[str]): The paths of the Parquet files.
+
+    Returns:
+        duckdb.DuckDBPyRelation: The layout, with the columns in `LAYOUT_COLUMNS`.
+    """
+    return connection.sql(
+        f"SELECT {', '.join(LAYOUT_COLUMNS)} FROM {metadata_source(files)} ORDER BY file_name, row_group_id, column_id"
+    )
+
+
+def statistics_match(column_type: duckdb.typing.DuckDBPyType, search: str, style: str) -> str:
+    """
+    Build the condition under which a row group may contain a match for a search, based on its min/max statistics.
+
+    Row groups without statistics always have to be scanned. Only exact and prefix searches can be decided from the
+    statistics; for every other search style all row groups are scanned.
+
+    Args:
+        column_type (DuckDBPyType): The DuckDB type of the searched column.
+        search (str): The value searched for.
+        style (str): The search style.
+
+    Returns:
+        str: The condition, over the columns of `parquet_metadata`.
+    """
+    value = quote_literal(search)
+    if style == "Exact":
+        low = f"TRY_CAST(stats_min_value AS {column_type})"
+        high = f"TRY_CAST(stats_max_value AS {column_type})"
+        target = f"TRY_CAST({value} AS {column_type})"
+        return f"({low} IS NULL OR {high} IS NULL OR ({low} <= {target} AND {target} <= {high}))"
+    if style == "Starts With" and column_type.id == "varchar":
+        length = len(search)
+        return (
+            f"(stats_min_value IS NULL OR stats_max_value IS NULL OR "
+            f"(left(stats_min_value, {length}) <= {value} AND {value} <= left(stats_max_value, {length})))"
+        )
+    return "true"
+
+
+def row_group_pruning(connection: duckdb.DuckDBPyConnection, files: Sequence[str], column: str,
+                      column_type: duckdb.typing.DuckDBPyType, search: str, style: str) -> Dict[str, int]:
+    """
+    Report how many row groups a search can skip using the Parquet statistics.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to run the query on.
+        files (Sequence[str]): The paths of the Parquet files.
+        column (str): The searched column.
+        column_type (DuckDBPyType): The DuckDB type of the searched column.
+        search (str): The value searched for.
+        style (str): The search style.
+
+    Returns:
+        dict: The number of row groups in total, pruned by the statistics, and scanned.
+    """
+    total, scanned = connection.sql(
+        f"SELECT COUNT(*), COUNT(*) FILTER (WHERE {statistics_match(column_type, search, style)}) "
+        f"FROM {metadata_source(files)} WHERE path_in_schema = {quote_literal(column)}"
+    ).fetchone()
+    return {"total": total, "pruned": total - scanned, "scanned": scanned}
+
+
+def format_pruning(report: Dict[str, int]) -> str:
+    """
+    Format a row group pruning report for the status bar and the inspector.
+    """
+    if not report["total"]:
+        return "Row groups: no statistics for the searched column"
+    return f"Row groups: {report['pruned']} of {report['total']} pruned by statistics, {report['scanned']} scanned"
+
@@ -0,0 +1,201 @@
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import duckdb
+
+from .distribution import NUMERIC_TYPES, TEMPORAL_TYPES
+from .helpers import quote_identifier
+from .query import TEXT_TYPES
+
+PROFILE_CHUNK_ROWS = 100000
+SETTLED_CHANGE = 0.01
+PROFILE_COLUMNS = (
+    "Column Name", "Coverage", "Unique Values", "Min", "Max", "Mean", "Std Dev", "P25", "Median", "P75",
+    "Min Length", "Max Length",
+)
+
+
+def column_aggregates(column: str, column_type: duckdb.typing.DuckDBPyType) -> List[str]:
+    """
+    Build the aggregates profiling one column.
+
+    Every column gets its number of values and distinct values. Numeric columns also get their range, mean, standard
+    deviation and approximate quartiles, dates and timestamps their range, and text columns the range of their lengths.
+
+    Args:
+        column (str): The column.
+        column_type (DuckDBPyType): The DuckDB type of the column.
+
+    Returns:
+        list: The aggregate expressions, in the order of the statistics in `PROFILE_COLUMNS` after the coverage.
+    """
+    name = quote_identifier(column)
+    aggregates = [f"COUNT({name})", f"COUNT(DISTINCT {name})"]
+    if column_type.id in NUMERIC_TYPES:
+        aggregates += [
+            f"MIN({name})", f"MAX({name})", f"AVG({name})", f"STDDEV_SAMP({name})",
+            f"APPROX_QUANTILE({name}, [0.25, 0.5, 0.75])", "NULL", "NULL",
+        ]
+    elif column_type.id in TEMPORAL_TYPES:
+        aggregates += [f"MIN({name})", f"MAX({name})", "NULL", "NULL", "NULL", "NULL", "NULL"]
+    elif column_type.id in TEXT_TYPES:
+        aggregates += ["NULL", "NULL", "NULL", "NULL", "NULL", f"MIN(LENGTH({name}))", f"MAX(LENGTH({name}))"]
+    else:
+        aggregates += ["NULL"] * 7
+    return aggregates
+
+
+def profile_query(query: str, columns: Sequence[str], types: Sequence[duckdb.typing.DuckDBPyType],
+                  rows_to_check: int = None) -> str:
+    """
+    Build the query profiling all columns of a relation in a single scan.
+
+    The aggregates of all columns are fused into one SELECT, so the file is read once however many columns and
+    statistics there are.
+
+    Args:
+        query (str): The query for the relation to profile.
+        columns (Sequence[str]): The columns of the relation.
+        types (Sequence[DuckDBPyType]): The DuckDB types of the columns.
+        rows_to_check (int): The number of rows to profile, or None for all rows.
+
+    Returns:
+        str: The query, returning a single row with the row count followed by the aggregates of every column.
+    """
+    aggregates = ["COUNT(*)"]
+    for column, column_type in zip(columns, types):
+        aggregates += column_aggregates(column, column_type)
+    limit = f" LIMIT {rows_to_check}" if rows_to_check is not None else ""
+    return f"SELECT {', '.join(aggregates)} FROM ({query}{limit})"
+
+
+STATISTICS = len(PROFILE_COLUMNS) - 3
+
+
+def format_statistic(value: object) -> str:
+    """
+    Format a statistic for the column overview.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
+
+
+def profile_rows(result: Sequence[object], columns: Sequence[str]) -> List[Tuple[str, ...]]:
+    """
+    Turn the result of a `profile_query` into one row of formatted statistics per column.
+
+    Args:
+        result (Sequence): The single row returned by the profile query.
+        columns (Sequence[str]): The profiled columns.
+
+    Returns:
+        list: The rows, with the values in the order of `PROFILE_COLUMNS`.
+    """
+    rows_checked = result[0]
+    rows = []
+    width = STATISTICS
+    for i, column in enumerate(columns):
+        values, distinct, low, high, mean, stddev, quartiles, min_length, max_length = result[1 + i * width:1 + (i + 1) * width]
+        coverage = f"{values / rows_checked:.2%}" if rows_checked else "N/A"
+        if rows_checked and distinct == rows_checked:
+            unique = "Unique"
+        elif values == 0:
+            unique = "N/A"
+        else:
+            unique = f"{distinct / rows_checked:.2%}"
+
+        quartiles = quartiles or [None, None, None]
+        rows.append((
+            column, coverage, unique,
+            *(format_statistic(value) for value in (low, high, mean, stddev, *quartiles, min_length, max_length))
+        ))
+    return rows
+
+
+def profile_ratios(result: Sequence[object], columns: Sequence[str]) -> List[Tuple[float, float]]:
+    """
+    Get the coverage and the share of distinct values of each column from the result of a `profile_query`.
+
+    Args:
+        result (Sequence): The single row returned by the profile query.
+        columns (Sequence[str]): The profiled columns.
+
+    Returns:
+        list: The coverage and the share of distinct values of each column, as fractions.
+    """
+    rows_checked = result[0] or 1
+    return [
+        (result[1 + i * STATISTICS] / rows_checked, result[2 + i * STATISTICS] / rows_checked)
+        for i in range(len(columns))
+    ]
+
+
+def estimate_change(previous: Optional[Sequence[Tuple[float, float]]], current: Sequence[Tuple[float, float]]) -> Optional[float]:
+    """
+    Find the largest change in the coverage and distinct estimates between two passes of the progressive profile.
+
+    Args:
+        previous (Sequence): The ratios of the previous pass, as returned by `profile_ratios`, or None for the first.
+        current (Sequence): The ratios of the current pass.
+
+    Returns:
+        float: The largest absolute change of any ratio, or None when there is no previous pass.
+    """
+    if previous is None:
+        return None
+    return max(
+        (abs(new - old) for before, after in zip(previous, current) for old, new in zip(before, after)), default=0.0
+    )
+
+
+def profile_passes(first: int = PROFILE_CHUNK_ROWS) -> Iterator[int]:
+    """
+    Generate the number of rows profiled by each pass of the progressive profile.
+
+    Every pass profiles twice as many rows as the previous one, from the start of the data, so the first results appear
+    after reading only a small chunk, while all passes together read at most twice the rows of the last one. The
+    results of a pass are the statistics of the rows it read, not an estimate for the whole data: in a sorted or time
+    ordered file the first rows can differ from the rest.
+
+    Args:
+        first (int): The number of rows profiled by the first pass.
+
+    Yields:
+        int: The number of rows of the next pass.
+    """
+    rows = first
+    while True:
+        yield rows
+        rows *= 2
+
+
+def format_progress(rows_checked: int, total_rows: Optional[int], change: Optional[float], complete: bool) -> str:
+    """
+    Describe the progress of the progressive profile, and how much its results still change between passes.
+
+    Until all rows are profiled, the description says the results cover only the first rows, as the passes read the
+    start of the data rather than a sample of it.
+
+    Args:
+        rows_checked (int): The number of rows profiled so far.
+        total_rows (int): The number of rows in the data, or None when it is not known yet.
+        change (float): The largest change of the results in the last pass, as returned by `estimate_change`.
+        complete (bool): Whether all rows were profiled.
+
+    Returns:
+        str: The description.
+    """
+    if complete:
+        return f"Profiled all {rows_checked:,} rows"
+
+    progress = f"Profiled the first {rows_checked:,} rows"
+    if total_rows:
+        share = min(rows_checked / total_rows, 1)
+        progress = f"Profiled the first {rows_checked:,} of {total_rows:,} rows ({share:.2%})"
+    progress += ", the results cover only these rows"
+    if change is None:
+        return progress
+    state = "settled" if change < SETTLED_CHANGE else "still changing"
+    return f"{progress} and are {state} (changed by up to {change:.2%} in the last pass)"
@@ -0,0 +1,174 @@
+import datetime
+
+import duckdb
+
+from .helpers import quote_identifier
+
+NESTED_TYPES = ("struct", "list", "map", "array", "union")
+TEXT_TYPES = ("varchar", "bit")
+INTEGER_TYPES = (
+    "tinyint", "smallint", "integer", "bigint", "hugeint",
+    "utinyint", "usmallint", "uinteger", "ubigint", "uhugeint",
+)
+FLOAT_TYPES = ("float", "double")
+SAMPLE_TABLE = "table_viewer_sample"
+SEARCH_STYLES = ("Exact", "Contains", "Starts With", "Ends With", "Is Empty", "Is not Empty")
+
+
+def quote_literal(value: str) -> str:
+    """
+    Quote a string for use as a literal in a DuckDB query.
+
+    Args:
+        value (str): The value to quote.
+
+    Returns:
+        str: The value wrapped in single quotes, with embedded quotes escaped.
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def sql_literal(value: object) -> str:
+    """
+    Write a value fetched from DuckDB as a literal in a DuckDB query.
+
+    Args:
+        value (object): The value, as returned by DuckDB: None, a number, text, a date or time, bytes, a list or a
+            dict for a struct.
+
+    Returns:
+        str: The literal. It is cast to the type of the column it is compared with where needed.
+    """
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, bytes):
+        return f"unhex('{value.hex()}')"
+    if isinstance(value, datetime.timedelta):
+        return f"INTERVAL '{value // datetime.timedelta(microseconds=1)} microseconds'"
+    if isinstance(value, (datetime.date, datetime.time)):
+        return quote_literal(value.isoformat())
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(sql_literal(item) for item in value)}]"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{quote_literal(str(key))}: {sql_literal(item)}" for key, item in value.items()) + "}"
+    return quote_literal(str(value))
+
+
+def equals_predicate(column: str, column_type: duckdb.typing.DuckDBPyType, value: object) -> str:
+    """
+    Build the filter selecting the rows where a column holds a value, including NULL.
+
+    Args:
+        column (str): The column.
+        column_type (DuckDBPyType): The DuckDB type of the column.
+        value (object): The value, as returned by DuckDB.
+
+    Returns:
+        str: The filter expression.
+    """
+    name = quote_identifier(column)
+    if value is None:
+        return f"{name} IS NULL"
+    return f"{name} IS NOT DISTINCT FROM CAST({sql_literal(value)} AS {column_type})"
+
+
+def search_predicate(column: str, column_type: duckdb.typing.DuckDBPyType, search: str, style: str = "Exact") -> str:
+    """
+    Build the filter expression for a search in the Table Viewer.
+
+    Exact searches compare the column with the search value cast to the type of the column, rather than casting every
+    value of the column to text. That keeps the comparison on the column itself, so DuckDB can push the filter into the
+    scan and skip Hive partitions and Parquet row groups whose statistics cannot match. Text searches on other types
+    still compare the text representation of the values.
+
+    Args:
+        column (str): The column to search in.
+        column_type (DuckDBPyType): The DuckDB type of the column.
+        search (str): The value to search for.
+        style (str): The search style, one of `SEARCH_STYLES`.
+
+    Returns:
+        str: The filter expression.
+    """
+    name = quote_identifier(column)
+    value = quote_literal(search)
+    text = name if column_type.id == "varchar" else f"CAST({name} AS VARCHAR)"
+
+    if style == "Contains":
+        return f"contains({text}, {value})"
+    elif style == "Starts With":
+        return f"starts_with({text}, {value})"
+    elif style == "Ends With":
+        return f"ends_with({text}, {value})"
+    elif style == "Is Empty":
+        return f"{text} = ''"
+    elif style == "Is not Empty":
+        return f"{text} != ''"
+    elif column_type.id == "varchar":
+        return f"{name} = {value}"
+    return f"{name} = TRY_CAST({value} AS {column_type})"
+
+
+def display_expression(column: str, column_type: duckdb.typing.DuckDBPyType, length: int) -> str:
+    """
+    Build the select expression used to show a column in the grid.
+
+    Text and nested values are truncated by DuckDB to a display prefix of `length` characters (plus one character, so
+    the grid can tell that the value was cut off) and blobs are replaced by their size. This keeps huge cells from being
+    fetched and stringified in full just to be displayed.
+
+    Args:
+        column (str): The name of the column.
+        column_type (DuckDBPyType): The DuckDB type of the column.
+        length (int): The number of characters to show.
+
+    Returns:
+        str: The select expression, aliased to the column name.
+    """
+    name = quote_identifier(column)
+    if column_type.id in TEXT_TYPES + NESTED_TYPES:
+        expression = f"left(CAST({name} AS VARCHAR), {length + 1})"
+    elif column_type.id == "blob":
+        expression = f"'<' || octet_length({name}) || ' bytes>'"
+    else:
+        return name
+
+    return f"{expression} AS {name}"
+
+
+def is_truncated(column_type: duckdb.typing.DuckDBPyType) -> bool:
+    """
+    Check whether a column is shown as a display prefix in the grid instead of its full value.
+
+    Args:
+        column_type (DuckDBPyType): The DuckDB type of the column.
+
+    Returns:
+        bool: True if the full value has to be fetched separately.
+    """
+    return column_type.id in TEXT_TYPES + NESTED_TYPES + ("blob",)
+
+
+def sample_query(query: str, rows: int, seed: int, total_rows: int = None) -> str:
+    """
+    Build a query that draws a uniform random sample from another query.
+
+    When the total number of rows is known up front (e.g. from the Parquet metadata) each row is kept with the same
+    probability (Bernoulli sampling), which DuckDB can do while streaming the scan in parallel. Otherwise reservoir
+    sampling is used, which draws exactly `rows` rows in a single pass over a streamed format such as CSV or JSON.
+
+    Args:
+        query (str): The query to sample from.
+        rows (int): The number of rows to sample.
+        seed (int): The seed for the random sample, so the same sample can be drawn again.
+        total_rows (int): The total number of rows returned by the query, if known.
+
+    Returns:
+        str: The sampling query.
+    """
+    if total_rows:
+        percentage = min(100.0, rows / total_rows * 100)
+        return f"SELECT * FROM ({query}) USING SAMPLE {percentage:.10f}% (bernoulli, {seed})"
+    return f"SELECT * FROM ({query}) USING SAMPLE reservoir({rows} ROWS) REPEATABLE ({seed})"
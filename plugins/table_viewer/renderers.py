@@ -0,0 +1,129 @@
+from typing import TYPE_CHECKING, Any, Callable
+
+import duckdb
+import wx
+import wx.grid
+
+from .query import FLOAT_TYPES, INTEGER_TYPES
+
+if TYPE_CHECKING:
+    from .table import PageTable
+
+TIMESTAMP_FORMATS = {
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S",
+    "timestamp": "%Y-%m-%d %H:%M:%S",
+    "timestamp_s": "%Y-%m-%d %H:%M:%S",
+    "timestamp_ms": "%Y-%m-%d %H:%M:%S.%f",
+    "timestamp_ns": "%Y-%m-%d %H:%M:%S.%f",
+    "timestamp with time zone": "%Y-%m-%d %H:%M:%S%z",
+}
+
+
+class TypedCellRenderer(wx.grid.GridCellRenderer):
+    """
+    Base renderer for the Table Viewer grid.
+
+    The renderer draws a cell straight from the typed column buffer held by the `PageTable`, so values are only turned
+    into text while they are painted. Each column gets its own renderer, which holds the format for that column.
+
+    Attributes:
+        ALIGNMENT (int): The horizontal alignment of the text in the cell.
+        PADDING (int): The padding around the text in the cell.
+        table (PageTable): The table holding the column buffers.
+        formatter (Callable): The cached function used to turn a value of the column into text.
+    """
+    ALIGNMENT = wx.ALIGN_LEFT
+    PADDING = 2
+
+    def __init__(self, table: "PageTable", formatter: Callable[[Any], str] = str) -> None:
+        super().__init__()
+        self.table = table
+        self.formatter = formatter
+
+    def text(self, row: int, col: int) -> str:
+        """
+        Get the text to draw for a cell.
+
+        Args:
+            row (int): The row in the current page.
+            col (int): The column index.
+
+        Returns:
+            str: The formatted value, or an empty string for NULL.
+        """
+        value = self.table.get_raw_value(row, col)
+        return "" if value is None else self.formatter(value)
+
+    def Draw(self, grid: wx.grid.Grid, attr: wx.grid.GridCellAttr, dc: wx.DC, rect: wx.Rect, row: int, col: int, isSelected: bool) -> None:
+        if isSelected:
+            background, foreground = grid.GetSelectionBackground(), grid.GetSelectionForeground()
+        else:
+            background, foreground = attr.GetBackgroundColour(), attr.GetTextColour()
+
+        dc.SetBackgroundMode(wx.BRUSHSTYLE_SOLID)
+        dc.SetBrush(wx.Brush(background, wx.BRUSHSTYLE_SOLID))
+        dc.SetPen(wx.TRANSPARENT_PEN)
+        dc.DrawRectangle(rect)
+
+        dc.SetBackgroundMode(wx.BRUSHSTYLE_TRANSPARENT)
+        dc.SetTextForeground(foreground)
+        dc.SetFont(attr.GetFont())
+        text_rect = wx.Rect(rect.x + self.PADDING, rect.y, rect.width - 2 * self.PADDING, rect.height)
+        grid.DrawTextRectangle(dc, self.text(row, col), text_rect, self.ALIGNMENT, wx.ALIGN_CENTRE_VERTICAL)
+
+    def GetBestSize(self, grid: wx.grid.Grid, attr: wx.grid.GridCellAttr, dc: wx.DC, row: int, col: int) -> wx.Size:
+        dc.SetFont(attr.GetFont())
+        width, height = dc.GetTextExtent(self.text(row, col))
+        return wx.Size(width + 2 * self.PADDING, height + 2 * self.PADDING)
+
+    def Clone(self) -> "TypedCellRenderer":
+        return self.__class__(self.table, self.formatter)
+
+
+class TextCellRenderer(TypedCellRenderer):
+    """
+    Renderer for text, nested and blob columns. These are already truncated by DuckDB, the table adds the ellipsis.
+    """
+    def text(self, row: int, col: int) -> str:
+        return self.table.GetValue(row, col)
+
+
+class NumberCellRenderer(TypedCellRenderer):
+    """
+    Renderer for numeric columns. Numbers are right aligned, so their magnitudes can be compared at a glance.
+    """
+    ALIGNMENT = wx.ALIGN_RIGHT
+
+
+class BooleanCellRenderer(TypedCellRenderer):
+    """
+    Renderer for boolean columns.
+    """
+    ALIGNMENT = wx.ALIGN_CENTRE
+
+
+def renderer_for(table: "PageTable", column_type: duckdb.typing.DuckDBPyType) -> TypedCellRenderer:
+    """
+    Choose the renderer for a column from its DuckDB type.
+
+    Args:
+        table (PageTable): The table holding the column buffers.
+        column_type (DuckDBPyType): The DuckDB type of the column.
+
+    Returns:
+        TypedCellRenderer: The renderer, with the format for the column already set up.
+    """
+    if column_type.id in INTEGER_TYPES:
+        return NumberCellRenderer(table, "{:d}".format)
+    if column_type.id in FLOAT_TYPES:
+        return NumberCellRenderer(table, "{:.6g}".format)
+    if column_type.id == "decimal":
+        scale = dict(column_type.children)["scale"]
+        return NumberCellRenderer(table, f"{{:.{scale}f}}".format)
+    if column_type.id in TIMESTAMP_FORMATS:
+        date_format = TIMESTAMP_FORMATS[column_type.id]
+        return TypedCellRenderer(table, lambda value: value.strftime(date_format))
+    if column_type.id == "boolean":
+        return BooleanCellRenderer(table, lambda value: "true" if value else "false")
+    return TextCellRenderer(table)
@@ -0,0 +1,84 @@
+from typing import TYPE_CHECKING
+
+import wx
+
+from .components.button import PVButton
+from .components.panel import BasePanel
+from .components.textcntrl import TVTextCntrl
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+
+class SamplePanel(BasePanel):
+    """
+    The Sample Panel for the Table Viewer.
+
+    This panel sits next to the pagination and switches the grid between browsing the file and browsing a uniform
+    random sample of it. The size of the sample and the seed can be adjusted. While the sample is shown, the column
+    overview and the search run against the sample as well.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __rows_input (TVTextCntrl): The input for the number of rows to sample.
+        __seed_input (TVTextCntrl): The input for the seed of the sample.
+        __sample_button (PVButton): The button that toggles the sample mode.
+    """
+
+    def __init__(self, parent: wx.Panel, tv: "TableViewer") -> None:
+        """
+        Initialize the Sample Panel.
+
+        Args:
+            parent (wx.Panel): The parent panel for the Sample Panel.
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(parent)
+        self.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+        self.__plugin = tv
+        self.logger = tv.logger.getChild("sample")
+        self.sampling = False
+
+        self.GetSizer().Add(wx.StaticText(self, label="Rows"), 0, wx.ALIGN_CENTER_VERTICAL | wx.RIGHT, 5)
+        self.__rows_input = TVTextCntrl(self, value=str(tv.settings.get("sample_rows", 10000)))
+        self.GetSizer().Add(wx.StaticText(self, label="Seed"), 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.RIGHT, 5)
+        self.__seed_input = TVTextCntrl(self, value=str(tv.settings.get("sample_seed", 42)))
+        self.__sample_button = PVButton(self, label="Sample", callback=self.on_sample)
+
+    def on_sample(self, event: wx.Event) -> bool:
+        """
+        Toggle between the sample and the full file.
+
+        Args:
+            event (wx.Event): The event that triggered this callback.
+
+        Returns:
+            bool: True if the mode was switched.
+        """
+        if self.sampling:
+            self.__plugin.browse_full_file()
+            self.set_sampling(False)
+            return True
+
+        try:
+            rows = int(self.__rows_input.GetValue())
+            seed = int(self.__seed_input.GetValue())
+        except ValueError:
+            wx.MessageBox("The sample size and the seed must be whole numbers", "Sample", wx.OK | wx.ICON_ERROR)
+            return False
+
+        self.logger.debug(f"Sampling {rows} rows with seed {seed}")
+        if self.__plugin.sample(rows, seed):
+            self.set_sampling(True)
+            return True
+        return False
+
+    def set_sampling(self, sampling: bool) -> None:
+        """
+        Update the panel to show whether the sample or the full file is being browsed.
+
+        Args:
+            sampling (bool): True if the sample is shown.
+        """
+        self.sampling = sampling
+        self.__sample_button.SetLabel("Full File" if sampling else "Sample")
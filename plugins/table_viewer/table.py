@@ -0,0 +1,188 @@
+from typing import Hashable, List, Optional
+
+import duckdb
+import wx
+import wx.grid
+
+from .cache import PageCache
+from .helpers import quote_identifier
+from .query import display_expression, is_truncated
+from .renderers import renderer_for
+
+
+class PageTable(wx.grid.GridTableBase):
+    """
+    The virtual table behind the Table Viewer grid.
+
+    The table holds a single page of a DuckDB relation. Columns are fetched lazily in blocks, so only the columns that
+    are visible in the grid (plus a margin) are projected into the query. Scrolling sideways fetches the next block for
+    the current page instead of reading every column of every row up front.
+
+    Text, nested and blob values are truncated by DuckDB to a display prefix. The full value of a cell is only fetched
+    when it is opened in the detail view.
+
+    Values are kept in typed column buffers as they are returned by DuckDB. Each column gets a cell attribute with a
+    renderer chosen from its DuckDB type, which draws straight from these buffers.
+
+    Fetched pages are kept in a `PageCache`, so going back to a page does not read the file again.
+
+    Attributes:
+        COLUMN_BLOCK (int): The number of columns fetched when a cell outside the loaded columns is requested.
+        relation (duckdb.DuckDBPyRelation): The relation for the current page.
+        columns (list): The names of all columns in the relation.
+        types (list): The DuckDB types of all columns in the relation.
+        offset (int): The row offset of the current page.
+        preview_length (int): The number of characters of text and nested values shown in a cell.
+        cache (PageCache): The cache of fetched pages.
+        __page (dict): The current page, with the number of rows and the fetched column buffers keyed by column index.
+        __attrs (dict): The cached cell attributes, keyed by column index.
+    """
+    COLUMN_BLOCK = 16
+
+    def __init__(self, preview_length: int = 200, cache: PageCache = None) -> None:
+        super().__init__()
+        self.relation = None
+        self.columns = []
+        self.types = []
+        self.offset = 0
+        self.preview_length = preview_length
+        self.cache = cache or PageCache()
+        self.__page = {"rows": 0, "columns": {}}
+        self.__attrs = {}
+
+    def reset(self, relation: duckdb.DuckDBPyRelation, offset: int, limit: int, first: int = 0, last: int = None,
+              page: duckdb.DuckDBPyRelation = None, owner: Hashable = None) -> List[int]:
+        """
+        Point the table at a new page.
+
+        The page is taken from the cache if it was fetched before, and the columns between `first` and `last` that
+        are not cached yet are fetched. Pages are cached by the query of the relation, so the pages of a table that is
+        rebuilt under the same name have to be evicted from the cache when it is replaced (see
+        `TableViewer.replace_table`).
+
+        Args:
+            relation (duckdb.DuckDBPyRelation): The relation to read the page from.
+            offset (int): The row offset of the page.
+            limit (int): The number of rows in the page.
+            first (int): The first column to fetch.
+            last (int): The last column to fetch. Defaults to one block of columns.
+            page (duckdb.DuckDBPyRelation): A relation holding exactly this page, for sources that can slice their
+                pages without scanning the rows before them.
+            owner (Hashable): The tab the page belongs to, for fair eviction from the shared cache.
+
+        Returns:
+            list: The indexes of the columns that were fetched.
+        """
+        self.relation = page if page is not None else relation.limit(limit, offset=offset)
+        self.columns = list(relation.columns)
+        if self.types != list(relation.types):
+            self.__attrs = {}
+        self.types = list(relation.types)
+        self.offset = offset
+
+        key = (relation.sql_query(), offset, limit)
+        self.__page = self.cache.get(key)
+        if self.__page is None:
+            self.__page = {"rows": 0, "columns": {}}
+            self.cache.put(key, self.__page, owner)
+
+        return self.ensure_columns(first, first + self.COLUMN_BLOCK if last is None else last)
+
+    def ensure_columns(self, first: int, last: int) -> List[int]:
+        """
+        Fetch the columns between `first` and `last` (inclusive) that are not loaded yet.
+
+        Only the missing columns are projected into the query, so a wide relation is never read in full.
+
+        Args:
+            first (int): The first column to fetch.
+            last (int): The last column to fetch.
+
+        Returns:
+            list: The indexes of the columns that were fetched.
+        """
+        if self.relation is None:
+            return []
+
+        values = self.__page["columns"]
+        missing = [col for col in range(max(first, 0), min(last, len(self.columns) - 1) + 1) if col not in values]
+        if not missing:
+            return []
+
+        rows = self.relation.project(", ".join(
+            display_expression(self.columns[col], self.types[col], self.preview_length) for col in missing
+        )).fetchall()
+        for i, col in enumerate(missing):
+            values[col] = [row[i] for row in rows]
+        self.__page["rows"] = len(rows)
+
+        return missing
+
+    def get_raw_value(self, row: int, col: int) -> Optional[object]:
+        """
+        Get the value of a cell as it was returned by DuckDB.
+
+        Args:
+            row (int): The row in the current page.
+            col (int): The column index.
+
+        Returns:
+            The value of the cell, fetching its block of columns first if needed.
+        """
+        if col not in self.__page["columns"]:
+            self.ensure_columns(col - self.COLUMN_BLOCK // 2, col + self.COLUMN_BLOCK // 2)
+        return self.__page["columns"][col][row]
+
+    def get_full_value(self, row: int, col: int) -> Optional[object]:
+        """
+        Fetch the complete value of a cell, without truncation.
+
+        Args:
+            row (int): The row in the current page.
+            col (int): The column index.
+
+        Returns:
+            The full value of the cell.
+        """
+        if not is_truncated(self.types[col]):
+            return self.get_raw_value(row, col)
+        return self.relation.limit(1, offset=row).project(quote_identifier(self.columns[col])).fetchone()[0]
+
+    def GetAttr(self, row: int, col: int, kind: int) -> wx.grid.GridCellAttr:
+        attr = self.__attrs.get(col)
+        if attr is None:
+            attr = wx.grid.GridCellAttr()
+            attr.SetRenderer(renderer_for(self, self.types[col]))
+            attr.SetReadOnly(True)
+            self.__attrs[col] = attr
+
+        attr.IncRef()
+        return attr
+
+    def GetNumberRows(self) -> int:
+        return self.__page["rows"]
+
+    def GetNumberCols(self) -> int:
+        return len(self.columns)
+
+    def GetColLabelValue(self, col: int) -> str:
+        return self.columns[col]
+
+    def GetRowLabelValue(self, row: int) -> str:
+        return str(self.offset + row + 1)
+
+    def IsEmptyCell(self, row: int, col: int) -> bool:
+        return self.get_raw_value(row, col) is None
+
+    def GetValue(self, row: int, col: int) -> str:
+        value = self.get_raw_value(row, col)
+        if value is None:
+            return ""
+        value = str(value)
+        if len(value) > self.preview_length:
+            return value[:self.preview_length] + "…"
+        return value
+
+    def SetValue(self, row: int, col: int, value: str) -> None:
+        # The Table Viewer is read-only
+        pass
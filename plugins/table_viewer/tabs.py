@@ -0,0 +1,96 @@
+import os
+from typing import TYPE_CHECKING, List
+
+import duckdb
+import wx
+
+from .components.button import PVButton
+from .components.panel import BasePanel
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from .viewer import TableViewer
+
+
+class DatasetTab:
+    """
+    The state of one open dataset in the Table Viewer.
+
+    Only the state that differs between datasets is kept per tab. The DuckDB connection, the page cache, the row counts
+    and the column overview results are shared by all tabs and keyed by the view, so switching back to a tab shows its
+    cached pages straight away.
+
+    Attributes:
+        path (str): The path of the file, directory or glob pattern.
+        view (str): The key of what the grid currently shows for this dataset, e.g. the file or a sample of it.
+        source_view (str): The view of the full dataset, e.g. the file or the picked table of a database.
+        source (duckdb.DuckDBPyRelation): The relation reading the full dataset.
+        df (duckdb.DuckDBPyRelation): The relation the grid currently shows.
+        offset (int): The row offset of the page the grid currently shows.
+        sampling (bool): Whether a sample of the dataset is shown.
+        arrow_table (pyarrow.Table): The memory-mapped table, for Arrow IPC files.
+        database (str): The name the database is attached under, for DuckDB and SQLite files.
+        diff_view (str): The view of the last comparison with another tab, see `TableViewer.diff`.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.view = path
+        self.source_view = path
+        self.source: duckdb.DuckDBPyRelation = None
+        self.df: duckdb.DuckDBPyRelation = None
+        self.offset = 0
+        self.sampling = False
+        self.arrow_table: "pyarrow.Table" = None
+        self.database: str = None
+        self.diff_view: str = None
+
+    @property
+    def name(self) -> str:
+        """
+        Get the label of the tab.
+        """
+        return os.path.basename(self.path.rstrip("/\\")) or self.path
+
+
+class TabsPanel(BasePanel):
+    """
+    The tab strip of the Table Viewer, with one button per open dataset.
+
+    The button of the active tab is disabled. Clicking another button switches the grid, the overview and the column
+    overview to that dataset, and "Close Tab" closes the active one.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __buttons (list): The tab buttons, in the order of the tabs.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        super().__init__(tv.panel)
+        self.__plugin = tv
+        self.__buttons: List[PVButton] = []
+        self.SetSizer(wx.WrapSizer(wx.HORIZONTAL))
+
+    def update(self) -> None:
+        """
+        Rebuild the tab buttons from the open tabs of the plugin.
+        """
+        self.Freeze()
+        for button in self.__buttons:
+            button.Destroy()
+        self.GetSizer().Clear()
+        self.__buttons = []
+
+        for tab in self.__plugin.tabs:
+            button = PVButton(self, tab.name, lambda event, tab=tab: self.__plugin.switch_tab(tab))
+            button.SetToolTip(tab.path)
+            if tab is self.__plugin.tab:
+                button.disable()
+            self.__buttons.append(button)
+        if self.__plugin.tabs:
+            self.__buttons.append(PVButton(self, "Close Tab", lambda event: self.__plugin.close_tab()))
+
+        self.Layout()
+        self.Thaw()
+        self.GetParent().Layout()
@@ -0,0 +1,208 @@
+from typing import List, Optional, Sequence
+
+import duckdb
+
+from .helpers import quote_identifier
+from .query import quote_literal
+
+RULE_CHECKS = ("not_null", "unique", "regex", "allowed", "min", "max")
+
+
+def parse_rules(config: Sequence[dict]) -> List[dict]:
+    """
+    Expand the rules section of the configuration into single checks.
+
+    Each entry of the section names a column and any number of checks on it, for example
+    `{"column": "age", "not_null": True, "min": 0, "max": 130}`, which becomes three rules. An entry can give a `name`,
+    which is used as the prefix of the names of its rules instead of the column. Rules that would get the same name,
+    e.g. from two entries on the same column, are numbered, as the violations are reported by name.
+
+    Args:
+        config (Sequence[dict]): The rules section of the configuration.
+
+    Returns:
+        list: One dict per check, with its name, column, check and value.
+
+    Raises:
+        ValueError: If an entry has no column or an unknown check, or the values of an allowed check are not a list.
+    """
+    rules, names = [], set()
+    for entry in config or []:
+        if "column" not in entry:
+            raise ValueError(f"Validation rule without a column: {entry}")
+        unknown = set(entry) - set(RULE_CHECKS) - {"column", "name"}
+        if unknown:
+            raise ValueError(f"Unknown validation checks for {entry['column']}: {', '.join(sorted(unknown))}")
+
+        for check in RULE_CHECKS:
+            if check not in entry or entry[check] is False:
+                continue
+            if check == "allowed" and not isinstance(entry[check], (list, tuple)):
+                raise ValueError(f"The allowed values of {entry['column']} must be a list")
+
+            name = base = f"{entry.get('name', entry['column'])} {check.replace('_', ' ')}"
+            number = 1
+            while name in names:
+                number += 1
+                name = f"{base} ({number})"
+            names.add(name)
+            rules.append({
+                "name": name,
+                "column": entry["column"],
+                "check": check,
+                "value": entry[check],
+            })
+    return rules
+
+
+def format_value(value: object) -> str:
+    """
+    Format a value of a rule as a SQL literal.
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return quote_literal(str(value))
+
+
+def violation_predicate(rule: dict) -> str:
+    """
+    Build the filter selecting the rows that violate a rule, for every check but uniqueness.
+
+    Values that are NULL only violate the not null check, so a column can be optional and still have a format.
+
+    Args:
+        rule (dict): The rule, as returned by `parse_rules`.
+
+    Returns:
+        str: The filter.
+    """
+    column = quote_identifier(rule["column"])
+    check, value = rule["check"], rule["value"]
+    if check == "not_null":
+        return f"{column} IS NULL"
+    if check == "regex":
+        return f"{column} IS NOT NULL AND NOT regexp_full_match(CAST({column} AS VARCHAR), {quote_literal(value)})"
+    if check == "allowed":
+        values = ", ".join(quote_literal(str(allowed)) for allowed in value)
+        return f"{column} IS NOT NULL AND CAST({column} AS VARCHAR) NOT IN ({values})"
+    if check == "min":
+        return f"{column} < {format_value(value)}"
+    if check == "max":
+        return f"{column} > {format_value(value)}"
+    raise ValueError(f"The {check} check has no row filter")
+
+
+def rule_error(connection: duckdb.DuckDBPyConnection, rule: dict, column_type: str) -> Optional[str]:
+    """
+    Check that the value of a rule can be evaluated on a column of a type.
+
+    A bound on a text column must be text, as numbers would be compared as text, and a bound on any other column must
+    be castable to its type. Regular expressions are compiled by DuckDB, as its syntax is not the one of Python.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to check the value on.
+        rule (dict): The rule, as returned by `parse_rules`.
+        column_type (str): The type of the column, e.g. `VARCHAR`.
+
+    Returns:
+        str: Why the rule cannot be evaluated, or None if it can.
+    """
+    check, value = rule["check"], rule["value"]
+    try:
+        if check in ("min", "max"):
+            if column_type == "VARCHAR":
+                if not isinstance(value, str):
+                    return f"{check} {value!r} is not text, but {rule['column']} is {column_type}"
+            else:
+                connection.sql(f"SELECT CAST({format_value(value)} AS {column_type})").fetchall()
+        elif check == "regex":
+            connection.sql(f"SELECT regexp_full_match('', {quote_literal(str(value))})").fetchall()
+    except duckdb.Error as e:
+        return f"{check} {value!r} does not fit {rule['column']} ({column_type}): {e}"
+    return None
+
+
+def violation_aggregate(rule: dict) -> str:
+    """
+    Build the aggregate counting the violations of a rule.
+
+    The violations of the uniqueness check are the extra copies of repeated values, so they are counted from the
+    number of values and distinct values in the same scan as the other rules.
+    """
+    if rule["check"] == "unique":
+        column = quote_identifier(rule["column"])
+        return f"COUNT({column}) - COUNT(DISTINCT {column})"
+    return f"COUNT(*) FILTER (WHERE {violation_predicate(rule)})"
+
+
+def validation_query(query: str, rules: Sequence[dict]) -> str:
+    """
+    Build the query counting the violations of all rules in a single scan.
+
+    Args:
+        query (str): The query for the relation to validate.
+        rules (Sequence[dict]): The rules, as returned by `parse_rules`.
+
+    Returns:
+        str: The query, returning a single row with the number of rows followed by the violations of each rule.
+    """
+    aggregates = ", ".join(["COUNT(*)"] + [violation_aggregate(rule) for rule in rules])
+    return f"SELECT {aggregates} FROM ({query})"
+
+
+def validate(connection: duckdb.DuckDBPyConnection, relation: duckdb.DuckDBPyRelation, rules: Sequence[dict]) -> dict:
+    """
+    Count the violations of the rules in a relation.
+
+    Rules on columns the relation does not have are reported as missing, and rules whose value does not fit the type of
+    their column as invalid (see `rule_error`), instead of being evaluated.
+
+    Args:
+        connection (duckdb.DuckDBPyConnection): The connection to run the query on.
+        relation (duckdb.DuckDBPyRelation): The relation to validate.
+        rules (Sequence[dict]): The rules, as returned by `parse_rules`.
+
+    Returns:
+        dict: The number of rows, the number of violations of each evaluated rule keyed by its name, the names of the
+            rules on missing columns and why each invalid rule cannot be evaluated, keyed by its name.
+    """
+    types = dict(zip(relation.columns, map(str, relation.types)))
+    invalid = {}
+    for rule in rules:
+        if rule["column"] in types:
+            error = rule_error(connection, rule, types[rule["column"]])
+            if error is not None:
+                invalid[rule["name"]] = error
+
+    evaluated = [rule for rule in rules if rule["column"] in types and rule["name"] not in invalid]
+    result = connection.sql(validation_query(relation.sql_query(), evaluated)).fetchone()
+    return {
+        "rows": result[0],
+        "violations": {rule["name"]: int(count) for rule, count in zip(evaluated, result[1:])},
+        "missing": [rule["name"] for rule in rules if rule["column"] not in types],
+        "invalid": invalid,
+    }
+
+
+def violating_rows(relation: duckdb.DuckDBPyRelation, rule: dict) -> duckdb.DuckDBPyRelation:
+    """
+    Select the rows of a relation that violate a rule.
+
+    The rows violating the uniqueness check are all rows sharing a repeated value, found by grouping the column.
+
+    Args:
+        relation (duckdb.DuckDBPyRelation): The relation.
+        rule (dict): The rule, as returned by `parse_rules`.
+
+    Returns:
+        duckdb.DuckDBPyRelation: The violating rows.
+    """
+    if rule["check"] != "unique":
+        return relation.filter(violation_predicate(rule))
+
+    column = quote_identifier(rule["column"])
+    return relation.filter(
+        f"{column} IN (SELECT {column} FROM ({relation.sql_query()}) GROUP BY {column} HAVING COUNT(*) > 1)"
+    )
@@ -0,0 +1,166 @@
+import threading
+from typing import TYPE_CHECKING, List
+
+import duckdb
+import wx
+import wx.grid
+
+from .components.button import PVButton
+from .components.mixins import SetFontMixin
+from .helpers import status_message
+from .metrics import add_rows
+from .validation import parse_rules, validate
+
+if TYPE_CHECKING:
+    from .viewer import TableViewer
+
+
+class ValidationFrame(SetFontMixin, wx.Frame):
+    """
+    The data quality check for the Table Viewer.
+
+    The rules are read from the `rules` section of the Table Viewer configuration, and all of them are evaluated in a
+    single scan of the data shown in the grid, so validating takes about as long as reading the file once however many
+    rules there are. The number of violations of each rule is listed, and double-clicking a rule shows its violating
+    rows in the grid.
+
+    Attributes:
+        __plugin (TableViewer): The Table Viewer plugin instance.
+        __view (str): The view the rules are checked on.
+        __rules (list): The rules listed.
+        __invalid (dict): Why each rule that could not be evaluated is invalid, keyed by its name.
+        summary_label (wx.StaticText): The number of rows checked and rules violated.
+        rules_grid (wx.grid.Grid): The rules and their violations.
+    """
+
+    def __init__(self, tv: "TableViewer") -> None:
+        """
+        Initialize the Validation Frame.
+
+        Args:
+            tv (TableViewer): The Table Viewer plugin instance.
+        """
+        super().__init__(tv.panel.GetTopLevelParent(), title=f"Validate - {tv.view}", size=(700, 500))
+        self.__plugin = tv
+        self.__view = tv.view
+        self.__rules = []
+        self.__invalid = {}
+        self.set_font()
+
+        panel = wx.Panel(self)
+        panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+        self.summary_label = wx.StaticText(panel, label="No check run yet")
+        panel.GetSizer().Add(self.summary_label, 0, wx.EXPAND | wx.ALL, 5)
+
+        self.rules_grid = wx.grid.Grid(panel)
+        self.rules_grid.CreateGrid(0, 3)
+        self.rules_grid.SetColLabelValue(0, "Rule")
+        self.rules_grid.SetColLabelValue(1, "Column")
+        self.rules_grid.SetColLabelValue(2, "Violations")
+        self.rules_grid.EnableEditing(False)
+        self.rules_grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK, self.on_rule_open)
+        panel.GetSizer().Add(self.rules_grid, 1, wx.EXPAND)
+
+        buttons = wx.Panel(panel)
+        buttons.SetSizer(wx.BoxSizer(wx.HORIZONTAL))
+        PVButton(buttons, "Validate", self.on_validate)
+        panel.GetSizer().Add(buttons, 0, wx.EXPAND)
+
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        return self.__plugin.status_bar
+
+    def on_validate(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Start checking the rules from the configuration in the background.
+        """
+        try:
+            rules = parse_rules(self.__plugin.settings.get("rules", []))
+        except ValueError as e:
+            wx.MessageBox(str(e), "Validate", wx.OK | wx.ICON_ERROR)
+            return False
+        if not rules:
+            self.summary_label.SetLabel("No rules in the rules section of the Table Viewer configuration")
+            return False
+
+        self.__view = self.__plugin.view
+        self.summary_label.SetLabel("Validating...")
+        validate_thread = threading.Thread(
+            target=self.validate_thread,
+            args=(self.__plugin.cursor(), self.__plugin.grid.df.sql_query(), rules),
+            daemon=True
+        )
+        validate_thread.start()
+        return True
+
+    @status_message("Validating", 1)
+    def validate_thread(self, cursor: duckdb.DuckDBPyConnection, query: str, rules: List[dict]) -> bool:
+        """
+        Count the violations of the rules.
+
+        Args:
+            cursor (duckdb.DuckDBPyConnection): The cursor to run the query on.
+            query (str): The query for the relation shown in the grid.
+            rules (list): The rules to check.
+        """
+        try:
+            result = validate(cursor, cursor.sql(query), rules)
+        except duckdb.Error as e:
+            wx.CallAfter(self.show_error, str(e))
+            return False
+        add_rows(result["rows"])
+        wx.CallAfter(self.show_result, rules, result)
+        return True
+
+    def show_error(self, message: str) -> None:
+        """
+        Show why the rules could not be checked.
+        """
+        if self:
+            self.summary_label.SetLabel(f"Unable to validate: {message}")
+
+    def show_result(self, rules: List[dict], result: dict) -> None:
+        """
+        Show the violations of the rules.
+        """
+        if not self:
+            return
+
+        self.__rules = rules
+        self.__invalid = result["invalid"]
+        violated = sum(1 for count in result["violations"].values() if count)
+        self.summary_label.SetLabel(
+            f"{result['rows']} rows checked, {violated} of {len(result['violations'])} rules violated"
+            + (f", {len(result['missing'])} rules on missing columns" if result["missing"] else "")
+            + (f", {len(result['invalid'])} invalid rules" if result["invalid"] else "")
+        )
+
+        if self.rules_grid.GetNumberRows():
+            self.rules_grid.DeleteRows(0, self.rules_grid.GetNumberRows())
+        self.rules_grid.AppendRows(len(rules))
+        for i, rule in enumerate(rules):
+            self.rules_grid.SetCellValue(i, 0, rule["name"])
+            self.rules_grid.SetCellValue(i, 1, rule["column"])
+            if rule["name"] in result["violations"]:
+                self.rules_grid.SetCellValue(i, 2, str(result["violations"][rule["name"]]))
+            elif rule["name"] in result["invalid"]:
+                self.rules_grid.SetCellValue(i, 2, f"Invalid: {result['invalid'][rule['name']]}")
+            else:
+                self.rules_grid.SetCellValue(i, 2, "Missing column")
+        self.rules_grid.AutoSize()
+        self.Layout()
+
+    def on_rule_open(self, event: wx.grid.GridEvent) -> bool:
+        if self.__plugin.view != self.__view:
+            wx.MessageBox("The grid no longer shows the data the rules were checked on", "Validate", wx.OK | wx.ICON_INFORMATION)
+            return False
+        rule = self.__rules[event.GetRow()]
+        if rule["column"] not in self.__plugin.grid.df.columns or rule["name"] in self.__invalid:
+            return False
+        return self.__plugin.show_violations(rule)
+
+    def on_close(self, event: wx.CloseEvent) -> None:
+        self.__plugin.validation = None
+        event.Skip()
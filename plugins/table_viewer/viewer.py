@@ -0,0 +1,1114 @@
+import logging
+import os
+import threading
+from pathlib import Path
+
+import duckdb
+import wx
+import wx.grid
+
+from .aggregation_frame import AggregationFrame
+from .cache import PageCache
+from .columns import ColumnOverviewPanel
+from .compare import CompareDialog
+from .components import PVButton
+from .components.panel import BasePanel
+from .database import DATABASE_TYPES, attach_database, detach_database, list_tables, search_path, table_query
+from .dataset import dataset_files, detect_format, is_glob, list_files, split_suffix
+from .diff import DIFF_TABLE, diff_counts, diff_query, format_counts
+from .duplicates import member_predicate
+from .duplicates_frame import DuplicatesFrame
+from .engine import Dataset, Session
+from .file_search_frame import FileSearchFrame
+from .follow import FileFollower, can_follow
+from .grid import GridPanel
+from .helpers import status_message
+from .inspector import ParquetInspector
+from .load_file import LoadFilePanel
+from .metrics import METRICS
+from .metrics_frame import MetricsFrame
+from .overview import OverviewPanel
+from .parquet import format_pruning
+from .query import SAMPLE_TABLE, sample_query
+from .tabs import DatasetTab, TabsPanel
+from .validation import violating_rows
+from .validation_frame import ValidationFrame
+
+
+class TableViewer:
+    """
+    The Table Viewer Plugin
+
+    This plugin allows the user to view the contents of a tabular file. The plugin allows the user to load a file
+    and view the data in a grid. The plugin also provides an overview of the file, including the total number of
+    rows, the total number of columns, and the column names.
+
+    The plugin also provides pagination to allow the user to navigate through the data in the file.
+
+    The plugin uses DuckDB to read the Parquet, JSON, and CSV files and display the data in a grid. Files are opened
+    progressively: the first page is shown as soon as the schema is known, while the row count and the column overview
+    are calculated in the background.
+
+    The plugin provides the following functionality:
+    - Load File: Load a file to view the data
+    - Overview: View an overview of the file
+    - Grid: View the data in a grid
+    - Pagination: Navigate through the data in the file
+    - Sample: Browse a uniform random sample of the file
+    - Inspect: View the row groups, encodings and statistics of a Parquet file
+    - Duplicates: Find the groups of rows sharing the same key, or the same values altogether
+    - Compare: View the rows added, removed or changed between two open datasets, matched by key columns
+    - Aggregate: Summarize the data by group columns with counts, sums, averages and distinct counts, optionally
+      pivoted on a column, and drill into a group
+    - Search Files: Search every data file in a directory in parallel, and open the files that match
+    - Validate: Check the data against the rules in the configuration in a single scan, and browse the violations
+    - Metrics: View the median and 95th percentile latency of every operation since the application started
+
+    Besides single files, a directory or a glob pattern can be opened as one dataset. Hive partition directories
+    (`key=value`) are exposed as columns, and searches are pushed down into the scan so partitions and Parquet row
+    groups that cannot match are skipped.
+
+    Arrow IPC (Feather v2) files are memory-mapped and each page is a zero-copy slice of the mapped record batches.
+
+    DuckDB and SQLite database files are attached read-only, and a table or view is picked from them. Paging, searching
+    and profiling run as queries inside the attached database.
+
+    Every opened dataset gets its own tab. The tabs share one DuckDB connection with one memory limit, and one page
+    cache that evicts pages fairly across the tabs, so switching back to a tab shows its cached pages and overview
+    without querying the file again. Background work for hidden tabs is paused until they are shown again.
+
+    CSV and newline-delimited JSON files that are still being written can be followed, like `tail -f`. Only the bytes
+    appended since the last poll are parsed, and the grid can keep scrolling to the newest rows.
+
+    The data is read through a headless `engine.Session`, which opens, pages, searches, profiles and exports datasets
+    without depending on wx. The panels are views over it, so the same data path can be scripted and benchmarked.
+
+    Every operation shown in the status bar records its wall time, CPU time and rows processed in `metrics.METRICS`,
+    and the status bar shows how long it took. The metrics are written to the `metrics_dump` file, if configured, when
+    the plugin stops.
+
+    # Limitations
+    - The plugin only supports Parquet, CSV, JSON (optionally gzip or zstd compressed), Arrow IPC, DuckDB and SQLite
+      files
+    - The plugin only supports reading data from the file
+    - The plugin only supports viewing the data in a grid
+    - The plugin only supports navigating through the data in the file with pagination
+
+    # Future Improvements
+    - Add support for other file formats
+    - Add support for editing data in the grid
+    - Add support for filtering data in the grid
+    - Add support for sorting data in the grid
+    - Add support for searching data in the grid
+    - Add support for exporting data from the grid
+
+    # Known Issues
+    - The grid may not resize correctly when the plugin frame is resized. Reloading the plugin will fix this issue.
+
+    # Dependencies
+    - DuckDB: To read the file and display the data in a grid
+    - wxPython: To create the user interface
+    """
+    BASE_SPAN = 10
+
+    def __init__(self):
+        """
+        Initialize the Table Viewer Plugin
+        """
+        self.logger = logging.getLogger("table_viewer")
+        self.panel = None
+        self.__button = None
+        self.grid = None
+        self.overview = None
+        self.pagination = None
+        self.environment = None
+        self.tab = None
+        self.tabs = []
+        self.databases = []
+        self.inspector = None
+        self.duplicates = None
+        self.validation = None
+        self.aggregation = None
+        self.file_search = None
+        self.metrics = None
+        self.aggregations = PageCache(16)
+        self.load_file_button = None
+        self.tabs_panel = None
+        self.__visibility = threading.Condition()
+        self.follower = None
+        self.auto_scroll = True
+        self.session = Session()
+        self.sample_size = 100
+        self.filters = set()
+
+    @property
+    def name(self) -> str:
+        """
+        Get the name of the plugin.
+
+        Returns:
+            str: The name of the plugin.
+        """
+        return "Table Viewer"
+
+    @property
+    def plugin_frame(self) -> wx.Frame:
+        """
+        Get the plugin frame.
+
+        Returns:
+            wx.Frame: The plugin frame.
+        """
+        return self.environment.get("plugin_frame") if self.environment else None
+
+    @property
+    def status_bar(self) -> wx.StatusBar:
+        """
+        Get the status bar.
+
+        Returns:
+            wx.StatusBar: The status bar.
+        """
+        return self.environment.get("status_bar") if self.environment else None
+
+    @property
+    def path(self) -> str:
+        """
+        Get the path of the dataset in the active tab.
+
+        Returns:
+            str: The path of a file or directory, or a glob pattern, or None if no dataset is open.
+        """
+        return self.tab.path if self.tab else None
+
+    @property
+    def view(self) -> str:
+        """
+        Get the key of what the grid shows, e.g. the file or a sample of it. Row counts and background results are
+        stored under this key.
+
+        Returns:
+            str: The view of the active tab, or None if no dataset is open.
+        """
+        return self.tab.view if self.tab else None
+
+    @view.setter
+    def view(self, value: str) -> None:
+        self.tab.view = value
+        with self.__visibility:
+            self.__visibility.notify_all()
+
+    @property
+    def source(self) -> duckdb.DuckDBPyRelation:
+        """
+        Get the relation reading the full dataset in the active tab.
+        """
+        return self.tab.source if self.tab else None
+
+    @source.setter
+    def source(self, value: duckdb.DuckDBPyRelation) -> None:
+        self.tab.source = value
+
+    @property
+    def source_view(self) -> str:
+        """
+        Get the view of the full dataset in the active tab.
+        """
+        return self.tab.source_view if self.tab else None
+
+    @source_view.setter
+    def source_view(self, value: str) -> None:
+        self.tab.source_view = value
+
+    @property
+    def arrow_table(self):
+        """
+        Get the memory-mapped Arrow table of the active tab.
+
+        Returns:
+            pyarrow.Table: The table, or None if the active tab is not an Arrow IPC file.
+        """
+        return self.tab.arrow_table if self.tab else None
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        """
+        Get the connection of the session all datasets are read through.
+        """
+        return self.session.connection
+
+    @property
+    def files(self) -> tuple:
+        """
+        Get the files of the loaded dataset.
+
+        Returns:
+            tuple: The paths of the files that make up the dataset.
+        """
+        return dataset_files(self.path) if self.path else ()
+
+    @property
+    def settings(self) -> dict:
+        """
+        Get the Table Viewer section of the configuration.
+
+        Returns:
+            dict: The Table Viewer settings.
+        """
+        return self.environment.get("table_viewer", {}) if self.environment else {}
+
+    def stop(self) -> bool:
+        """
+        Stop the Table Viewer.
+
+        This method is called when the plugin needs to be stopped. It destroys the panel associated with the plugin,
+        effectively stopping the plugin.
+
+        Returns:
+            bool: True if the plugin was stopped successfully.
+        """
+        self.logger.debug("Stopping Table Viewer")
+        self.stop_following()
+        self.dump_metrics()
+        self.tab = None
+        self.tabs = []
+        with self.__visibility:
+            self.__visibility.notify_all()
+        if self.panel:
+            self.panel.Destroy()
+        return True
+
+    def run(self, environment) -> bool:
+        """
+        Run the Table Viewer.
+
+        This method is called to start the plugin. It initializes the user interface, binds the necessary events.
+
+        Args:
+            environment (Environment): The environment to run the plugin in.
+        """
+        self.logger.debug("Running Table Viewer")
+        self.environment = environment
+        wx.CallAfter(self.__initialize_ui)
+        wx.CallAfter(self.__bind_events)
+        return True
+
+    def __initialize_ui(self) -> None:
+        """
+        Initialize the user interface.
+
+        This method sets up the panel, sizers, and various UI elements for the plugin, including the load file button,
+        overview label, grid, overview, pagination, and a spacer.
+        """
+        self.panel = wx.Panel(self.plugin_frame)
+        self.panel_sizer = wx.FlexGridSizer(3, 2, self.BASE_SPAN, self.BASE_SPAN)
+        self.panel_sizer.AddGrowableCol(0, 2)
+        self.panel_sizer.AddGrowableCol(1, 1)
+        self.panel_sizer.AddGrowableRow(1, 4)
+
+        self.main_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.main_sizer.Add(self.panel_sizer, 1, wx.EXPAND | wx.ALL, self.BASE_SPAN)
+        self.panel.SetSizer(self.main_sizer)
+
+        self.session.configure(self.settings)
+
+        self.overview = OverviewPanel(self)
+        self.panel_sizer.Add(self.overview, 1, wx.EXPAND)
+        self.tabs_panel = TabsPanel(self)
+        self.panel_sizer.Add(self.tabs_panel, 1, wx.EXPAND)
+        self.grid = GridPanel(self)
+        self.panel_sizer.Add(self.grid, 1, wx.EXPAND)
+        self.column_overview = ColumnOverviewPanel(self)
+        self.panel_sizer.Add(self.column_overview, 1, wx.EXPAND)
+        self.load_file_button = LoadFilePanel(self)
+        self.panel_sizer.Add(self.load_file_button, 1, wx.EXPAND)
+
+        self.panel.SetSize(self.plugin_frame.GetSize())
+        self.panel.Show()
+
+    def __bind_events(self) -> None:
+        """
+        Bind the resizing events to the plugin frame to ensure the panel resizes correctly.
+
+        This method binds various resize-related events to the plugin frame, such as wx.EVT_SIZE, wx.EVT_MAXIMIZE,
+        wx.EVT_ICONIZE, wx.EVT_CLOSE, wx.EVT_MOVE, and wx.EVT_SIZING. When these events are triggered, the on_size
+        method is called to resize the panel accordingly.
+        """
+        for event in [wx.EVT_SIZE, wx.EVT_MAXIMIZE, wx.EVT_ICONIZE, wx.EVT_CLOSE, wx.EVT_MOVE, wx.EVT_SIZING]:
+            self.plugin_frame.Bind(event, self.on_size)
+
+    @status_message("Begin loading file", record=False)
+    def load_file(self, event: wx.CommandEvent) -> bool:
+        """
+        Load a file.
+
+        This method opens a file dialog to allow the user to select a file to load. Supported file types include Parquet,
+        CSV, and JSON, where CSV and JSON files may be gzip or zstd compressed. Once a file is selected, the method sets
+        up the grid, activates the pagination, loads the data, and updates the overview.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the file loading.
+
+        Returns:
+            bool: True if the file was loaded successfully.
+        """
+        file_dialog = wx.FileDialog(
+            self.panel, "Open File",
+            wildcard="Parquet files (*.parquet)|*.parquet"
+                     "|CSV files (*.csv, *.tsv, *.csv.gz, *.csv.zst)|*.csv;*.tsv;*.csv.gz;*.csv.zst"
+                     "|JSON files (*.json, *.jsonl, *.ndjson, *.gz, *.zst)|*.json;*.jsonl;*.ndjson;*.json.gz;*.jsonl.gz;*.ndjson.gz;*.json.zst;*.jsonl.zst;*.ndjson.zst"
+                     "|Arrow IPC files (*.arrow, *.feather, *.ipc)|*.arrow;*.feather;*.ipc"
+                     "|Databases (*.duckdb, *.sqlite)|*.duckdb;*.ddb;*.sqlite;*.sqlite3"
+                     "|All files|*",
+            style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST
+        )
+
+        if not Path(file_dialog.GetPath()).exists():
+            self.logger.error("File does not exist")
+            return False
+
+        if file_dialog.ShowModal() == wx.ID_OK:
+            self.logger.debug("Loading File")
+            return self.open_path(file_dialog.GetPath())
+
+        return True
+
+    @status_message("Opening file")
+    def open_path(self, path: str) -> bool:
+        """
+        Open a file in a new tab of the Table Viewer. If the file is already open, its tab is shown instead, and if it is
+        the active tab nothing is done.
+
+        The file is opened progressively. The first page is shown as soon as DuckDB knows the schema of the file. The
+        row count and the column overview are calculated in the background, and fill in the overview and the
+        pagination bounds when they are ready.
+
+        Args:
+            path (str): The path of the file to open.
+
+        Returns:
+            bool: True if the file is shown, whether it was opened now or already.
+        """
+        for tab in self.tabs:
+            if tab.path == path:
+                return tab is self.tab or self.switch_tab(tab)
+
+        self.save_tab()
+        self.tab = DatasetTab(path)
+        self.tabs.append(self.tab)
+        self.logger.debug(f"Path: {self.path}")
+
+        self.grid.df = None
+        self.grid.sample_size = self.sample_size
+        self.grid.sample_panel.set_sampling(False)
+
+        try:
+            if split_suffix(self.path)[0] in DATABASE_TYPES:
+                self.attach_database(self.path)
+                if not self.choose_table():
+                    self.close_tab()
+                    return False
+                return True
+
+            dataset = self.session.open(self.path)
+            self.tab.arrow_table = dataset.arrow_table
+            self.source = dataset.relation
+            self.grid.df = self.source
+            self.refresh_view()
+
+        except (duckdb.InvalidInputException, duckdb.IOException, FileNotFoundError, ValueError, ImportError) as e:
+            self.logger.error(f"Error loading file: {e}")
+            wx.MessageBox(f"Error loading file: {e}", "Error", wx.OK | wx.ICON_ERROR)
+            self.close_tab()
+            return False
+
+        self.tabs_panel.update()
+        return True
+
+    def save_tab(self) -> None:
+        """
+        Store the state of the grid in the active tab, before another tab is shown.
+        """
+        self.stop_following()
+        if self.tab is None:
+            return
+        self.tab.df = self.grid.df
+        self.tab.offset = self.grid.offset
+        self.tab.sampling = self.grid.sample_panel.sampling
+
+    @status_message("Switching tab")
+    def switch_tab(self, tab: DatasetTab) -> bool:
+        """
+        Show another open dataset.
+
+        Nothing is read from the file again: the pages, the row count and the column overview of the tab are taken from
+        the shared caches, and background work that was paused while the tab was hidden resumes.
+
+        Args:
+            tab (DatasetTab): The tab to show.
+
+        Returns:
+            bool: True if the tab was switched.
+        """
+        if tab is self.tab:
+            return False
+
+        self.save_tab()
+        self.tab = tab
+        with self.__visibility:
+            self.__visibility.notify_all()
+        if tab.database:
+            self.connection.execute(f"SET search_path = '{search_path(self.search_order())}'")
+
+        self.grid.df = tab.df
+        self.grid.offset = tab.offset
+        self.grid.sample_panel.set_sampling(tab.sampling)
+        self.overview.update(total_rows=self.grid.row_count, columns=self.grid.df.columns)
+        self.grid.show_data()
+        self.grid.count_rows()
+        self.column_overview.update()
+        self.tabs_panel.update()
+        return True
+
+    def close_tab(self, tab: DatasetTab = None) -> bool:
+        """
+        Close a tab and release everything only it was using: its cached pages, its sample table, and the Arrow file or
+        database it opened.
+
+        Args:
+            tab (DatasetTab): The tab to close, or None for the active tab.
+
+        Returns:
+            bool: True if a tab was closed.
+        """
+        tab = tab or self.tab
+        if tab not in self.tabs:
+            return False
+
+        if tab is self.tab:
+            self.stop_following()
+        self.tabs.remove(tab)
+        self.grid.page_cache.evict_owner(id(tab))
+        self.aggregations.evict_owner(id(tab))
+        self.connection.execute(f"DROP TABLE IF EXISTS {self.sample_table(tab)}")
+        self.connection.execute(f"DROP TABLE IF EXISTS {DIFF_TABLE}_{id(tab)}")
+        if tab.arrow_table is not None and not any(other.path == tab.path for other in self.tabs):
+            self.session.unregister_arrow(tab.path)
+        if tab.database and not any(other.database == tab.database for other in self.tabs):
+            detach_database(self.connection, tab.database)
+            self.databases.remove(tab.database)
+
+        if tab is self.tab:
+            self.tab = None
+            if self.tabs:
+                self.switch_tab(self.tabs[-1])
+            else:
+                self.grid.df = None
+        with self.__visibility:
+            self.__visibility.notify_all()
+        self.tabs_panel.update()
+        return True
+
+    def wait_until_visible(self, view: str) -> bool:
+        """
+        Block a background thread while the tab its view belongs to is hidden.
+
+        Args:
+            view (str): The view the thread is working on.
+
+        Returns:
+            bool: True once the view is shown, False if the view is no longer shown by any tab and the work should be
+                dropped.
+        """
+        with self.__visibility:
+            while view != self.view:
+                if not any(tab.view == view for tab in self.tabs):
+                    return False
+                self.__visibility.wait()
+        return True
+
+    def sample_table(self, tab: DatasetTab = None) -> str:
+        """
+        Get the name of the table holding the sample of a tab.
+        """
+        return f"{SAMPLE_TABLE}_{id(tab or self.tab)}"
+
+    def replace_table(self, table: str, query: str) -> duckdb.DuckDBPyRelation:
+        """
+        Build a table in the in-memory database from a query, replacing the table of the same name, and get its rows.
+
+        Cached pages are keyed by the query of the relation they were read from, and the query of a table is its name,
+        so the pages cached for a replaced table would be shown again. They are evicted with the other pages of the tab.
+
+        Args:
+            table (str): The name of the table.
+            query (str): The query the table is built from.
+
+        Returns:
+            duckdb.DuckDBPyRelation: The rows of the table.
+        """
+        self.connection.execute(f"CREATE OR REPLACE TABLE {table} AS {query}")
+        self.grid.page_cache.evict_owner(id(self.tab))
+        return self.connection.table(table)
+
+    def cursor(self) -> duckdb.DuckDBPyConnection:
+        """
+        Get a new cursor on the connection, for queries that run in a background thread.
+
+        The cursor comes from the session, with the Arrow files registered on it, and the attached databases are put
+        on its search path, as the search path is not shared between cursors.
+
+        Returns:
+            duckdb.DuckDBPyConnection: The cursor.
+        """
+        cursor = self.session.cursor()
+        if self.databases:
+            cursor.execute(f"SET search_path = '{search_path(self.search_order())}'")
+        return cursor
+
+    def search_order(self) -> list:
+        """
+        Get the attached databases in the order their tables are looked up, the database of the active tab first.
+        """
+        current = [self.tab.database] if self.tab and self.tab.database else []
+        return current + [alias for alias in self.databases if alias not in current]
+
+    def attach_database(self, path: str) -> bool:
+        """
+        Attach a DuckDB or SQLite database file read-only for the active tab.
+
+        Args:
+            path (str): The path of the database file.
+
+        Returns:
+            bool: True if a database was attached.
+        """
+        self.tab.database = attach_database(self.connection, path, split_suffix(path)[0])
+        if self.tab.database not in self.databases:
+            self.databases.append(self.tab.database)
+        self.connection.execute(f"SET search_path = '{search_path(self.search_order())}'")
+        return True
+
+    @status_message("Opening table")
+    def choose_table(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Let the user pick a table or view of the attached database, and show it in the grid.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the table picker.
+
+        Returns:
+            bool: True if a table was opened.
+        """
+        if self.tab is None or not self.tab.database:
+            wx.MessageBox("Tables can only be picked from DuckDB and SQLite files", "Tables", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        tables = list_tables(self.connection, self.tab.database)
+        if not tables:
+            wx.MessageBox("The database has no tables", "Tables", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        choices = [f"{schema}.{table} ({'view' if table_type == 'VIEW' else 'table'})" for schema, table, table_type in tables]
+        dialog = wx.SingleChoiceDialog(self.panel, "Choose a table or view", "Tables", choices)
+        if dialog.ShowModal() != wx.ID_OK:
+            dialog.Destroy()
+            return False
+        schema, table, _ = tables[dialog.GetSelection()]
+        dialog.Destroy()
+
+        self.stop_following()
+        self.grid.sample_panel.set_sampling(False)
+        self.source_view = f"{self.path} ({schema}.{table})"
+        self.view = self.source_view
+        self.source = self.connection.sql(table_query(self.tab.database, schema, table))
+        self.grid.df = self.source
+        self.refresh_view()
+        self.tabs_panel.update()
+        return True
+
+    def follow(self, enable: bool) -> bool:
+        """
+        Start or stop following the loaded file as it grows.
+
+        While the file is followed, a background thread polls its size and parses only the complete lines appended
+        since the last poll into a table in the in-memory database. The row count is kept up to date without counting
+        the file again, and if auto-scroll is on the grid jumps to the last page whenever rows are appended.
+
+        Args:
+            enable (bool): True to start following the file, False to stop.
+
+        Returns:
+            bool: True if the file is being followed.
+        """
+        if not enable:
+            if self.stop_following() and self.source is not None:
+                self.view = self.source_view
+                self.grid.df = self.source
+                self.refresh_view()
+            return False
+
+        if self.source is None or not can_follow(self.path):
+            wx.MessageBox("Only uncompressed CSV and JSON lines files can be followed", "Follow", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        self.grid.sample_panel.set_sampling(False)
+        self.grid.df = self.source
+        self.view = f"{self.path} (following)"
+        self.follower = FileFollower(
+            self.cursor(), self.path, list(zip(self.source.columns, map(str, self.source.types))),
+            on_append=lambda rows: wx.CallAfter(self.on_follow_append, rows),
+            interval=self.settings.get("follow_interval", 1.0),
+            on_error=lambda message: wx.CallAfter(self.on_follow_error, message),
+        )
+        self.follower.start()
+        self.load_file_button.set_following(True)
+        return True
+
+    def stop_following(self) -> bool:
+        """
+        Stop the follower thread, if the loaded file is being followed.
+
+        Returns:
+            bool: True if a follower was stopped.
+        """
+        if self.follower is None:
+            return False
+
+        self.follower.stop()
+        self.follower = None
+        if self.load_file_button:
+            self.load_file_button.set_following(False)
+        return True
+
+    def on_follow_error(self, message: str) -> bool:
+        """
+        Stop following after the follower stopped on an error, and show why. Appended rows are no longer read then.
+
+        Args:
+            message (str): The error of the follower.
+
+        Returns:
+            bool: True if following was stopped.
+        """
+        if self.follower is None:
+            return False
+
+        self.follow(False)
+        wx.MessageBox(f"Stopped following {self.path}: {message}", "Follow", wx.OK | wx.ICON_ERROR)
+        return True
+
+    def on_follow_append(self, rows: int) -> bool:
+        """
+        Update the grid after the follower parsed new rows.
+
+        Args:
+            rows (int): The number of new rows.
+
+        Returns:
+            bool: True if the grid was updated.
+        """
+        if self.follower is None:
+            return False
+
+        # Cached pages at the end of the file may have been short, so they are fetched again
+        self.grid.page_cache.evict_owner(id(self.tab))
+        total_rows = self.follower.total_rows
+        self.grid.set_row_count(total_rows)
+        if self.auto_scroll:
+            self.grid.offset = max(0, total_rows - self.sample_size)
+        if self.auto_scroll or rows == 0:
+            self.grid.show_data()
+        return True
+
+    def refresh_view(self) -> None:
+        """
+        Show the first page of the current view, and start counting its rows and updating the column overview in the
+        background.
+        """
+        self.grid.offset = 0
+        self.overview.update(total_rows=self.grid.row_count, columns=self.grid.df.columns)
+        self.grid.show_data()
+        self.grid.count_rows()
+        self.column_overview.update()
+
+    @status_message("Sampling file")
+    def sample(self, rows: int, seed: int) -> bool:
+        """
+        Browse a uniform random sample of the file instead of the file itself.
+
+        The sample is drawn once and kept in a table in the in-memory database, so paging, the column overview and the
+        search run against the sample in well under a second. Parquet files are sampled per row with a known
+        probability, as their row count is read from the metadata. Streamed formats use reservoir sampling.
+
+        Args:
+            rows (int): The number of rows to sample.
+            seed (int): The seed for the sample.
+
+        Returns:
+            bool: True if the sample is shown.
+        """
+        if self.source is None:
+            return False
+
+        self.stop_following()
+        total_rows = None
+        if detect_format(self.path) == "parquet":
+            total_rows = self.source.aggregate("COUNT(*)").fetchone()[0]
+
+        self.view = f"{self.source_view} (sample of {rows} rows, seed {seed})"
+        self.grid.df = self.replace_table(
+            self.sample_table(), sample_query(self.source.sql_query(), rows, seed, total_rows)
+        )
+        self.refresh_view()
+        return True
+
+    def compare(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Compare the active dataset with another open dataset, or go back to the full dataset if a comparison is shown.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the comparison.
+
+        Returns:
+            bool: True if a comparison is shown.
+        """
+        if self.tab is not None and self.tab.diff_view is not None and self.view == self.tab.diff_view:
+            self.browse_full_file()
+            return False
+
+        if self.source is None or not any(tab is not self.tab and tab.source is not None for tab in self.tabs):
+            wx.MessageBox("Open the other version of the dataset in a second tab first", "Compare", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        dialog = CompareDialog(self)
+        if dialog.ShowModal() != wx.ID_OK:
+            dialog.Destroy()
+            return False
+        old, keys = dialog.get_comparison()
+        dialog.Destroy()
+
+        if not keys:
+            wx.MessageBox("Pick at least one key column", "Compare", wx.OK | wx.ICON_INFORMATION)
+            return False
+        return self.diff(old, keys)
+
+    @status_message("Comparing datasets")
+    def diff(self, old: DatasetTab, keys: list) -> bool:
+        """
+        Show the rows that were added, removed or changed between another open dataset and the active dataset.
+
+        The diff is calculated once, with a hash join that reads each dataset a single time, and kept in a table in the
+        in-memory database. Paging through the diff and counting it does not read the files again. Besides the values,
+        the diff has a flag per column telling whether that column changed.
+
+        Args:
+            old (DatasetTab): The tab holding the old version of the dataset.
+            keys (list): The columns identifying a row in both versions.
+
+        Returns:
+            bool: True if the diff is shown.
+        """
+        try:
+            query = diff_query(old.source, self.source, keys)
+        except ValueError as e:
+            wx.MessageBox(str(e), "Compare", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        self.stop_following()
+        self.grid.sample_panel.set_sampling(False)
+        self.tab.diff_view = f"{self.source_view} (compared with {old.source_view} by {', '.join(keys)})"
+        self.view = self.tab.diff_view
+        self.grid.df = self.replace_table(f"{DIFF_TABLE}_{id(self.tab)}", query)
+        self.refresh_view()
+
+        counts = format_counts(diff_counts(self.grid.df))
+        self.logger.debug(f"Diff: {counts}")
+        self.status_bar.SetStatusText(f"Diff: {counts}", 1)
+        return True
+
+    def find_duplicates(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Open the duplicates tool for the data shown in the grid.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the duplicates tool.
+
+        Returns:
+            bool: True if the duplicates tool was opened.
+        """
+        if self.source is None:
+            return False
+
+        if self.duplicates is not None:
+            self.duplicates.Destroy()
+        self.duplicates = DuplicatesFrame(self)
+        self.duplicates.Show()
+        return True
+
+    @status_message("Showing duplicates")
+    def show_duplicates(self, columns: list, values: tuple) -> bool:
+        """
+        Show the rows of a group of duplicates in the grid.
+
+        Args:
+            columns (list): The key columns of the group.
+            values (tuple): The values of the key of the group.
+
+        Returns:
+            bool: True if the rows are shown.
+        """
+        self.grid.show_data(self.grid.df.filter(member_predicate(self.grid.df, columns, values)), offset=0, limit=1000)
+        return True
+
+    def aggregate(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Open the aggregation view for the data shown in the grid.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the aggregation view.
+
+        Returns:
+            bool: True if the aggregation view was opened.
+        """
+        if self.source is None:
+            return False
+
+        if self.aggregation is not None:
+            self.aggregation.Destroy()
+        self.aggregation = AggregationFrame(self)
+        self.aggregation.Show()
+        return True
+
+    @status_message("Showing group")
+    def show_group(self, columns: list, values: tuple) -> bool:
+        """
+        Show the rows of a group of the aggregation view in the grid.
+
+        Args:
+            columns (list): The group columns.
+            values (tuple): The values of the group columns.
+
+        Returns:
+            bool: True if the rows are shown.
+        """
+        self.grid.show_data(self.grid.df.filter(member_predicate(self.grid.df, columns, values)), offset=0, limit=1000)
+        return True
+
+    def show_metrics(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Open the latency metrics of the Table Viewer.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the metrics.
+
+        Returns:
+            bool: True if the metrics were opened.
+        """
+        if self.metrics is None:
+            self.metrics = MetricsFrame(self)
+        self.metrics.Show()
+        self.metrics.Raise()
+        return True
+
+    def dump_metrics(self) -> bool:
+        """
+        Write the recorded metrics to the file in the `metrics_dump` setting, if there is one.
+
+        Returns:
+            bool: True if the metrics were written.
+        """
+        path = self.settings.get("metrics_dump")
+        if not path:
+            return False
+        try:
+            METRICS.dump(path)
+        except OSError as e:
+            self.logger.warning(f"Unable to write metrics to {path}: {e}")
+            return False
+        return True
+
+    def search_directory(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Open the directory search tool.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the directory search.
+
+        Returns:
+            bool: True if the directory search was opened.
+        """
+        if self.file_search is None:
+            self.file_search = FileSearchFrame(self)
+        self.file_search.Show()
+        self.file_search.Raise()
+        return True
+
+    def validate(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Open the data quality check for the data shown in the grid, and check the configured rules.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the check.
+
+        Returns:
+            bool: True if the check was opened.
+        """
+        if self.source is None:
+            return False
+
+        if self.validation is not None:
+            self.validation.Destroy()
+        self.validation = ValidationFrame(self)
+        self.validation.Show()
+        self.validation.on_validate()
+        return True
+
+    @status_message("Showing violations")
+    def show_violations(self, rule: dict) -> bool:
+        """
+        Show the rows violating a validation rule in the grid.
+
+        Args:
+            rule (dict): The rule, as returned by `validation.parse_rules`.
+
+        Returns:
+            bool: True if the rows are shown.
+        """
+        self.grid.show_data(violating_rows(self.grid.df, rule), offset=0, limit=1000)
+        return True
+
+    @status_message("Leaving sample mode")
+    def browse_full_file(self) -> bool:
+        """
+        Go back to browsing the full file after browsing a sample.
+
+        Returns:
+            bool: True if the full file is shown.
+        """
+        if self.source is None:
+            return False
+
+        self.view = self.source_view
+        self.grid.df = self.source
+        self.refresh_view()
+        return True
+
+    @status_message("Reading Parquet footers")
+    def inspect(self, event: wx.CommandEvent = None) -> bool:
+        """
+        Open the Parquet Inspector for the loaded dataset.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the inspector.
+
+        Returns:
+            bool: True if the inspector was opened.
+        """
+        if self.path is None or detect_format(self.path) != "parquet":
+            wx.MessageBox("The inspector is only available for Parquet files", "Parquet Inspector", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        if self.inspector is None:
+            self.inspector = ParquetInspector(self)
+        self.inspector.update_layout()
+        self.inspector.Show()
+        self.inspector.Raise()
+        return True
+
+    @status_message("Opening folder", record=False)
+    def load_folder(self, event: wx.CommandEvent) -> bool:
+        """
+        Load all data files in a folder as one dataset.
+
+        Args:
+            event (wx.CommandEvent): The event that triggered the folder loading.
+
+        Returns:
+            bool: True if the folder was loaded successfully.
+        """
+        dir_dialog = wx.DirDialog(self.panel, "Open Folder", style=wx.DD_DEFAULT_STYLE | wx.DD_DIR_MUST_EXIST)
+
+        if dir_dialog.ShowModal() == wx.ID_OK:
+            self.logger.debug("Loading Folder")
+            return self.open_path(dir_dialog.GetPath())
+
+        return True
+
+    @status_message("Getting total size")
+    def get_size(self) -> str:
+        """
+        Get the size of the file.
+
+        This method retrieves the size of the file, using the file path as a key to cache the result. If the size is not
+        yet cached, it is calculated and stored in the cache. For a folder or glob the sizes of all files are added up.
+
+        Returns:
+            int: The size of the file.
+        """
+        if Path(self.path).is_dir() or is_glob(self.path):
+            size = sum(os.path.getsize(file) for file in list_files(self.path))
+        else:
+            size = os.path.getsize(self.path)
+        if size < 1024:
+            return f"{size} B"
+        elif size < 1024 ** 2:
+            return f"{size / 1024:.2f} KB"
+        elif size < 1024 ** 3:
+            return f"{size / 1024 ** 2:.2f} MB"
+        else:
+            return f"{size / 1024 ** 3:.2f} GB"
+
+    @status_message("Recalculate window size", record=False)
+    def on_size(self, event: wx.SizeEvent) -> bool:
+        """
+        Resize the panel so all elements are visible.
+
+        This method is called when the plugin frame is resized. It sets the size of the panel to match the size of the
+        plugin frame, and then layouts and refreshes the panel.
+
+        Args:
+            event (wx.SizeEvent): The event that triggered the resize.
+
+        Returns:
+            bool: True if the panel was resized successfully.
+        """
+        self.logger.trace("Resizing panel")
+        self.panel.SetSize(self.plugin_frame.GetSize())
+        self.panel.Layout()
+        self.panel.Refresh()
+        event.Skip()
+        return True
+
+    @status_message(f"Searching")
+    def search(self, column: str, search: str, search_style: str = "Exact") -> bool:
+        """
+        Search for a value in a column.
+
+        This method searches for a value in a column and highlights the cell in the grid that contains the value. The
+        search is combined with the active filters into a single filter, so DuckDB can push it down into the scan.
+
+        Args:
+            column (str): The column to search in.
+            search (str): The value to search for.
+            search_style (str): How to compare the column with the value.
+
+        Returns:
+            bool: True if the value was found and highlighted successfully.
+        """
+        dataset = Dataset(self.connection, self.grid.df, self.path if self.view == self.path else None)
+        found = dataset.search(column, search, search_style, self.filters)
+
+        report = dataset.pruning(column, search, search_style)
+        if report is not None:
+            self.logger.debug(format_pruning(report))
+            self.status_bar.SetStatusText(format_pruning(report), 1)
+            if self.inspector is not None:
+                self.inspector.update_report(report)
+
+        if found.row_count() == 0:
+            wx.MessageBox("No results found", "Search Results", wx.OK | wx.ICON_INFORMATION)
+            return False
+
+        self.grid.show_data(found.relation, limit=1000)
+        return True
@@ -0,0 +1,46 @@
+import unittest
+
+import duckdb
+
+from plugins.table_viewer.aggregation import aggregation_query, measure_expression
+from plugins.table_viewer.duplicates import member_predicate
+
+
+class TestAggregation(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.query = "SELECT range AS id, range % 3 AS a, 'k' || (range % 2) AS b, range AS v FROM range(100)"
+
+    def test_group_by(self):
+        summary = self.connection.sql(
+            aggregation_query(self.query, ["a"], [("count", None), ("sum", "v"), ("distinct", "b")])
+        )
+        self.assertEqual(summary.columns, ["a", "count(*)", "sum(v)", "distinct(b)"])
+        self.assertEqual(summary.fetchall(), [(0, 34, 1683, 2), (1, 33, 1617, 2), (2, 33, 1650, 2)])
+
+    def test_no_groups(self):
+        self.assertEqual(self.connection.sql(aggregation_query(self.query, [], [("avg", "v")])).fetchall(), [(49.5,)])
+
+    def test_pivot(self):
+        summary = self.connection.sql(aggregation_query(self.query, ["a"], [("count", None)], "b"))
+        self.assertEqual(summary.columns, ["a", "k0_count(*)", "k1_count(*)"])
+        self.assertEqual(sorted(summary.fetchall()), [(0, 17, 17), (1, 16, 17), (2, 17, 16)])
+
+    def test_pivot_without_groups(self):
+        summary = self.connection.sql(aggregation_query(self.query, [], [("sum", "v")], "b"))
+        self.assertEqual(summary.fetchall(), [(2450, 2500)])
+
+    def test_drill_down(self):
+        a, b, count = self.connection.sql(aggregation_query(self.query, ["a", "b"], [("count", None)])).fetchone()
+        relation = self.connection.sql(self.query)
+        rows = relation.filter(member_predicate(relation, ["a", "b"], (a, b)))
+        self.assertEqual(len(rows), count)
+        self.assertEqual(set(rows.project("a, b").fetchall()), {(a, b)})
+
+    def test_unknown_measure(self):
+        with self.assertRaises(ValueError):
+            measure_expression("median", "v")
+
+
+if __name__ == "__main__":
+    unittest.main()
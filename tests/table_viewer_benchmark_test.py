@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.table_viewer import (
+    benchmark_dataset, compare, generate_dataset, register_pool, search_specs, value_pool
+)
+from plugins.table_viewer.engine import Session
+
+
+class TestBenchmark(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = value_pool(50)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.session = Session()
+        register_pool(self.session.connection, self.pool)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return str(Path(self.directory.name) / name)
+
+    def test_value_pool_is_deterministic(self):
+        self.assertEqual(value_pool(50), self.pool)
+
+    def test_generate_dataset(self):
+        self.assertEqual(generate_dataset(self.session, self.path("a.parquet"), 2000, 20, 50), 2000)
+        self.assertEqual(generate_dataset(self.session, self.path("a.parquet"), 2000, 20, 50), 0)
+        generate_dataset(self.session, self.path("b.ndjson"), 2000, 20, 50)
+
+        first, second = self.session.open(self.path("a.parquet")), self.session.open(self.path("b.ndjson"))
+        self.assertEqual(len(first.columns), 20)
+        self.assertEqual(first.relation.order("id").fetchall()[:100], second.relation.order("id").fetchall()[:100])
+        self.assertAlmostEqual(first.search("email", "", "Is Empty").row_count(), 200, delta=50)
+        self.assertFalse(list(Path(self.directory.name).glob(".partial-*")))
+
+    def test_benchmark_dataset(self):
+        generate_dataset(self.session, self.path("narrow.csv"), 2000, 9, 50)
+        results = benchmark_dataset(self.session, self.path("narrow.csv"), search_specs(self.pool), 2, 500)
+        self.assertEqual(
+            [result["operation"] for result in results],
+            ["open", "count", "first page", "deep page", "search Exact", "search Contains", "search Starts With",
+             "search Ends With", "search Is Empty", "search Is not Empty", "profile", "export parquet"]
+        )
+        self.assertTrue(all(len(result["seconds"]) == 2 and result["rows"] == 2000 for result in results))
+        self.assertEqual(list(Path(self.directory.name).iterdir()), [Path(self.path("narrow.csv"))])
+
+    def test_compare(self):
+        previous = [
+            {"dataset": "a", "operation": "open", "best": 1.0},
+            {"dataset": "a", "operation": "profile", "best": 2.0},
+        ]
+        current = [
+            {"dataset": "a", "operation": "open", "best": 1.1},
+            {"dataset": "a", "operation": "profile", "best": 3.0},
+            {"dataset": "b", "operation": "open", "best": 9.0},
+        ]
+        regressions = compare(previous, current)
+        self.assertEqual([(regression["operation"], regression["ratio"]) for regression in regressions], [("profile", 1.5)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from plugins.table_viewer.cache import PageCache
+
+
+class TestPageCache(unittest.TestCase):
+    def test_least_recently_used(self):
+        cache = PageCache(2)
+        cache.put("a", {})
+        cache.put("b", {})
+        cache.get("a")
+        cache.put("c", {})
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+    def test_fair_eviction(self):
+        cache = PageCache(4)
+        cache.put("first", {}, owner=1)
+        for page in range(3):
+            cache.put(page, {}, owner=2)
+        cache.put("second", {}, owner=1)
+
+        # The owner with the most pages loses its oldest page, not the globally oldest page
+        self.assertIsNotNone(cache.get("first"))
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(len(cache), 4)
+
+    def test_evict_owner(self):
+        cache = PageCache()
+        cache.put("a", {}, owner=1)
+        cache.put("b", {}, owner=2)
+        cache.evict_owner(1)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import io
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.cli import expand_paths, main, output_path, run, worker_settings
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        connection = duckdb.connect()
+        for partition in ("a", "b"):
+            (self.root / "data" / partition).mkdir(parents=True)
+            connection.execute(
+                f"COPY (SELECT range AS duns, 'name' || range AS name FROM range(100)) "
+                f"TO '{self.root / 'data' / partition / 'part0.parquet'}'"
+            )
+        self.csv = self.root / "data" / "extra.csv"
+        self.csv.write_text("duns,name\n50,x\n51,\n")
+        (self.root / "data" / "store.duckdb").write_text("")
+        self.config = self.root / "table_viewer.yaml"
+        self.config.write_text(
+            "table_viewer:\n  profile_chunk_rows: 10\n  rules:\n    - column: name\n      not_null: true\n"
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_no_gui_imports(self):
+        imports = subprocess.run(
+            [sys.executable, "-c", "import sys, plugins.table_viewer.cli; print(sorted(sys.modules))"],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True
+        ).stdout
+        self.assertNotIn("'wx'", imports)
+
+    def test_expand_paths(self):
+        files = expand_paths([str(self.root / "data"), str(self.csv)])
+        self.assertEqual(
+            [name for _, name in files],
+            ["a/part0.parquet", "b/part0.parquet", "extra.csv"]
+        )
+
+    def test_output_path(self):
+        self.assertEqual(output_path("a/part0.parquet", "out", ".csv"), str(Path("out/a/part0.csv")))
+        self.assertEqual(output_path("events.jsonl.gz", "out", ".parquet"), str(Path("out/events.parquet")))
+
+    def test_worker_settings(self):
+        settings = worker_settings({"memory_limit": "4GiB", "threads": 8, "sample_size": 10}, 4)
+        self.assertEqual(settings, {"memory_limit": f"{1024 ** 3} bytes", "threads": 2, "sample_size": 10})
+        self.assertEqual(worker_settings({"threads": 2}, 4)["threads"], 1)
+
+    def test_profile(self):
+        output = io.StringIO()
+        failed = run("profile", expand_paths([str(self.csv)]), {"chunk_rows": 10}, {}, 1, output)
+        self.assertEqual(failed, 0)
+        result = json.loads(output.getvalue())
+        self.assertTrue(result["complete"])
+        self.assertEqual([column["Column Name"] for column in result["columns"]], ["duns", "name"])
+
+    def test_convert(self):
+        output = io.StringIO()
+        options = {"suffix": ".csv", "output_dir": str(self.root / "out")}
+        failed = run("convert", expand_paths([str(self.root / "data")]), options, {}, 2, output, "json")
+        self.assertEqual(failed, 0)
+        results = json.loads(output.getvalue())
+        self.assertEqual([result["rows"] for result in results], [100, 100, 2])
+        self.assertTrue((self.root / "out" / "b" / "part0.csv").exists())
+
+    def test_search(self):
+        output = io.StringIO()
+        options = {"column": "duns", "value": "50", "style": "Exact"}
+        run("search", expand_paths([str(self.root / "data")]), options, {}, 2, output)
+        hits = {Path(result["file"]).name: result["hits"] for result in map(json.loads, output.getvalue().splitlines())}
+        self.assertEqual(hits, {"part0.parquet": 1, "extra.csv": 1})
+
+    def test_validate_fails_on_violations(self):
+        results = self.root / "results.jsonl"
+        self.assertEqual(main(["validate", str(self.csv), "--config", str(self.config), "--output", str(results)]), 1)
+        result = json.loads(results.read_text())
+        self.assertEqual(result["violations"], {"name not null": 1})
+
+    def test_error(self):
+        missing = self.root / "missing.csv"
+        output = io.StringIO()
+        self.assertEqual(run("profile", [(str(missing), missing.name)], {"chunk_rows": 10}, {}, 1, output), 1)
+        self.assertIn("error", json.loads(output.getvalue()))
+
+
+if __name__ == '__main__':
+    unittest.main()
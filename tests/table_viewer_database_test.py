@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.database import attach_database, database_alias, list_tables, search_path, table_query
+
+
+class TestDatabase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / "warehouse.duckdb")
+        with duckdb.connect(self.path) as database:
+            database.execute("CREATE TABLE orders AS SELECT range AS id, range % 7 AS customer FROM range(100)")
+            database.execute("CREATE VIEW big_orders AS SELECT * FROM orders WHERE id >= 90")
+        self.connection = duckdb.connect()
+
+    def tearDown(self):
+        self.connection.close()
+        self.directory.cleanup()
+
+    def test_attach_once(self):
+        alias = attach_database(self.connection, self.path, "duckdb")
+        self.assertEqual(alias, database_alias(self.path))
+        self.assertEqual(attach_database(self.connection, self.path, "duckdb"), alias)
+
+    def test_attach_read_only(self):
+        alias = attach_database(self.connection, self.path, "duckdb")
+        with self.assertRaises(duckdb.Error):
+            self.connection.execute(f'INSERT INTO "{alias}".main.orders VALUES (1, 1)')
+
+    def test_list_tables(self):
+        alias = attach_database(self.connection, self.path, "duckdb")
+        self.assertEqual(
+            list_tables(self.connection, alias),
+            [("main", "big_orders", "VIEW"), ("main", "orders", "BASE TABLE")]
+        )
+
+    def test_view(self):
+        alias = attach_database(self.connection, self.path, "duckdb")
+        self.connection.execute(f"SET search_path = '{search_path([alias])}'")
+        cursor = self.connection.cursor()
+        cursor.execute(f"SET search_path = '{search_path([alias])}'")
+        self.assertEqual(cursor.sql(table_query(alias, "main", "big_orders")).aggregate("COUNT(*)").fetchone()[0], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.dataset import dataset_query, detect_format, is_hive_partitioned, list_files, split_suffix
+
+
+class TestDataset(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.connection = duckdb.connect()
+        self.connection.execute(
+            f"COPY (SELECT range AS id, (range % 3)::VARCHAR AS region FROM range(300)) "
+            f"TO '{self.root / 'sales'}' (FORMAT parquet, PARTITION_BY (region))"
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_list_files(self):
+        self.assertEqual(len(list_files(str(self.root / "sales"))), 3)
+        (self.root / "sales" / "region=3").mkdir()
+        self.connection.execute(f"COPY (SELECT 1 AS id) TO '{self.root / 'sales' / 'region=3' / 'new.parquet'}'")
+        self.assertEqual(len(list_files(str(self.root / "sales"))), 4)
+
+    def test_detect_format(self):
+        self.assertEqual(detect_format(str(self.root / "sales")), "parquet")
+
+    def test_hive_partitioning(self):
+        self.assertTrue(is_hive_partitioned(str(self.root / "sales")))
+        self.assertTrue(is_hive_partitioned(str(self.root / "sales" / "*" / "*.parquet")))
+
+    def test_dataset_exposes_partition_columns(self):
+        relation = self.connection.sql(dataset_query(str(self.root / "sales")))
+        self.assertIn("region", relation.columns)
+        self.assertEqual(relation.aggregate("COUNT(*)").fetchone()[0], 300)
+
+    def test_single_file(self):
+        path = self.root / "single.csv"
+        self.connection.execute(f"COPY (SELECT 1 AS a) TO '{path}'")
+        self.assertEqual(self.connection.sql(dataset_query(str(path))).fetchall(), [(1,)])
+
+    def test_split_suffix(self):
+        self.assertEqual(split_suffix("events.jsonl.gz"), ("json", "gzip"))
+        self.assertEqual(split_suffix("export.2024.csv.zst"), ("csv", "zstd"))
+        self.assertEqual(split_suffix("data.parquet"), ("parquet", None))
+        self.assertEqual(split_suffix("archive.tar.gz"), (None, "gzip"))
+
+    def test_compressed_file_is_read_as_stream(self):
+        path = self.root / "compressed.csv.gz"
+        self.connection.execute(f"COPY (SELECT range AS a FROM range(10)) TO '{path}'")
+        relation = self.connection.sql(dataset_query(str(path)))
+        self.assertEqual(relation.aggregate("COUNT(*)").fetchone()[0], 10)
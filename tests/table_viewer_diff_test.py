@@ -0,0 +1,49 @@
+import unittest
+
+import duckdb
+
+from plugins.table_viewer.diff import diff_counts, diff_query
+
+
+class TestDiff(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.old = self.connection.sql("SELECT range AS id, range % 7 AS amount, 'a' || range AS name FROM range(5)")
+        self.new = self.connection.sql(
+            "SELECT range AS id, CASE WHEN range = 2 THEN 99 ELSE range % 7 END AS amount, 'a' || range AS name "
+            "FROM range(1, 7)"
+        )
+
+    def test_counts(self):
+        diff = self.connection.sql(diff_query(self.old, self.new, ["id"]))
+        self.assertEqual(diff_counts(diff), {"added": 2, "removed": 1, "changed": 1})
+
+    def test_change_flags(self):
+        diff = self.connection.sql(diff_query(self.old, self.new, ["id"]))
+        changed = diff.filter("change = 'changed'").fetchall()
+        self.assertEqual(changed, [("changed", 2, 99, True, "a2", False)])
+
+    def test_removed_rows_keep_old_values(self):
+        diff = self.connection.sql(diff_query(self.old, self.new, ["id"]))
+        self.assertEqual(diff.filter("change = 'removed'").project("id, amount").fetchall(), [(0, 0)])
+
+    def test_null_keys(self):
+        old = self.connection.sql("SELECT * FROM (VALUES (NULL, 1), (1, 2)) AS t(id, amount)")
+        new = self.connection.sql("SELECT * FROM (VALUES (NULL, 1), (1, 3)) AS t(id, amount)")
+        diff = self.connection.sql(diff_query(old, new, ["id"]))
+        self.assertEqual(diff_counts(diff), {"added": 0, "removed": 0, "changed": 1})
+
+    def test_column_clashes(self):
+        old = self.connection.sql("SELECT 1 AS id, 'x' AS change")
+        with self.assertRaises(ValueError):
+            diff_query(old, old, ["id"])
+        with self.assertRaises(ValueError):
+            diff_query(self.connection.sql("SELECT 1 AS id, true AS __present"), self.old, ["id"])
+
+    def test_identical(self):
+        diff = self.connection.sql(diff_query(self.old, self.old, ["id", "name"]))
+        self.assertEqual(diff_counts(diff), {"added": 0, "removed": 0, "changed": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+import duckdb
+
+from plugins.table_viewer.distribution import histogram, is_binned, top_values
+
+
+class TestDistribution(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.query = (
+            "SELECT range AS amount, DATE '2024-01-01' + (range % 40)::INTEGER AS day, (range % 4)::VARCHAR AS code "
+            "FROM range(1000)"
+        )
+        self.types = self.connection.sql(self.query).types
+
+    def test_is_binned(self):
+        self.assertEqual([is_binned(column_type) for column_type in self.types], [True, True, False])
+
+    def test_numeric_histogram(self):
+        bins = histogram(self.connection, self.query, "amount", self.types[0], bins=4)
+        self.assertEqual([count for _, count in bins], [250, 250, 250, 250])
+        self.assertTrue(bins[0][0].startswith("0 - "))
+
+    def test_date_histogram(self):
+        bins = histogram(self.connection, self.query, "day", self.types[1], bins=4)
+        self.assertEqual(sum(count for _, count in bins), 1000)
+        self.assertTrue(bins[0][0].startswith("2024-01-01"))
+
+    def test_single_value(self):
+        self.assertEqual(histogram(self.connection, "SELECT 5 AS amount", "amount", duckdb.typing.INTEGER), [("5", 1)])
+
+    def test_top_values(self):
+        self.assertEqual(top_values(self.connection, self.query, "code", limit=2), [("0", 250), ("1", 250)])
+
+
+if __name__ == "__main__":
+    unittest.main()
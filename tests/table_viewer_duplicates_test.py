@@ -0,0 +1,40 @@
+import unittest
+
+import duckdb
+
+from plugins.table_viewer.duplicates import duplicate_groups, duplicate_summary, member_predicate
+
+
+class TestDuplicates(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.relation = self.connection.sql(
+            "SELECT range % 3 AS customer, (range % 2)::VARCHAR AS region, range AS id FROM range(10)"
+        )
+
+    def test_groups(self):
+        groups = duplicate_groups(self.relation, ["customer"])
+        self.assertEqual(sorted(groups.project("customer, group_size").fetchall()), [(0, 4), (1, 3), (2, 3)])
+        self.assertEqual(groups.fetchone()[0], 4)
+        self.assertEqual(duplicate_summary(groups), {"groups": 3, "rows": 10, "extra": 7})
+
+    def test_unique_key(self):
+        self.assertEqual(duplicate_summary(duplicate_groups(self.relation, ["id"])), {"groups": 0, "rows": 0, "extra": 0})
+
+    def test_members(self):
+        groups = duplicate_groups(self.relation, ["customer", "region"])
+        size, customer, region = groups.fetchone()
+        members = self.relation.filter(member_predicate(self.relation, ["customer", "region"], (customer, region))).fetchall()
+
+        self.assertEqual(len(members), size)
+        self.assertTrue(all(row[:2] == (customer, region) for row in members))
+
+    def test_null_key(self):
+        relation = self.connection.sql("SELECT * FROM (VALUES (NULL, 1), (NULL, 2), (1, 3)) AS t(customer, id)")
+        size, customer = duplicate_groups(relation, ["customer"]).fetchone()
+        self.assertEqual((size, customer), (2, None))
+        self.assertEqual(len(relation.filter(member_predicate(relation, ["customer"], (customer,)))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
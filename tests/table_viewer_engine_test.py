@@ -0,0 +1,65 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.engine import Dataset, Session
+
+
+class TestEngine(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / "data.parquet")
+        self.session = Session({"memory_limit": "1GB", "temp_directory": self.directory.name})
+        self.session.connection.execute(
+            f"COPY (SELECT range AS id, 'x' || (range % 10) AS code FROM range(100000)) TO '{self.path}' (ROW_GROUP_SIZE 10000)"
+        )
+        self.dataset = self.session.open(self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_open_and_page(self):
+        self.assertEqual(self.dataset.columns, ["id", "code"])
+        self.assertEqual(self.dataset.row_count(), 100000)
+        self.assertEqual(self.dataset.page(10, 2), [(10, "x0"), (11, "x1")])
+        self.assertEqual(self.dataset.page(0, 1, ["code"]), [("x0",)])
+
+    def test_search(self):
+        found = self.dataset.search("code", "x3", filters=["id < 100"])
+        self.assertEqual(found.row_count(), 10)
+        self.assertEqual(self.dataset.pruning("id", "15000"), {"total": 10, "pruned": 9, "scanned": 1})
+
+    def test_profile_progress(self):
+        progress = []
+        rows, complete = self.dataset.profile(lambda rows, text: progress.append(text), chunk_rows=30000)
+        self.assertTrue(complete)
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[-1], "Profiled all 100,000 rows")
+        self.assertEqual(rows[0][:3], ("id", "100.00%", "Unique"))
+
+    def test_profile_late_row_count(self):
+        counts = iter([None, 100000])
+        progress = []
+        self.dataset.profile(lambda rows, text: progress.append(text), chunk_rows=30000, total_rows=lambda: next(counts))
+        self.assertNotIn(" of ", progress[0])
+        self.assertIn("of 100,000 rows", progress[1])
+
+    def test_profile_cancel(self):
+        dataset = Dataset.from_query(self.session.cursor(), self.dataset.relation.sql_query())
+        rows, complete = dataset.profile(lambda rows, text: dataset.cancel(), chunk_rows=30000)
+        self.assertFalse(complete)
+        self.assertEqual(len(rows), 2)
+
+    def test_export(self):
+        path = str(Path(self.directory.name) / "out.csv")
+        self.assertEqual(self.dataset.search("code", "x1").export(path), 10000)
+        self.assertEqual(duckdb.sql(f"SELECT COUNT(*) FROM '{path}'").fetchone()[0], 10000)
+        with self.assertRaises(ValueError):
+            self.dataset.export(str(Path(self.directory.name) / "out.xlsx"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.file_search import search_file, search_files
+
+
+class TestFileSearch(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.connection = duckdb.connect()
+        self.files = []
+        for i in range(4):
+            path = Path(self.directory.name) / f"part{i}.parquet"
+            self.connection.execute(
+                f"COPY (SELECT range + {i * 1000} AS duns FROM range(1000)) TO '{path}' (ROW_GROUP_SIZE 100)"
+            )
+            self.files.append(str(path))
+        self.csv = Path(self.directory.name) / "extra.csv"
+        self.csv.write_text("duns,name\n2500,a\n7,b\n")
+        self.other = Path(self.directory.name) / "other.csv"
+        self.other.write_text("id\n2500\n")
+        self.files += [str(self.csv), str(self.other), str(Path(self.directory.name) / "cached.arrow")]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_search_file(self):
+        self.assertEqual(search_file(self.connection, self.files[2], "duns", "2500")["hits"], 1)
+        self.assertEqual(search_file(self.connection, self.files[0], "duns", "2500")["outcome"], "pruned")
+        self.assertEqual(search_file(self.connection, str(self.other), "duns", "2500")["outcome"], "no column")
+
+    def test_search_files(self):
+        results = []
+        searched = search_files(self.connection, self.files, "duns", "2500", "Exact", results.append, workers=2)
+        self.assertEqual(searched, 6)
+        outcomes = {Path(result["file"]).name: (result["outcome"], result["hits"]) for result in results}
+        self.assertEqual(outcomes["part2.parquet"], ("match", 1))
+        self.assertEqual(outcomes["extra.csv"], ("match", 1))
+        self.assertEqual(outcomes["part0.parquet"], ("pruned", 0))
+        self.assertEqual(outcomes["other.csv"], ("no column", 0))
+
+    def test_cancelled(self):
+        cancelled = threading.Event()
+        cancelled.set()
+        results = []
+        self.assertEqual(search_files(self.connection, self.files, "duns", "2500", "Exact", results.append, cancelled), 0)
+        self.assertEqual(results, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
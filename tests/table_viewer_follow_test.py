@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.follow import FileFollower, can_follow, follow_page
+
+
+class TestFollow(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / "events.csv"
+        self.path.write_text("id;name\n1;a\n2;b\n")
+        self.connection = duckdb.connect()
+        source = self.connection.sql(f"SELECT * FROM '{self.path}'")
+        self.appended = []
+        self.follower = FileFollower(
+            self.connection.cursor(), str(self.path), list(zip(source.columns, map(str, source.types))),
+            self.appended.append, interval=60
+        )
+
+    def tearDown(self):
+        self.follower.stop()
+        self.directory.cleanup()
+
+    def start(self):
+        self.follower.start()
+        while self.follower.base_rows is None:
+            self.follower.join(0.01)
+
+    def test_can_follow(self):
+        self.assertTrue(can_follow(str(self.path)))
+        self.assertFalse(can_follow(str(self.path) + ".gz"))
+        lines, array = Path(self.directory.name) / "lines.json", Path(self.directory.name) / "array.json"
+        lines.write_text('{"id": 1}\n{"id": 2}\n')
+        array.write_text('[\n  {"id": 1},\n  {"id": 2}\n]\n')
+        self.assertTrue(can_follow(str(lines)))
+        self.assertFalse(can_follow(str(array)))
+
+    def test_existing_rows(self):
+        self.start()
+        self.assertEqual(self.follower.base_rows, 2)
+        self.assertEqual(self.appended, [0])
+
+    def test_poll_complete_lines(self):
+        self.start()
+        with open(self.path, "a") as file:
+            file.write("3;c\n4;d\n5;partial")
+
+        self.assertEqual(self.follower.poll(), 2)
+        self.assertEqual(self.follower.total_rows, 4)
+        self.assertEqual(self.follower.poll(), 0)
+
+        with open(self.path, "a") as file:
+            file.write("\n")
+        self.assertEqual(self.follower.poll(), 1)
+
+    def test_follow_page(self):
+        self.start()
+        with open(self.path, "a") as file:
+            file.write("3;c\n4;d\n")
+        self.follower.poll()
+
+        page = follow_page(self.connection, self.follower.head_query, self.follower.base_rows, 1, 2)
+        self.assertEqual(page.fetchall(), [(2, "b"), (3, "c")])
+        page = follow_page(self.connection, self.follower.head_query, self.follower.base_rows, 3, 10)
+        self.assertEqual(page.fetchall(), [(4, "d")])
+
+    def test_truncated(self):
+        self.start()
+        self.path.write_text("id;name\n")
+        with self.assertRaises(ValueError):
+            self.follower.poll()
+
+    def test_poll_errors_stop_following(self):
+        errors = []
+        self.follower.on_error = errors.append
+        self.follower.interval = 0.01
+        self.start()
+        with open(self.path, "a") as file:
+            file.write("x;y\n")
+        self.follower.join(5)
+        self.assertFalse(self.follower.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(self.follower.total_rows, 2)
+
+    def test_follow_error(self):
+        errors = []
+        follower = FileFollower(
+            self.connection.cursor(), str(Path(self.directory.name) / "gone.csv"), self.follower.columns,
+            self.appended.append, interval=60, on_error=errors.append
+        )
+        follower.start()
+        follower.join(5)
+        self.assertFalse(follower.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(self.appended, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import importlib.util
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from plugins.table_viewer.metrics import BUCKET_BOUNDS, METRICS, MetricsRegistry, bucket_index, format_duration, percentile
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry()
+
+    def test_bucket_index(self):
+        self.assertEqual(bucket_index(0.0005), 0)
+        self.assertEqual(bucket_index(0.003), 2)
+        self.assertEqual(bucket_index(10 ** 6), len(BUCKET_BOUNDS))
+
+    def test_percentile(self):
+        histogram = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.assertIsNone(percentile(histogram, 0.5, 0.0))
+        histogram[0] = 90
+        histogram[10] = 10
+        self.assertLessEqual(percentile(histogram, 0.5, 1.0), BUCKET_BOUNDS[0])
+        self.assertGreater(percentile(histogram, 0.95, 1.0), BUCKET_BOUNDS[9])
+        self.assertLessEqual(percentile(histogram, 0.95, 1.0), BUCKET_BOUNDS[10])
+        self.assertEqual(percentile(histogram, 0.95, 0.6), 0.6)
+
+    def test_format_duration(self):
+        self.assertEqual(format_duration(0.35), "350 ms")
+        self.assertEqual(format_duration(2.414), "2.41 s")
+        self.assertEqual(format_duration(185), "3 min 05 s")
+
+    def test_nested_rows(self):
+        outer = self.metrics.start("open")
+        self.metrics.add_rows(5)
+        inner = self.metrics.start("page")
+        self.metrics.add_rows(100)
+        self.metrics.stop(inner)
+        self.metrics.stop(outer)
+        self.metrics.add_rows(7)
+        rows = {operation["operation"]: operation["rows"] for operation in self.metrics.summary()}
+        self.assertEqual(rows, {"open": 5, "page": 100})
+
+    def test_summary(self):
+        for seconds in (0.01, 0.02, 0.03, 2.0):
+            self.metrics.record("search", seconds, seconds / 2, 1000)
+        self.metrics.record("search", 0.01, 0.0, failed=True)
+        summary, = self.metrics.summary()
+        self.assertEqual((summary["calls"], summary["errors"], summary["rows"]), (5, 1, 4000))
+        self.assertEqual(summary["last"], 0.01)
+        self.assertEqual(summary["max"], 2.0)
+        self.assertLess(summary["p50"], 0.05)
+        self.assertGreater(summary["p95"], 1.0)
+
+    def test_threads(self):
+        def work():
+            for _ in range(100):
+                self.metrics.stop(self.metrics.start("count"))
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.metrics.summary()[0]["calls"], 400)
+
+    def test_dump(self):
+        self.metrics.record("open", 0.1, 0.05)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "metrics.json"
+            self.metrics.dump(str(path))
+            dump = json.loads(path.read_text())
+        self.assertEqual(dump["operations"][0]["operation"], "open")
+        self.assertEqual(sum(dump["histograms"]["open"]["wall"]), 1)
+
+
+
+@unittest.skipUnless(importlib.util.find_spec("wx"), "wxPython is not installed")
+class TestStatusMessage(unittest.TestCase):
+    def setUp(self):
+        from plugins.table_viewer.helpers import status_message
+
+        class Frame:
+            status_bar = mock.Mock()
+            status_bar.GetStatusText.return_value = "Searching took 120 ms"
+
+            @status_message("Searching test rows")
+            def search(self):
+                return True
+
+            @status_message("Resizing test window", record=False)
+            def on_size(self):
+                return True
+
+        self.frame = Frame()
+        METRICS.reset()
+
+    def test_recorded(self):
+        with mock.patch("wx.IsMainThread", return_value=True):
+            self.frame.search()
+        self.assertEqual([operation["operation"] for operation in METRICS.summary()], ["Searching test rows"])
+        self.assertTrue(self.frame.status_bar.SetStatusText.call_args[0][0].startswith("Searching test rows took"))
+
+    def test_not_recorded(self):
+        with mock.patch("wx.IsMainThread", return_value=True):
+            self.frame.on_size()
+        self.assertEqual(METRICS.summary(), [])
+        self.frame.status_bar.SetStatusText.assert_called_with("Searching took 120 ms", 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.ndjson import is_ndjson, ndjson_query, ndjson_schema
+
+
+class TestNDJSON(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.lines = self.root / "events.json"
+        self.lines.write_text('{"id": 1, "name": "a"}\n{"id": 2, "name": "b"}\n')
+
+    def tearDown(self):
+        ndjson_schema.cache_clear()
+        self.directory.cleanup()
+
+    def test_is_ndjson(self):
+        array = self.root / "array.json"
+        array.write_text('[{"id": 1},\n{"id": 2}]')
+        pretty = self.root / "pretty.json"
+        pretty.write_text('{\n  "id": 1\n}\n')
+
+        self.assertTrue(is_ndjson(str(self.lines)))
+        self.assertTrue(is_ndjson(str(self.root / "missing.jsonl")))
+        self.assertFalse(is_ndjson(str(array)))
+        self.assertFalse(is_ndjson(str(pretty)))
+
+    def test_is_ndjson_gzip(self):
+        compressed = self.root / "events.json.gz"
+        compressed.write_bytes(gzip.compress(self.lines.read_bytes()))
+        self.assertTrue(is_ndjson(str(compressed), "gzip"))
+
+    def test_ndjson_query(self):
+        rows = duckdb.sql(ndjson_query(str(self.lines))).fetchall()
+        self.assertEqual(rows, [(1, "a"), (2, "b")])
+
+    def test_schema_cached_per_fingerprint(self):
+        ndjson_query(str(self.lines))
+        ndjson_query(str(self.lines))
+        self.assertEqual(ndjson_schema.cache_info().misses, 1)
+
+        with open(self.lines, "a") as file:
+            file.write('{"id": 3, "name": "c", "extra": true}\n')
+        self.assertIn("extra", ndjson_query(str(self.lines)))
+
+
+if __name__ == "__main__":
+    unittest.main()
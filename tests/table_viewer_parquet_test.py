@@ -0,0 +1,38 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import duckdb
+
+from plugins.table_viewer.parquet import parquet_layout, row_group_pruning
+
+
+class TestRowGroupPruning(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.directory.name) / "data.parquet")
+        self.connection = duckdb.connect()
+        self.connection.execute(
+            f"COPY (SELECT range AS id, 'name ' || range AS name FROM range(300000)) "
+            f"TO '{self.path}' (FORMAT parquet, ROW_GROUP_SIZE 100000)"
+        )
+        self.types = dict(zip(*[getattr(self.connection.sql(f"SELECT * FROM '{self.path}'"), attr) for attr in ("columns", "types")]))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_layout_has_a_row_per_column_chunk(self):
+        rows = parquet_layout(self.connection, [self.path]).fetchall()
+        self.assertEqual(len(rows), 3 * 2)
+
+    def test_exact_search_prunes_row_groups(self):
+        report = row_group_pruning(self.connection, [self.path], "id", self.types["id"], "150000", "Exact")
+        self.assertEqual(report, {"total": 3, "pruned": 2, "scanned": 1})
+
+    def test_value_outside_statistics_prunes_everything(self):
+        report = row_group_pruning(self.connection, [self.path], "id", self.types["id"], "-1", "Exact")
+        self.assertEqual(report["scanned"], 0)
+
+    def test_contains_cannot_prune(self):
+        report = row_group_pruning(self.connection, [self.path], "name", self.types["name"], "5", "Contains")
+        self.assertEqual(report["pruned"], 0)
@@ -0,0 +1,70 @@
+import unittest
+from itertools import islice
+
+import duckdb
+
+from plugins.table_viewer.profile import (
+    PROFILE_COLUMNS, estimate_change, format_progress, profile_passes, profile_query, profile_ratios, profile_rows
+)
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.relation = self.connection.sql(
+            "SELECT range AS id, CASE WHEN range % 2 = 0 THEN range END AS even, repeat('x', (range % 5)::INTEGER + 1) AS code, "
+            "DATE '2024-01-01' + range::INTEGER AS day FROM range(100)"
+        )
+
+    def profile(self, rows_to_check=None):
+        query = profile_query(self.relation.sql_query(), self.relation.columns, self.relation.types, rows_to_check)
+        return profile_rows(self.connection.sql(query).fetchone(), self.relation.columns)
+
+    def test_single_scan(self):
+        query = profile_query(self.relation.sql_query(), self.relation.columns, self.relation.types)
+        self.assertEqual(query.count("FROM ("), 1)
+
+    def test_numeric(self):
+        rows = {row[0]: dict(zip(PROFILE_COLUMNS, row)) for row in self.profile()}
+        self.assertEqual(rows["id"]["Coverage"], "100.00%")
+        self.assertEqual(rows["id"]["Unique Values"], "Unique")
+        self.assertEqual((rows["id"]["Min"], rows["id"]["Max"], rows["id"]["Mean"]), ("0", "99", "49.5"))
+        self.assertEqual(rows["id"]["Min Length"], "")
+        self.assertEqual(rows["even"]["Coverage"], "50.00%")
+        self.assertEqual(rows["even"]["Unique Values"], "50.00%")
+
+    def test_text_and_date(self):
+        rows = {row[0]: dict(zip(PROFILE_COLUMNS, row)) for row in self.profile()}
+        self.assertEqual((rows["code"]["Min Length"], rows["code"]["Max Length"]), ("1", "5"))
+        self.assertEqual(rows["code"]["Mean"], "")
+        self.assertEqual(rows["day"]["Min"], "2024-01-01")
+
+    def test_rows_to_check(self):
+        rows = {row[0]: dict(zip(PROFILE_COLUMNS, row)) for row in self.profile(10)}
+        self.assertEqual(rows["id"]["Max"], "9")
+
+    def test_passes_double(self):
+        self.assertEqual(list(islice(profile_passes(10), 4)), [10, 20, 40, 80])
+
+    def test_estimate_change(self):
+        query = profile_query(self.relation.sql_query(), self.relation.columns, self.relation.types, 10)
+        first = profile_ratios(self.connection.sql(query).fetchone(), self.relation.columns)
+        query = profile_query(self.relation.sql_query(), self.relation.columns, self.relation.types, 20)
+        second = profile_ratios(self.connection.sql(query).fetchone(), self.relation.columns)
+        self.assertIsNone(estimate_change(None, first))
+        self.assertEqual(estimate_change(first, first), 0)
+        # The share of distinct days is the same, but only 5 of the 20 codes are distinct rather than 5 of 10
+        self.assertAlmostEqual(estimate_change(first, second), 0.25)
+
+    def test_format_progress(self):
+        self.assertEqual(format_progress(100, None, None, True), "Profiled all 100 rows")
+        self.assertEqual(
+            format_progress(100, 1000, None, False),
+            "Profiled the first 100 of 1,000 rows (10.00%), the results cover only these rows"
+        )
+        self.assertIn("settled", format_progress(200, None, 0.001, False))
+        self.assertIn("still changing", format_progress(200, None, 0.2, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
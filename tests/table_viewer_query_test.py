@@ -0,0 +1,81 @@
+import unittest
+
+import duckdb
+
+from plugins.table_viewer.query import display_expression, is_truncated, sample_query, search_predicate
+
+
+class TestDisplayExpression(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.relation = self.connection.sql(
+            "SELECT 1 AS number, repeat('x', 50) AS text, {'a': [1, 2, 3]} AS nested, 'abc'::BLOB AS data"
+        )
+
+    def fetch(self, column):
+        column_type = self.relation.types[self.relation.columns.index(column)]
+        return self.relation.project(display_expression(column, column_type, 10)).fetchone()[0]
+
+    def test_scalar_is_not_truncated(self):
+        self.assertEqual(self.fetch("number"), 1)
+
+    def test_text_is_truncated_to_prefix(self):
+        self.assertEqual(self.fetch("text"), "x" * 11)
+
+    def test_nested_is_truncated_to_prefix(self):
+        self.assertEqual(self.fetch("nested"), "{'a': [1, 2")
+
+    def test_blob_shows_size(self):
+        self.assertEqual(self.fetch("data"), "<3 bytes>")
+
+    def test_is_truncated(self):
+        self.assertFalse(is_truncated(self.relation.types[0]))
+        self.assertTrue(all(is_truncated(column_type) for column_type in self.relation.types[1:]))
+
+
+class TestSampleQuery(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.query = "SELECT * FROM range(100000)"
+
+    def test_reservoir_sample_has_exact_size(self):
+        rows = self.connection.sql(sample_query(self.query, 100, 42)).fetchall()
+        self.assertEqual(len(rows), 100)
+
+    def test_sample_is_repeatable(self):
+        first = self.connection.sql(sample_query(self.query, 100, 42)).fetchall()
+        second = self.connection.sql(sample_query(self.query, 100, 42)).fetchall()
+        self.assertEqual(first, second)
+
+    def test_bernoulli_sample_when_total_is_known(self):
+        query = sample_query(self.query, 1000, 42, total_rows=100000)
+        self.assertIn("bernoulli", query)
+        count = self.connection.sql(f"SELECT COUNT(*) FROM ({query})").fetchone()[0]
+        self.assertGreater(count, 500)
+        self.assertLess(count, 1500)
+
+
+class TestSearchPredicate(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.relation = self.connection.sql(
+            "SELECT range AS id, 'name ' || range AS name FROM range(100)"
+        )
+
+    def count(self, column, search, style):
+        column_type = self.relation.types[self.relation.columns.index(column)]
+        return self.relation.filter(search_predicate(column, column_type, search, style)).aggregate("COUNT(*)").fetchone()[0]
+
+    def test_exact_on_typed_column(self):
+        self.assertEqual(self.count("id", "42", "Exact"), 1)
+
+    def test_exact_with_invalid_value_matches_nothing(self):
+        self.assertEqual(self.count("id", "forty-two", "Exact"), 0)
+
+    def test_text_styles(self):
+        self.assertEqual(self.count("name", "name 4", "Starts With"), 11)
+        self.assertEqual(self.count("name", "9", "Ends With"), 10)
+        self.assertEqual(self.count("id", "9", "Contains"), 19)
+
+    def test_quotes_are_escaped(self):
+        self.assertEqual(self.count("name", "it's", "Contains"), 0)
@@ -0,0 +1,65 @@
+import unittest
+
+import duckdb
+
+from plugins.table_viewer.validation import parse_rules, validate, validation_query, violating_rows
+
+
+class TestValidation(unittest.TestCase):
+    def setUp(self):
+        self.connection = duckdb.connect()
+        self.relation = self.connection.sql(
+            "SELECT range AS id, CASE WHEN range % 10 = 0 THEN NULL ELSE 'a' || (range % 3) END AS code, "
+            "range % 4 AS grp FROM range(100)"
+        )
+        self.rules = parse_rules([
+            {"column": "id", "unique": True, "min": 5, "max": 90},
+            {"column": "code", "not_null": True, "regex": "a[01]", "allowed": ["a0", "a2"]},
+            {"name": "group", "column": "grp", "unique": True},
+        ])
+
+    def test_parse_rules(self):
+        self.assertEqual(
+            [rule["name"] for rule in self.rules],
+            ["id unique", "id min", "id max", "code not null", "code regex", "code allowed", "group unique"]
+        )
+        with self.assertRaises(ValueError):
+            parse_rules([{"column": "id", "positive": True}])
+        with self.assertRaises(ValueError):
+            parse_rules([{"not_null": True}])
+        with self.assertRaises(ValueError):
+            parse_rules([{"column": "code", "allowed": "a0"}])
+
+    def test_duplicate_names(self):
+        rules = parse_rules([{"column": "id", "min": 5}, {"column": "id", "min": 10}])
+        self.assertEqual([rule["name"] for rule in rules], ["id min", "id min (2)"])
+        self.assertEqual(validate(self.connection, self.relation, rules)["violations"], {"id min": 5, "id min (2)": 10})
+
+    def test_single_scan(self):
+        self.assertEqual(validation_query(self.relation.sql_query(), self.rules).count("FROM ("), 1)
+
+    def test_violations(self):
+        result = validate(self.connection, self.relation, self.rules + parse_rules([{"column": "nope", "not_null": True}]))
+        self.assertEqual(result["rows"], 100)
+        self.assertEqual(result["violations"], {
+            "id unique": 0, "id min": 5, "id max": 9, "code not null": 10, "code regex": 30, "code allowed": 30,
+            "group unique": 96,
+        })
+        self.assertEqual(result["missing"], ["nope not null"])
+        self.assertEqual(result["invalid"], {})
+
+    def test_invalid_rules(self):
+        rules = parse_rules([
+            {"column": "code", "min": 0, "regex": "("}, {"column": "id", "max": "many"}, {"column": "code", "max": "a1"},
+        ])
+        result = validate(self.connection, self.relation, rules)
+        self.assertEqual(sorted(result["invalid"]), ["code min", "code regex", "id max"])
+        self.assertEqual(result["violations"], {"code max": 30})
+
+    def test_violating_rows(self):
+        counts = [len(violating_rows(self.relation, rule)) for rule in self.rules]
+        self.assertEqual(counts, [0, 5, 9, 10, 30, 30, 100])
+
+
+if __name__ == "__main__":
+    unittest.main()
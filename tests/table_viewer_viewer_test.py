@@ -0,0 +1,29 @@
+import importlib.util
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+
+@unittest.skipUnless(importlib.util.find_spec("wx"), "wxPython is not installed")
+class TestOpenPath(unittest.TestCase):
+    def setUp(self):
+        from plugins.table_viewer.viewer import TableViewer
+
+        self.open_path = TableViewer.open_path.__wrapped__
+        self.first, self.second = SimpleNamespace(path="first.csv"), SimpleNamespace(path="second.csv")
+        self.plugin = SimpleNamespace(
+            tabs=[self.first, self.second], tab=self.first, switch_tab=mock.Mock(return_value=True),
+            save_tab=mock.Mock(side_effect=AssertionError("an open file is opened again")),
+        )
+
+    def test_reopen_active_file(self):
+        self.assertTrue(self.open_path(self.plugin, "first.csv"))
+        self.plugin.switch_tab.assert_not_called()
+
+    def test_reopen_other_file(self):
+        self.assertTrue(self.open_path(self.plugin, "second.csv"))
+        self.plugin.switch_tab.assert_called_once_with(self.second)
+
+
+if __name__ == "__main__":
+    unittest.main()